@@ -3,4 +3,19 @@ Module to provide for command line access but does not perform
 any actions if imported into another Python module.
 """
 
-from pymarkdown.main import PyMarkdownLint  # noqa F401
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pymarkdown.main import PyMarkdownLint  # noqa F401
+
+
+def __getattr__(attribute_name: str) -> Any:
+    # The application is only loaded when it is first needed, so that forwarding
+    # a command to a server does not pay the cost of loading the parser.
+    if attribute_name == "PyMarkdownLint":
+        # pylint: disable=import-outside-toplevel, redefined-outer-name
+        from pymarkdown.main import PyMarkdownLint
+
+        # pylint: enable=import-outside-toplevel, redefined-outer-name
+        return PyMarkdownLint
+    raise AttributeError(f"module {__name__!r} has no attribute {attribute_name!r}")
@@ -3,7 +3,9 @@ Module to provide for "-m pymarkdown" access to the module,
 as if it was run from the console.
 """
 
-from pymarkdown.main import PyMarkdownLint
+import sys
+
+from pymarkdown.server_client import ServerClient
 
 
 def main() -> None:
@@ -11,6 +13,15 @@ def main() -> None:
     Main entry point.  Exposed in this manner so that the setup
     entry_points configuration has something to execute.
     """
+
+    # Forwarding to a server should not pay the cost of loading the parser.
+    ServerClient.forward_if_requested(sys.argv[1:])
+
+    # pylint: disable=import-outside-toplevel
+    from pymarkdown.main import PyMarkdownLint
+
+    # pylint: enable=import-outside-toplevel
+
     PyMarkdownLint().main()
 
 
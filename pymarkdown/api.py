@@ -4,17 +4,23 @@ Create a new instance of the `PyMarkdownApi` class.
 """
 
 import argparse
+import copy
+import itertools
 import os
 import tempfile
-from dataclasses import dataclass
-from typing import Any, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from application_file_scanner import ApplicationFileScanner
 
 from pymarkdown.application_logging import ApplicationLogging
 from pymarkdown.general.main_presentation import MainPresentation
+from pymarkdown.general.session_error import SessionError
 from pymarkdown.main import PyMarkdownLint
+from pymarkdown.parallel_scan_helper import ParallelScanPool
 from pymarkdown.plugin_manager.plugin_scan_failure import PluginScanFailure
+from pymarkdown.plugin_manager.rule_profile import RuleProfile
+from pymarkdown.return_code_helper import ApplicationResult, ExplicitScheme
 
 # pylint: disable=too-many-lines
 
@@ -34,6 +40,7 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
     """
 
     __INTERFACE_VERSION = 1
+    __documents_per_job_in_batch = 128
 
     def __init__(self, inherit_logging: bool = False) -> None:
         """
@@ -53,6 +60,11 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
         self.__set_properties: List[str] = []
         self.__disable_json5_configuration = False
         self.__enable_continue_on_error = False
+        self.__job_count = 1
+        self.__cache_directory: Optional[str] = None
+        self.__max_failures: Optional[int] = None
+        self.__profile_rules = False
+        self.__session_scanner: Optional[_ApiSessionScanner] = None
 
     # pylint: disable=too-many-arguments
     def scan_path(
@@ -115,35 +127,19 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
             any directories under the `./docs` directory.
         """
         self.__verify_string_argument_not_empty("path_to_scan", path_to_scan)
-
-        scan_arguments = self.__build_common_arguments("scan")
-        self.__add_common_scan_arguments(
-            scan_arguments,
+        path_arguments = self.__create_path_arguments(
             path_to_scan,
             recurse_if_directory,
             alternate_extensions,
-            exclude_patterns=exclude_patterns,
-            respect_gitignore=respect_gitignore,
+            exclude_patterns,
+            respect_gitignore,
         )
 
-        this_presentation = _ApiPresentation()
-        scanner_instance = PyMarkdownLint(
-            presentation=this_presentation,
-            show_stack_trace=self.__enable_stack_trace,
-            inherit_logging=self.__inherit_logging,
+        return_code, this_presentation = self.__invoke_scanner(
+            "scan", path_arguments=path_arguments
         )
-        return_code = 0
-        try:
-            scanner_instance.main(scan_arguments)
-        except SystemExit as this_exception:
-            # https://github.com/python/typeshed/issues/8513#issue-1333671093
-            return_code = (
-                int(this_exception.code) if isinstance(this_exception.code, int) else 99
-            )
-            if return_code == 1:
-                raise PyMarkdownApiNoFilesFoundException(
-                    "No matching files found."
-                ) from this_exception
+        if return_code == 1:
+            raise PyMarkdownApiNoFilesFoundException("No matching files found.")
         return self.__handle_scan_results(return_code, this_presentation)
 
     # pylint: enable=too-many-arguments
@@ -183,24 +179,90 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
         """
         self.__verify_string_argument_not_empty("path_to_scan", string_to_scan)
 
-        scan_arguments = self.__build_common_arguments("scan-stdin")
+        return_code, this_presentation = self.__invoke_scanner(
+            "scan-stdin", documents_to_scan=[("in-memory", string_to_scan)]
+        )
+        return self.__handle_scan_results(return_code, this_presentation)
 
-        this_presentation = _ApiPresentation()
-        scanner_instance = PyMarkdownLint(
-            presentation=this_presentation,
-            show_stack_trace=self.__enable_stack_trace,
-            inherit_logging=self.__inherit_logging,
-            string_to_scan=string_to_scan,
+    def scan_strings(
+        self,
+        documents_to_scan: Iterable[Tuple[str, str]],
+    ) -> Iterator["PyMarkdownScanStringsResult"]:
+        """
+        Scan each of the specified strings as a separate Markdown document, yielding
+        the results for each document in the order that the documents were supplied.
+
+        The plugins, extensions, and parser are only initialized once for all the
+        documents, and the documents are never written to disk.  If the `jobs`
+        modifier was used to specify more than one job, the documents are scanned
+        in batches using a pool of worker processes, with the results for each batch
+        being yielded as soon as that batch is finished.  If the `max_failures`
+        modifier was used, no more documents are scanned or yielded once that many
+        scan failures have been found.
+
+        Args:
+            documents_to_scan (Iterable[Tuple[str, str]]): Pairs of a unique identifier
+                for the document and the text of the document.  The identifier is
+                reported as the `scan_file` of any failures within that document.
+
+        Raises:
+            PyMarkdownApiArgumentException: If an element of `documents_to_scan` is not
+                a pair of strings, or if a document identifier is empty or not unique.
+            PyMarkdownApiException: If some other error was found.
+
+        Yields:
+            An instance of `PyMarkdownScanStringsResult` for each document, containing
+                any scan failures or pragma errors encountered when scanning it.
+
+        Examples:
+            This example scans two documents, printing the failures for each one as
+            soon as that document has been scanned.
+
+                from pymarkdown.api import PyMarkdownApi, PyMarkdownApiException
+
+                documents = [("first", "# Markdown\n"), ("second", "#  Markdown\n")]
+
+                try:
+                    for scan_result in PyMarkdownApi().scan_strings(documents):
+                        print(f"{scan_result.document_id}: {scan_result.scan_failures}")
+                except PyMarkdownApiException as this_exception:
+                    print(f"API Exception: {this_exception}", file=sys.stderr)
+        """
+        batch_size = (
+            1
+            if self.__job_count == 1
+            else self.__job_count * self.__documents_per_job_in_batch
         )
-        return_code = 0
+
+        # Every batch is scanned within the same session, reusing the initialized
+        # plugins, extensions, and parser, and handing the documents to the same
+        # worker processes.  If no session is active, one is started for this call.
+        owned_session_scanner = None
+        if not self.__session_scanner:
+            self.__session_scanner = owned_session_scanner = _ApiSessionScanner()
+        remaining_failures = self.__max_failures
         try:
-            scanner_instance.main(scan_arguments)
-        except SystemExit as this_exception:
-            # https://github.com/python/typeshed/issues/8513#issue-1333671093
-            return_code = (
-                int(this_exception.code) if isinstance(this_exception.code, int) else 99
-            )
-        return self.__handle_scan_results(return_code, this_presentation)
+            for next_batch in self.__batch_documents(documents_to_scan, batch_size):
+                return_code, this_presentation = self.__invoke_scanner(
+                    "scan-stdin",
+                    documents_to_scan=next_batch,
+                    remaining_failures=remaining_failures,
+                )
+                for next_result in self.__handle_scan_strings_results(
+                    return_code, this_presentation, next_batch
+                ):
+                    yield next_result
+
+                    # Any documents after the one that used up the failure budget
+                    # were not scanned.
+                    if remaining_failures is not None:
+                        remaining_failures -= len(next_result.scan_failures)
+                        if remaining_failures <= 0:
+                            return
+        finally:
+            if owned_session_scanner:
+                self.__session_scanner = None
+                owned_session_scanner.close()
 
     # pylint: disable=too-many-arguments
     def fix_path(
@@ -252,31 +314,17 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
                     print(f"API Exception: {this_exception}", file=sys.stderr)
         """
         self.__verify_string_argument_not_empty("path_to_scan", path_to_scan)
-
-        scan_arguments = self.__build_common_arguments("fix")
-        self.__add_common_scan_arguments(
-            scan_arguments,
+        path_arguments = self.__create_path_arguments(
             path_to_scan,
             recurse_if_directory,
             alternate_extensions,
-            exclude_patterns=exclude_patterns,
-            respect_gitignore=respect_gitignore,
+            exclude_patterns,
+            respect_gitignore,
         )
 
-        this_presentation = _ApiPresentation()
-        scanner_instance = PyMarkdownLint(
-            presentation=this_presentation,
-            show_stack_trace=self.__enable_stack_trace,
-            inherit_logging=self.__inherit_logging,
+        return_code, this_presentation = self.__invoke_scanner(
+            "fix", path_arguments=path_arguments
         )
-        return_code = 0
-        try:
-            scanner_instance.main(scan_arguments)
-        except SystemExit as this_exception:
-            # https://github.com/python/typeshed/issues/8513#issue-1333671093
-            return_code = (
-                int(this_exception.code) if isinstance(this_exception.code, int) else 99
-            )
         return self.__handle_fix_results(return_code, this_presentation)
 
     # pylint: enable=too-many-arguments
@@ -322,25 +370,10 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
             ) as temp_file:
                 temp_file.write(string_to_scan)
 
-            scan_arguments = self.__build_common_arguments("fix")
-            scan_arguments.append(temp_file.name)
-
-            this_presentation = _ApiPresentation()
-            scanner_instance = PyMarkdownLint(
-                presentation=this_presentation,
-                show_stack_trace=self.__enable_stack_trace,
-                inherit_logging=self.__inherit_logging,
+            return_code, this_presentation = self.__invoke_scanner(
+                "fix",
+                path_arguments=_PathArguments(temp_file.name, False, None, None, False),
             )
-            return_code = 0
-            try:
-                scanner_instance.main(scan_arguments)
-            except SystemExit as this_exception:
-                # https://github.com/python/typeshed/issues/8513#issue-1333671093
-                return_code = (
-                    int(this_exception.code)
-                    if isinstance(this_exception.code, int)
-                    else 99
-                )
             fix_result = self.__handle_fix_results(return_code, this_presentation)
             with open(temp_file.name, "rt", encoding="utf-8") as fixed_file:
                 return PyMarkdownFixStringResult(
@@ -404,28 +437,15 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
 
         scan_arguments = self.__build_common_arguments("scan")
         scan_arguments.append("--list-files")
-        self.__add_common_scan_arguments(
-            scan_arguments,
+        self.__create_path_arguments(
             path_to_scan,
             recurse_if_directory,
             alternate_extensions,
-            exclude_patterns=exclude_patterns,
-            respect_gitignore=respect_gitignore,
-        )
+            exclude_patterns,
+            respect_gitignore,
+        ).add_to_command_line(scan_arguments)
 
-        this_presentation = _ApiPresentation()
-        scanner_instance = PyMarkdownLint(
-            presentation=this_presentation,
-            show_stack_trace=self.__enable_stack_trace,
-            inherit_logging=self.__inherit_logging,
-        )
-        return_code = 0
-        try:
-            scanner_instance.main(scan_arguments)
-        except SystemExit as this_exception:
-            return_code = (
-                int(this_exception.code) if isinstance(this_exception.code, int) else 99
-            )
+        return_code, this_presentation = self.__invoke_main(scan_arguments)
 
         if return_code != 0:
             self.__generate_scan_exception(this_presentation)
@@ -977,6 +997,337 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
         self.__enable_continue_on_error = True
         return self
 
+    def max_failures(self, failure_count: int) -> "PyMarkdownApi":
+        """
+        Stop scanning once the specified number of scan failures have been found.
+        Only that many scan failures are reported, and any files that were not
+        scanned by that point are not scanned.  This modifier does not apply to
+        fixing.
+
+        Args:
+            failure_count (int): Number of scan failures to stop scanning after.
+
+        Raises:
+            PyMarkdownApiArgumentException: If `failure_count` is not a positive integer.
+
+        Returns:
+            An instance of `PyMarkdownApi` to allow for function chaining.
+
+        Examples:
+            This function reports at most ten scan failures for the Markdown files
+            within the `./docs` directory.
+
+                from pymarkdown.api import PyMarkdownApi
+
+                PyMarkdownApi().max_failures(10).scan_path("./docs", recurse_if_directory=True)
+        """
+        if (
+            not isinstance(failure_count, int)
+            or isinstance(failure_count, bool)
+            or failure_count < 1
+        ):
+            raise PyMarkdownApiArgumentException(
+                "failure_count",
+                "Parameter named 'failure_count' must be a positive integer.",
+            )
+
+        self.__max_failures = failure_count
+        return self
+
+    def fail_fast(self) -> "PyMarkdownApi":
+        """
+        Stop scanning once the first scan failure has been found.  Equivalent to
+        calling the `max_failures` function with a value of `1`.
+
+        Returns:
+            An instance of `PyMarkdownApi` to allow for function chaining.
+
+        Examples:
+            This function determines whether all the Markdown files within the
+            `./docs` directory are free of scan failures.
+
+                from pymarkdown.api import PyMarkdownApi
+
+                scan_result = PyMarkdownApi().fail_fast().scan_path(
+                    "./docs", recurse_if_directory=True
+                )
+                print(f"Clean?  {not scan_result.scan_failures}")
+        """
+        return self.max_failures(1)
+
+    def jobs(self, job_count: int) -> "PyMarkdownApi":
+        """
+        Set the number of processes to use when scanning multiple files.  Results
+        are reported in the same order as when scanning with a single process.
+
+        Args:
+            job_count (int): Number of processes to use.  A value of `1` scans
+                the files within the current process.
+
+        Raises:
+            PyMarkdownApiArgumentException: If `job_count` is not a positive integer.
+
+        Returns:
+            An instance of `PyMarkdownApi` to allow for function chaining.
+
+        Examples:
+            This function scans any Markdown files within the `./docs` directory
+            using four processes.
+
+                from pymarkdown.api import PyMarkdownApi
+
+                PyMarkdownApi().jobs(4).scan_path("./docs", recurse_if_directory=True)
+        """
+        if (
+            not isinstance(job_count, int)
+            or isinstance(job_count, bool)
+            or job_count < 1
+        ):
+            raise PyMarkdownApiArgumentException(
+                "job_count",
+                "Parameter named 'job_count' must be a positive integer.",
+            )
+
+        self.__job_count = job_count
+        return self
+
+    def cache_directory(self, cache_directory_path: str) -> "PyMarkdownApi":
+        """
+        Set a directory to cache the results of scanning files in.  Files whose
+        contents and configuration have not changed since the results were
+        cached are not scanned again.
+
+        Args:
+            cache_directory_path (str): Path to the directory to cache results in.
+
+        Raises:
+            PyMarkdownApiArgumentException: If `cache_directory_path` is empty.
+
+        Returns:
+            An instance of `PyMarkdownApi` to allow for function chaining.
+
+        Examples:
+            This function scans any Markdown files within the `./docs` directory,
+            reusing the results of any previous scans that are still valid.
+
+                from pymarkdown.api import PyMarkdownApi
+
+                PyMarkdownApi().cache_directory(".pymarkdown_cache").scan_path(
+                    "./docs", recurse_if_directory=True
+                )
+        """
+        self.__verify_string_argument_not_empty(
+            "cache_directory_path", cache_directory_path
+        )
+
+        self.__cache_directory = cache_directory_path
+        return self
+
+    def profile_rules(self) -> "PyMarkdownApi":
+        """
+        Keep track of the time spent in each of the rule plugins while scanning.
+        The time spent is reported in the `rule_profiles` field of the result.  As
+        the time is only kept for the current process, scanning is not spread over
+        multiple processes while rule plugins are being profiled.
+
+        Returns:
+            An instance of `PyMarkdownApi` to allow for function chaining.
+
+        Examples:
+            This function prints the rule plugin that spent the most time scanning
+            the Markdown files within the `./docs` directory.
+
+                from pymarkdown.api import PyMarkdownApi
+
+                scan_result = PyMarkdownApi().profile_rules().scan_path(
+                    "./docs", recurse_if_directory=True
+                )
+                print(f"Slowest rule:  {scan_result.rule_profiles[0].plugin_id}")
+        """
+        self.__profile_rules = True
+        return self
+
+    def session(self) -> "PyMarkdownApiSession":
+        """
+        Start a session that initializes the plugins, the extensions, and the parser
+        once, and reuses them for every document that is scanned or fixed until the
+        session is closed.  Only the state for each document is reset between calls.
+        The arguments are parsed, and any configuration files loaded, only when the
+        session starts and when the options of this instance are changed.
+
+        Raises:
+            PyMarkdownApiException: If a session is already active for this instance.
+
+        Returns:
+            An instance of `PyMarkdownApiSession` that can be used as a context manager.
+
+        Examples:
+            This function scans two strings as Markdown documents, only initializing
+            the plugins, the extensions, and the parser for the first scan.
+
+                from pymarkdown.api import PyMarkdownApi
+
+                with PyMarkdownApi().session() as scan_session:
+                    first_result = scan_session.scan_string("# Markdown\n")
+                    second_result = scan_session.scan_string("#  Markdown\n")
+        """
+        if self.__session_scanner is not None:
+            raise PyMarkdownApiException("A session is already active.")
+
+        self.__session_scanner = _ApiSessionScanner()
+        return PyMarkdownApiSession(self, self.__close_session)
+
+    def __close_session(self) -> None:
+        if self.__session_scanner:
+            self.__session_scanner.close()
+        self.__session_scanner = None
+
+    def __invoke_scanner(
+        self,
+        action_to_invoke: str,
+        path_arguments: Optional["_PathArguments"] = None,
+        documents_to_scan: Optional[List[Tuple[str, str]]] = None,
+        remaining_failures: Optional[int] = None,
+    ) -> Tuple[int, "_ApiPresentation"]:
+        if self.__session_scanner:
+            return self.__invoke_scanner_in_session(
+                self.__session_scanner,
+                action_to_invoke,
+                path_arguments,
+                documents_to_scan,
+                remaining_failures,
+            )
+
+        scan_arguments = self.__build_common_arguments(
+            action_to_invoke, remaining_failures
+        )
+        if path_arguments:
+            path_arguments.add_to_command_line(scan_arguments)
+        return self.__invoke_main(scan_arguments, documents_to_scan)
+
+    def __invoke_main(
+        self,
+        scan_arguments: List[str],
+        documents_to_scan: Optional[List[Tuple[str, str]]] = None,
+    ) -> Tuple[int, "_ApiPresentation"]:
+        this_presentation = _ApiPresentation()
+        scanner_instance = PyMarkdownLint(
+            presentation=this_presentation,
+            show_stack_trace=self.__enable_stack_trace,
+            inherit_logging=self.__inherit_logging,
+            documents_to_scan=documents_to_scan,
+        )
+        return_code = 0
+        try:
+            scanner_instance.main(scan_arguments)
+        except SystemExit as this_exception:
+            # https://github.com/python/typeshed/issues/8513#issue-1333671093
+            return_code = (
+                int(this_exception.code) if isinstance(this_exception.code, int) else 99
+            )
+        return return_code, this_presentation
+
+    # pylint: disable=too-many-arguments
+    def __invoke_scanner_in_session(
+        self,
+        session_scanner: "_ApiSessionScanner",
+        action_to_invoke: str,
+        path_arguments: Optional["_PathArguments"],
+        documents_to_scan: Optional[List[Tuple[str, str]]],
+        remaining_failures: Optional[int],
+    ) -> Tuple[int, "_ApiPresentation"]:
+        # The scanner is initialized without any action or paths, and only for the
+        # options that can change how it is initialized.  Those are supplied for
+        # each call instead.
+        try:
+            scanner_instance, session_args = session_scanner.get_scanner(
+                self.__build_common_arguments("scan-stdin"),
+                self.__enable_stack_trace,
+                self.__inherit_logging,
+            )
+            args = copy.copy(session_args)
+            args.primary_subparser = action_to_invoke
+            args.max_failures = remaining_failures or session_args.max_failures
+            if path_arguments:
+                path_arguments.apply_to_parsed_arguments(args)
+
+            session_scanner.presentation.reset()
+            application_result = scanner_instance.scan_in_session(
+                args, documents_to_scan
+            )
+        except SessionError:
+            application_result = ApplicationResult.SYSTEM_ERROR
+        return (
+            ExplicitScheme().apply_scheme(application_result),
+            session_scanner.presentation,
+        )
+
+    # pylint: enable=too-many-arguments
+
+    def __handle_scan_strings_results(
+        self,
+        return_code: int,
+        this_presentation: "_ApiPresentation",
+        documents_to_scan: List[Tuple[str, str]],
+    ) -> List["PyMarkdownScanStringsResult"]:
+        assert (
+            not this_presentation.pso
+        ), "should not display for scan_strings, but for ext ops and plugin ops"
+        if return_code != 0 and not self.__enable_continue_on_error:
+            self.__generate_scan_exception(this_presentation)
+
+        failures_by_document: Dict[str, List[PyMarkdownScanFailure]] = {}
+        for next_failure in this_presentation.scan_failures:
+            failures_by_document.setdefault(next_failure.scan_file, []).append(
+                next_failure
+            )
+        pragma_errors_by_document: Dict[str, List[PyMarkdownPragmaError]] = {}
+        for next_error in this_presentation.pragma_errors:
+            pragma_errors_by_document.setdefault(next_error.file_path, []).append(
+                next_error
+            )
+        return [
+            PyMarkdownScanStringsResult(
+                document_id,
+                failures_by_document.get(document_id, []),
+                pragma_errors_by_document.get(document_id, []),
+                this_presentation.scan_errors_by_file.get(document_id, []),
+            )
+            for document_id, _ in documents_to_scan
+        ]
+
+    def __batch_documents(
+        self, documents_to_scan: Iterable[Tuple[str, str]], batch_size: int
+    ) -> Iterator[List[Tuple[str, str]]]:
+        document_ids: Set[str] = set()
+        document_iterator = iter(documents_to_scan)
+        while next_batch := list(itertools.islice(document_iterator, batch_size)):
+            for next_document in next_batch:
+                self.__verify_document_argument(next_document, document_ids)
+            yield next_batch
+
+    def __verify_document_argument(
+        self, document_to_scan: Tuple[str, str], document_ids: Set[str]
+    ) -> None:
+        if (
+            not isinstance(document_to_scan, tuple)
+            or len(document_to_scan) != 2
+            or not isinstance(document_to_scan[0], str)
+            or not isinstance(document_to_scan[1], str)
+        ):
+            raise PyMarkdownApiArgumentException(
+                "documents_to_scan",
+                "Parameter named 'documents_to_scan' must only contain pairs of strings.",
+            )
+        document_id = document_to_scan[0]
+        self.__verify_string_argument_not_empty("document_id", document_id)
+        if document_id in document_ids:
+            raise PyMarkdownApiArgumentException(
+                "document_id",
+                f"Document identifier '{document_id}' was used more than once.",
+            )
+        document_ids.add(document_id)
+
     def __handle_scan_results(
         self, return_code: int, this_presentation: "_ApiPresentation"
     ) -> "PyMarkdownScanPathResult":
@@ -989,6 +1340,7 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
             this_presentation.scan_failures,
             this_presentation.pragma_errors,
             this_presentation.pse,
+            this_presentation.rule_profiles,
         )
 
     def __handle_fix_results(
@@ -1009,36 +1361,31 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
         raise PyMarkdownApiException(this_presentation.pse[-1].strip("\n"))
 
     # pylint: disable=too-many-arguments
-    def __add_common_scan_arguments(
+    def __create_path_arguments(
         self,
-        scan_arguments: List[str],
         path_to_scan: str,
         recurse_if_directory: bool,
         alternate_extensions: Optional[str],
-        exclude_patterns: Optional[List[str]] = None,
-        respect_gitignore: bool = False,
-    ) -> None:
-        if recurse_if_directory:
-            scan_arguments.append("--recurse")
-
-        if respect_gitignore:
-            scan_arguments.append("--respect-gitignore")
-
+        exclude_patterns: Optional[List[str]],
+        respect_gitignore: bool,
+    ) -> "_PathArguments":
         if alternate_extensions:
             self.__verify_string_argument_alternate_extensions(
                 "alternate_extensions", alternate_extensions
             )
-            scan_arguments.extend(("-ae", alternate_extensions))
-
-        if exclude_patterns:
-            for next_pattern in exclude_patterns:
-                scan_arguments.extend(("--exclude", next_pattern))
-
-        scan_arguments.append(path_to_scan)
+        return _PathArguments(
+            path_to_scan,
+            recurse_if_directory,
+            alternate_extensions,
+            exclude_patterns,
+            respect_gitignore,
+        )
 
     # pylint: enable=too-many-arguments
 
-    def __build_common_arguments(self, action_to_invoke: str) -> List[str]:
+    def __build_common_arguments(
+        self, action_to_invoke: str, remaining_failures: Optional[int] = None
+    ) -> List[str]:
 
         # Note: `--return-code-scheme` is not included as a configurable option
         #       as the api requires explicit information about what happened.
@@ -1052,6 +1399,7 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
             common_arguments.append("--stack-trace")
         if self.__enable_strict_configuration:
             common_arguments.append("--strict-config")
+        self.__add_performance_arguments(common_arguments, remaining_failures)
 
         if not self.__inherit_logging:
             if self.__log_file_path:
@@ -1085,6 +1433,18 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
         common_arguments.append(action_to_invoke)
         return common_arguments
 
+    def __add_performance_arguments(
+        self, common_arguments: List[str], remaining_failures: Optional[int]
+    ) -> None:
+        if max_failures := remaining_failures or self.__max_failures:
+            common_arguments.extend(("--max-failures", str(max_failures)))
+        if self.__job_count > 1:
+            common_arguments.extend(("--jobs", str(self.__job_count)))
+        if self.__cache_directory:
+            common_arguments.extend(("--cache-dir", self.__cache_directory))
+        if self.__profile_rules:
+            common_arguments.append("--x-profile-rules")
+
     def __verify_string_argument_not_empty(
         self, argument_name: str, string_to_validate: str
     ) -> None:
@@ -1111,6 +1471,125 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
 # pylint: enable=too-many-instance-attributes,too-many-public-methods
 
 
+class PyMarkdownApiSession:  # docvet: ignore[missing-examples]
+    """
+    Session, started with the `PyMarkdownApi.session` function, that reuses the
+    initialized plugins, extensions, and parser for every document that it scans
+    or fixes.
+
+    Any changes to the configuration of the `PyMarkdownApi` instance that started
+    the session are honored, initializing the plugins, the extensions, and the parser
+    again only if they are affected by that change.
+
+    Args:
+        api: Instance of `PyMarkdownApi` that started the session.
+        close_session: Function to call when the session is closed.
+    """
+
+    def __init__(self, api: PyMarkdownApi, close_session: Callable[[], None]) -> None:
+        """
+        Initialize a new instance of the PyMarkdownApiSession class.
+        """
+        self.__api = api
+        self.__close_session = close_session
+        self.__is_closed = False
+
+    def __enter__(self) -> "PyMarkdownApiSession":
+        """
+        Enter the context of the session.
+        """
+        return self
+
+    def __exit__(self, *exception_information: Any) -> None:
+        """
+        Exit the context of the session, closing it.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the session, releasing the initialized plugins, extensions, and parser.
+        """
+        if not self.__is_closed:
+            self.__is_closed = True
+            self.__close_session()
+
+    # pylint: disable=too-many-arguments
+    def scan_path(
+        self,
+        path_to_scan: str,
+        recurse_if_directory: bool = False,
+        alternate_extensions: Optional[str] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        respect_gitignore: bool = False,
+    ) -> "PyMarkdownScanPathResult":
+        """
+        Scan any eligible Markdown files found on the provided path.  Equivalent to
+        the `PyMarkdownApi.scan_path` function.
+        """
+        self.__verify_not_closed()
+        return self.__api.scan_path(
+            path_to_scan,
+            recurse_if_directory=recurse_if_directory,
+            alternate_extensions=alternate_extensions,
+            exclude_patterns=exclude_patterns,
+            respect_gitignore=respect_gitignore,
+        )
+
+    def fix_path(
+        self,
+        path_to_scan: str,
+        recurse_if_directory: bool = False,
+        alternate_extensions: Any = None,
+        exclude_patterns: Optional[List[str]] = None,
+        respect_gitignore: bool = False,
+    ) -> "PyMarkdownFixResult":
+        """
+        Fix any eligible Markdown files found on the provided path.  Equivalent to
+        the `PyMarkdownApi.fix_path` function.
+        """
+        self.__verify_not_closed()
+        return self.__api.fix_path(
+            path_to_scan,
+            recurse_if_directory=recurse_if_directory,
+            alternate_extensions=alternate_extensions,
+            exclude_patterns=exclude_patterns,
+            respect_gitignore=respect_gitignore,
+        )
+
+    # pylint: enable=too-many-arguments
+
+    def scan_string(self, string_to_scan: str) -> "PyMarkdownScanPathResult":
+        """
+        Scan the specified string as a Markdown document.  Equivalent to the
+        `PyMarkdownApi.scan_string` function.
+        """
+        self.__verify_not_closed()
+        return self.__api.scan_string(string_to_scan)
+
+    def scan_strings(
+        self, documents_to_scan: Iterable[Tuple[str, str]]
+    ) -> Iterator["PyMarkdownScanStringsResult"]:
+        """
+        Scan each of the specified strings as a separate Markdown document.
+        Equivalent to the `PyMarkdownApi.scan_strings` function.
+        """
+        self.__verify_not_closed()
+        return self.__api.scan_strings(documents_to_scan)
+
+    def fix_string(self, string_to_scan: str) -> "PyMarkdownFixStringResult":
+        """
+        Scan the specified string as a Markdown document and apply any eligible
+        fixes.  Equivalent to the `PyMarkdownApi.fix_string` function.
+        """
+        self.__verify_not_closed()
+        return self.__api.fix_string(string_to_scan)
+
+    def __verify_not_closed(self) -> None:
+        if self.__is_closed:
+            raise PyMarkdownApiException("The session has already been closed.")
+
+
 @dataclass(frozen=True)
 class PyMarkdownScanFailure:  # docvet: ignore[missing-examples]
     """
@@ -1229,6 +1708,72 @@ class PyMarkdownScanPathResult:  # docvet: ignore[missing-examples]
     set if `enable_continue_on_error` was set when the `scan_path` or `scan_string`
     function was invoked.  If no critical errors were encountered, this list is empty.
     """
+    rule_profiles: List["PyMarkdownRuleProfile"] = field(default_factory=list)
+    """
+    List of the time spent in each callback of the rule plugins, from the most
+    time spent to the least.  Only set if `profile_rules` was set when the
+    `scan_path` or `scan_string` function was invoked.
+    """
+
+
+@dataclass(frozen=True)
+class PyMarkdownRuleProfile:  # docvet: ignore[missing-examples]
+    """
+    Class to contain the time spent in one of the callbacks of a rule plugin.
+
+    Attributes:
+        plugin_id (str): ID of the rule plugin.
+        callback_name (str): Name of the callback, such as `next_token`.
+        call_count (int): Number of times that the callback was called.
+        total_nanoseconds (int): Total time spent in the callback.
+        slowest_file (Optional[str]): File that the callback spent the most time on.
+        slowest_file_nanoseconds (int): Time spent in the callback for that file.
+    """
+
+    plugin_id: str
+    """ID of the rule plugin."""
+    callback_name: str
+    """Name of the callback, such as `next_token`."""
+    call_count: int
+    """Number of times that the callback was called."""
+    total_nanoseconds: int
+    """Total time spent in the callback, in nanoseconds."""
+    slowest_file: Optional[str]
+    """File that the callback spent the most time on."""
+    slowest_file_nanoseconds: int
+    """Time spent in the callback for the slowest file, in nanoseconds."""
+
+
+@dataclass(frozen=True)
+class PyMarkdownScanStringsResult:  # docvet: ignore[missing-examples]
+    """
+    Result for each document scanned by the `scan_strings` function.
+
+    Attributes:
+        document_id (str): Identifier that was supplied with the document.
+        scan_failures (List[PyMarkdownScanFailure]): Zero or more `PyMarkdownScanFailure` objects.
+        pragma_errors (List[PyMarkdownPragmaError]): Zero or more `PyMarkdownPragmaError` objects.
+        critical_errors (List[str]): Zero or more critical errors encountered scanning the document.
+    """
+
+    document_id: str
+    """
+    Identifier that was supplied with the document.
+    """
+    scan_failures: List[PyMarkdownScanFailure]
+    """
+    List of zero or more `PyMarkdownScanFailure` objects.
+    """
+    pragma_errors: List[PyMarkdownPragmaError]
+    """
+    List of zero or more `PyMarkdownPragmaError` objects.
+    """
+    critical_errors: List[str]
+    """
+    List of zero or more critical errors that were encountered when scanning the
+    document. Only set if `enable_continue_on_error` was set when the `scan_strings`
+    function was invoked.
+    """
 
 
 @dataclass(frozen=True)
@@ -1386,6 +1931,108 @@ class PyMarkdownApiNoFilesFoundException(  # docvet: ignore[missing-examples]
     """
 
 
+@dataclass(frozen=True)
+class _PathArguments:  # docvet: ignore[missing-examples]
+    """
+    Class to hold the arguments that select the files to scan on a path.
+    """
+
+    path_to_scan: str
+    recurse_if_directory: bool
+    alternate_extensions: Optional[str]
+    exclude_patterns: Optional[List[str]]
+    respect_gitignore: bool
+
+    def add_to_command_line(self, scan_arguments: List[str]) -> None:
+        """
+        Add the arguments to the command line arguments for the scan.
+        """
+        if self.recurse_if_directory:
+            scan_arguments.append("--recurse")
+        if self.respect_gitignore:
+            scan_arguments.append("--respect-gitignore")
+        if self.alternate_extensions:
+            scan_arguments.extend(("-ae", self.alternate_extensions))
+        for next_pattern in self.exclude_patterns or []:
+            scan_arguments.extend(("--exclude", next_pattern))
+        scan_arguments.append(self.path_to_scan)
+
+    def apply_to_parsed_arguments(self, args: argparse.Namespace) -> None:
+        """
+        Apply the arguments to already parsed arguments, as if they had been
+        added to the command line arguments for the scan.
+        """
+        args.paths = [self.path_to_scan]
+        args.list_files = False
+        args.recurse_directories = self.recurse_if_directory
+        args.respect_gitignore = self.respect_gitignore
+        args.alternate_extensions = self.alternate_extensions or ".md"
+        # The exclusions are extended with any configured exclusions, so the
+        # caller's list is copied.
+        args.path_exclusions = (
+            list(self.exclude_patterns) if self.exclude_patterns else None
+        )
+
+
+class _ApiSessionScanner:  # docvet: ignore[missing-examples]
+    """
+    Class to keep the scanner used by a session, initialized once for the options
+    that the session is used with, along with the presentation that the scanner
+    reports to and the worker processes that it scans with.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize a new instance of the _ApiSessionScanner class.
+        """
+        self.presentation = _ApiPresentation()
+        self.__scan_pool = ParallelScanPool()
+        self.__scanner: Optional[
+            Tuple[List[str], PyMarkdownLint, argparse.Namespace]
+        ] = None
+
+    def get_scanner(
+        self,
+        session_arguments: List[str],
+        show_stack_trace: bool,
+        inherit_logging: bool,
+    ) -> Tuple[PyMarkdownLint, argparse.Namespace]:
+        """
+        Get the scanner and its parsed arguments, initializing the scanner again
+        only if the options that it was initialized with have changed.
+        """
+        if self.__scanner and self.__scanner[0] == session_arguments:
+            return self.__scanner[1], self.__scanner[2]
+
+        self.__close_scanner()
+        self.presentation.reset()
+        scanner_instance = PyMarkdownLint(
+            presentation=self.presentation,
+            show_stack_trace=show_stack_trace,
+            inherit_logging=inherit_logging,
+            scan_pool=self.__scan_pool,
+        )
+        try:
+            session_args = scanner_instance.initialize_session(session_arguments)
+        except SessionError:
+            scanner_instance.close_session()
+            raise
+        self.__scanner = (session_arguments, scanner_instance, session_args)
+        return scanner_instance, session_args
+
+    def close(self) -> None:
+        """
+        Close the scanner, and shut down any worker processes that it started.
+        """
+        self.__close_scanner()
+        self.__scan_pool.shutdown()
+
+    def __close_scanner(self) -> None:
+        if self.__scanner:
+            self.__scanner[1].close_session()
+            self.__scanner = None
+
+
 class _ApiPresentation(MainPresentation):  # docvet: ignore[missing-examples]
     """
     Class to provide for the output of the PyMarkdown application.
@@ -1396,6 +2043,8 @@ class _ApiPresentation(MainPresentation):  # docvet: ignore[missing-examples]
         pragma_errors (List[PyMarkdownPragmaError]): List of errors encountered parsing pragmas.
         scan_failures (List[PyMarkdownScanFailure]): List of rule failures encountered during the scan.
         files_fixed (List[str]): List of files fixed.
+        scan_errors_by_file (Dict[str, List[str]]): Errors encountered scanning each file.
+        rule_profiles (List[PyMarkdownRuleProfile]): Time spent in each rule plugin.
     """
 
     def __init__(self) -> None:
@@ -1407,6 +2056,18 @@ class _ApiPresentation(MainPresentation):  # docvet: ignore[missing-examples]
         self.pragma_errors: List[PyMarkdownPragmaError] = []
         self.scan_failures: List[PyMarkdownScanFailure] = []
         self.files_fixed: List[str] = []
+        self.scan_errors_by_file: Dict[str, List[str]] = {}
+        self.rule_profiles: List[PyMarkdownRuleProfile] = []
+
+    def reset(self) -> None:
+        """
+        Reset the collected output, so that the presentation can be used again.
+        New lists are created, as the old lists are part of returned results.
+        """
+        self.pso, self.pse = [], []
+        self.pragma_errors, self.scan_failures, self.files_fixed = [], [], []
+        self.scan_errors_by_file = {}
+        self.rule_profiles = []
 
     def print_system_output(self, output_string: str) -> None:
         """
@@ -1414,25 +2075,34 @@ class _ApiPresentation(MainPresentation):  # docvet: ignore[missing-examples]
         """
         self.pso.append(output_string)
 
+    def print_system_output_text(self, output_text: str) -> None:
+        """
+        Root function to output text to standard out exactly as it is supplied.
+        """
+        self.pso.append(output_text)
+
     def print_system_error(self, error_string: str) -> None:
         """
         Root function to output to standard error.
         """
         self.pse.append(error_string)
 
-    # def format_scan_error(
-    #     self,
-    #     next_file: str,
-    #     this_exception: Exception,
-    #     show_extended_information: bool = False,
-    # ) -> Optional[str]:
-    #     """
-    #     Format a scan error for display.  Returning a value of None means that
-    #     the function has handled any required output.
-    #     """
-    #     return super().format_scan_error(
-    #         next_file, this_exception, show_extended_information
-    #     )
+    def format_scan_error(
+        self,
+        next_file: str,
+        this_exception: Exception,
+        show_extended_information: bool = False,
+        allow_shortcut: bool = False,
+    ) -> Optional[str]:
+        """
+        Format a scan error for display, keeping track of the file that it was for.
+        """
+        formatted_error = super().format_scan_error(
+            next_file, this_exception, show_extended_information, allow_shortcut
+        )
+        if formatted_error:
+            self.scan_errors_by_file.setdefault(next_file, []).append(formatted_error)
+        return formatted_error
 
     def print_pragma_failure(
         self, scan_file: str, line_number: int, pragma_error: str
@@ -1464,3 +2134,22 @@ class _ApiPresentation(MainPresentation):  # docvet: ignore[missing-examples]
         Print a message indicating that a given file has been fixed.
         """
         self.files_fixed.append(file_fixed)
+
+    def print_rule_profiles(
+        self, rule_profiles: List[RuleProfile], output_format: str
+    ) -> None:
+        """
+        Keep the time spent in each callback of the rule plugins.
+        """
+        _ = output_format
+        self.rule_profiles = [
+            PyMarkdownRuleProfile(
+                plugin_id=next_profile.plugin_id,
+                callback_name=next_profile.callback_name,
+                call_count=next_profile.call_count,
+                total_nanoseconds=next_profile.total_nanoseconds,
+                slowest_file=next_profile.slowest_file,
+                slowest_file_nanoseconds=next_profile.slowest_file_nanoseconds,
+            )
+            for next_profile in rule_profiles
+        ]
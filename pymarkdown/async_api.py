@@ -0,0 +1,319 @@
+"""
+Module to provide for an asyncio-native interface to the `PyMarkdownApi` class.
+"""
+
+import asyncio
+import functools
+import threading
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Deque, List, Optional, Tuple, Union, cast
+
+from pymarkdown.api import (
+    PyMarkdownApi,
+    PyMarkdownApiArgumentException,
+    PyMarkdownApiException,
+    PyMarkdownApiSession,
+    PyMarkdownFixStringResult,
+    PyMarkdownScanPathResult,
+)
+
+_API_LOCK = threading.Lock()
+
+
+def _invoke_api(
+    api: Union[PyMarkdownApi, PyMarkdownApiSession],
+    function_name: str,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """
+    Invoke a function of the api within an executor.  As the application keeps
+    some state for the entire process, such as the return code and the logging
+    configuration, only one function is invoked within any process at a time.
+    Each worker of a process pool is its own process, so this only makes calls
+    that share a thread pool wait for each other.
+    """
+    with _API_LOCK:
+        return getattr(api, function_name)(*args, **kwargs)
+
+
+class AsyncPyMarkdownApi:  # docvet: ignore[missing-examples]
+    """
+    Module to provide for an asyncio-native interface to PyMarkdown, running each
+    scan or fix within an executor so that the event loop is never blocked.
+
+    Unless another executor is supplied, the scans and fixes are run in a pool of
+    worker processes that is created when it is first needed, and shut down when
+    the instance is closed.  If a thread pool executor is supplied, scans and
+    fixes are run one at a time, as the application keeps some state for the
+    entire process.
+
+    A timeout stops waiting for a call, and cancels the call if it has not
+    started.  A call that has already started cannot be interrupted, and keeps
+    running in its worker until it is finished.  With a thread pool executor,
+    that call also delays every call after it, so a timeout is only advisory.
+
+    Args:
+        api: Instance of `PyMarkdownApi` to use, already configured with any
+            modifiers.  If None, a new instance is created.
+        executor: Executor to run the scans and fixes in.  If None, a pool of
+            worker processes owned by this instance is used.
+        max_pending_calls: Number of files that the `iterate_scan_path` function
+            submits to the executor ahead of the file whose results are next.
+    """
+
+    def __init__(
+        self,
+        api: Optional[PyMarkdownApi] = None,
+        executor: Optional[Executor] = None,
+        max_pending_calls: int = 1,
+    ) -> None:
+        """
+        Initialize a new instance of the AsyncPyMarkdownApi class.
+        """
+        if (
+            not isinstance(max_pending_calls, int)
+            or isinstance(max_pending_calls, bool)
+            or max_pending_calls < 1
+        ):
+            raise PyMarkdownApiArgumentException(
+                "max_pending_calls",
+                "Parameter named 'max_pending_calls' must be a positive integer.",
+            )
+        self.__api = api or PyMarkdownApi()
+        self.__executor = executor
+        self.__owned_executor: Optional[ProcessPoolExecutor] = None
+        self.__uses_processes = executor is None or isinstance(
+            executor, ProcessPoolExecutor
+        )
+        self.__max_pending_calls = max_pending_calls
+
+    def __enter__(self) -> "AsyncPyMarkdownApi":
+        """
+        Enter the context of the instance.
+        """
+        return self
+
+    def __exit__(self, *exception_information: Any) -> None:
+        """
+        Exit the context of the instance, closing it.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down the pool of worker processes owned by this instance, if it was
+        created.  Any executor that was supplied is left for its owner to shut down.
+        """
+        if self.__owned_executor:
+            self.__owned_executor.shutdown(wait=True, cancel_futures=True)
+            self.__owned_executor = None
+
+    @property
+    def api(self) -> PyMarkdownApi:
+        """
+        Instance of `PyMarkdownApi` that is used to scan and fix, allowing any of
+        its modifiers to be applied.
+        """
+        return self.__api
+
+    # pylint: disable=too-many-arguments
+    async def scan_path(
+        self,
+        path_to_scan: str,
+        recurse_if_directory: bool = False,
+        alternate_extensions: Optional[str] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        respect_gitignore: bool = False,
+        timeout: Optional[float] = None,
+    ) -> PyMarkdownScanPathResult:
+        """
+        Scan any eligible Markdown files found on the provided path.  Equivalent to
+        the `PyMarkdownApi.scan_path` function.
+
+        Args:
+            timeout (float, optional): Number of seconds to wait for the scan to
+                complete before raising `asyncio.TimeoutError`.
+
+        Examples:
+            This example scans the `./docs` directory without blocking the event loop.
+
+                from pymarkdown.async_api import AsyncPyMarkdownApi
+
+                scan_result = await AsyncPyMarkdownApi().scan_path(
+                    "./docs", recurse_if_directory=True, timeout=60
+                )
+        """
+        return cast(
+            PyMarkdownScanPathResult,
+            await self.__invoke(
+                timeout,
+                "scan_path",
+                path_to_scan,
+                recurse_if_directory=recurse_if_directory,
+                alternate_extensions=alternate_extensions,
+                exclude_patterns=exclude_patterns,
+                respect_gitignore=respect_gitignore,
+            ),
+        )
+
+    async def iterate_scan_path(
+        self,
+        path_to_scan: str,
+        recurse_if_directory: bool = False,
+        alternate_extensions: Optional[str] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        respect_gitignore: bool = False,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[str, PyMarkdownScanPathResult]]:
+        """
+        Scan any eligible Markdown files found on the provided path, yielding the
+        name of each file and the results of scanning it as soon as that file has
+        been scanned.  The files are yielded in the same order that the `list_path`
+        function returns them in.  Unless a process pool executor is used, the
+        files are scanned within a session, initializing the plugins only once.
+
+        Args:
+            timeout (float, optional): Number of seconds to wait for each file to
+                be scanned before raising `asyncio.TimeoutError`.
+
+        Examples:
+            This example prints the failures for each file in the `./docs` directory
+            as soon as that file is scanned.
+
+                from pymarkdown.async_api import AsyncPyMarkdownApi
+
+                async for scanned_file, scan_result in AsyncPyMarkdownApi().iterate_scan_path(
+                    "./docs", recurse_if_directory=True
+                ):
+                    print(f"{scanned_file}: {scan_result.scan_failures}")
+        """
+        list_result = await self.__invoke(
+            timeout,
+            "list_path",
+            path_to_scan,
+            recurse_if_directory=recurse_if_directory,
+            alternate_extensions=alternate_extensions or "",
+            exclude_patterns=exclude_patterns,
+            respect_gitignore=respect_gitignore,
+        )
+        files_to_scan = iter(list_result.matching_files)
+
+        scan_session = await self.__start_session(timeout)
+        pending_scans: Deque[Tuple[str, "asyncio.Future[Any]"]] = deque()
+        try:
+            while True:
+                while len(pending_scans) < self.__max_pending_calls and (
+                    next_file := next(files_to_scan, None)
+                ):
+                    pending_scans.append(
+                        (
+                            next_file,
+                            asyncio.ensure_future(
+                                self.__invoke_on(
+                                    scan_session or self.__api,
+                                    timeout,
+                                    "scan_path",
+                                    next_file,
+                                    alternate_extensions=alternate_extensions,
+                                )
+                            ),
+                        )
+                    )
+                if not pending_scans:
+                    break
+                next_file, next_scan = pending_scans.popleft()
+                yield next_file, await next_scan
+        finally:
+            for _, next_scan in pending_scans:
+                next_scan.cancel()
+            if scan_session:
+                # A scan that has already started is allowed to finish, so the
+                # session is closed after it instead of waiting for it here.
+                asyncio.get_running_loop().run_in_executor(
+                    self.__get_executor(),
+                    functools.partial(_invoke_api, scan_session, "close"),
+                )
+
+    # pylint: enable=too-many-arguments
+
+    async def scan_string(
+        self, string_to_scan: str, timeout: Optional[float] = None
+    ) -> PyMarkdownScanPathResult:
+        """
+        Scan the specified string as a Markdown document.  Equivalent to the
+        `PyMarkdownApi.scan_string` function.
+
+        Args:
+            timeout (float, optional): Number of seconds to wait for the scan to
+                complete before raising `asyncio.TimeoutError`.
+        """
+        return cast(
+            PyMarkdownScanPathResult,
+            await self.__invoke(timeout, "scan_string", string_to_scan),
+        )
+
+    async def fix_string(
+        self, string_to_scan: str, timeout: Optional[float] = None
+    ) -> PyMarkdownFixStringResult:
+        """
+        Scan the specified string as a Markdown document and apply any eligible
+        fixes.  Equivalent to the `PyMarkdownApi.fix_string` function.
+
+        Args:
+            timeout (float, optional): Number of seconds to wait for the fix to
+                complete before raising `asyncio.TimeoutError`.
+        """
+        return cast(
+            PyMarkdownFixStringResult,
+            await self.__invoke(timeout, "fix_string", string_to_scan),
+        )
+
+    async def __start_session(
+        self, timeout: Optional[float]
+    ) -> Optional[PyMarkdownApiSession]:
+        # Each call to a process pool executor works on its own copy of the api, so
+        # there is no session that can be shared between those calls.  If a session
+        # is already active, it already reuses the plugins.
+        if self.__uses_processes:
+            return None
+        try:
+            return cast(PyMarkdownApiSession, await self.__invoke(timeout, "session"))
+        except PyMarkdownApiException:
+            return None
+
+    async def __invoke(
+        self,
+        timeout: Optional[float],
+        function_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        return await self.__invoke_on(
+            self.__api, timeout, function_name, *args, **kwargs
+        )
+
+    async def __invoke_on(
+        self,
+        api: Union[PyMarkdownApi, PyMarkdownApiSession],
+        timeout: Optional[float],
+        function_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        # Cancelling the returned future, including through a timeout, cancels the
+        # call if it has not started.  A call that has started cannot be
+        # interrupted, and is allowed to finish in the background.
+        api_future = asyncio.get_running_loop().run_in_executor(
+            self.__get_executor(),
+            functools.partial(_invoke_api, api, function_name, *args, **kwargs),
+        )
+        return await asyncio.wait_for(api_future, timeout)
+
+    def __get_executor(self) -> Executor:
+        if self.__executor:
+            return self.__executor
+        if not self.__owned_executor:
+            self.__owned_executor = ProcessPoolExecutor()
+        return self.__owned_executor
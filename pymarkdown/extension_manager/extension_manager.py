@@ -169,6 +169,16 @@ class ExtensionManager:
         """
         return self.__extension_objects[extension_id]
 
+    @property
+    def enabled_extensions(self) -> List[ExtensionDetails]:
+        """
+        Get the details of the extensions that are currently enabled.
+        """
+        return [
+            self.__extension_details[next_extension_id]
+            for next_extension_id in self.__enabled_extensions
+        ]
+
     @property
     def is_front_matter_enabled(self) -> bool:
         """
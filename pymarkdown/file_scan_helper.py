@@ -24,15 +24,23 @@ from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.parser_logger import ParserLogger
 from pymarkdown.general.source_providers import FileSourceProvider
 from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+from pymarkdown.parallel_scan_helper import (
+    FileToScan,
+    ParallelScanHelper,
+    ParallelScanPool,
+    RecordedResults,
+)
 from pymarkdown.plugin_manager.bad_plugin_error import BadPluginError
 from pymarkdown.plugin_manager.bad_plugin_fix_error import BadPluginFixError
 from pymarkdown.plugin_manager.fix_line_record import FixLineRecord
 from pymarkdown.plugin_manager.fix_token_record import FixTokenRecord
 from pymarkdown.plugin_manager.found_plugin import FoundPlugin
+from pymarkdown.plugin_manager.line_facts import LineFacts
 from pymarkdown.plugin_manager.plugin_manager import PluginManager
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.replace_tokens_record import ReplaceTokensRecord
 from pymarkdown.return_code_helper import ApplicationResult, ReturnCodeHelper
+from pymarkdown.scan_result_cache import ScanResultCache
 from pymarkdown.tokens.markdown_token import MarkdownToken
 from pymarkdown.transform_markdown.transform_to_markdown import TransformToMarkdown
 
@@ -51,6 +59,7 @@ class FileScanHelper:
     __normal_scan_subcommand = "scan"
     __stdin_scan_subcommand = "scan-stdin"
     __normal_fix_subcommand = "fix"
+    __stdin_fix_subcommand = "fix-stdin"
 
     # pylint: disable=too-many-arguments
     def __init__(
@@ -61,6 +70,8 @@ class FileScanHelper:
         show_stack_trace: bool,
         handle_error: Callable[[str, Optional[Exception], bool, str], None],
         properties: ApplicationProperties,
+        scan_cache: Optional[ScanResultCache] = None,
+        scan_pool: Optional[ParallelScanPool] = None,
     ):
         """
         Initialize a new instance of the FileScanHelper class.
@@ -73,6 +84,8 @@ class FileScanHelper:
         self.__continue_on_error = False
         self.__properties = properties
         self.__per_file_ignores_list: List[Tuple[Parser, Set[str]]] = []
+        self.__scan_cache = scan_cache
+        self.__scan_pool = scan_pool
 
     # pylint: enable=too-many-arguments
 
@@ -81,29 +94,43 @@ class FileScanHelper:
         args: argparse.Namespace,
         use_standard_in: bool,
         files_to_scan: List[str],
-        string_to_scan: Optional[str],
+        documents_to_scan: Optional[List[Tuple[str, str]]],
     ) -> Tuple[bool, bool, bool]:
         """
-        Process the specified files to scan, or the string to scan.
+        Process the specified files to scan, or the in-memory documents to scan.
+        Each in-memory document is a pair of the name to report it as and its text.
         """
 
         self.__continue_on_error = args.continue_on_error
         in_fix_mode = args.primary_subparser == FileScanHelper.__normal_fix_subcommand
 
+        # Fixing a file requires every pass to complete, so the failure budget only
+        # applies to scanning.
+        self.__plugins.set_failure_budget(
+            None
+            if in_fix_mode
+            or args.primary_subparser == FileScanHelper.__stdin_fix_subcommand
+            else args.max_failures
+        )
+
         # sourcery skip: raise-specific-error
         did_fix_any_file = False
         did_fail_any_file = False
         if use_standard_in:
-            assert not in_fix_mode, "Standard-in cannot be used with fix mode."
-            POGGER.debug("Scanning from: (stdin)")
-            self.__scan_from_stdin(args, string_to_scan)
+            return self.__process_standard_in(args, documents_to_scan)
+        if not in_fix_mode and self.__use_parallel_scan(args, len(files_to_scan)):
+            self.__process_per_file_ignores()
 
+            POGGER.debug("Scanning from: $ using $ jobs", files_to_scan, args.jobs)
+            did_fail_any_file = self.__scan_files_in_parallel(args, files_to_scan)
         else:
             self.__process_per_file_ignores()
 
             POGGER.debug("Scanning from: $", files_to_scan)
             is_first_file = True
             for next_file in files_to_scan:
+                if self.__is_failure_budget_reached():
+                    break
                 per_file_disabled_identifiers = (
                     self.__check_file_name_against_per_file_disabled_identifiers(
                         next_file
@@ -121,6 +148,10 @@ class FileScanHelper:
                     )
                     if did_attempt_at_least_one_fix:
                         return False, False, True
+                elif self.__scan_cache:
+                    did_succeed = self.__scan_specific_file_using_cache(
+                        next_file, per_file_disabled_identifiers
+                    )
                 else:
                     did_succeed = self.__scan_specific_file(
                         next_file, next_file, per_file_disabled_identifiers
@@ -130,6 +161,217 @@ class FileScanHelper:
                     did_fail_any_file = True
         return did_fix_any_file, did_fail_any_file, False
 
+    def __process_standard_in(
+        self,
+        args: argparse.Namespace,
+        documents_to_scan: Optional[List[Tuple[str, str]]],
+    ) -> Tuple[bool, bool, bool]:
+        """
+        Process the in-memory documents to scan, or the document read from
+        standard input.
+        """
+        did_fail_any_file = False
+        if documents_to_scan is not None:
+            POGGER.debug("Scanning from: $ documents", len(documents_to_scan))
+            did_fail_any_file = self.__scan_documents(args, documents_to_scan)
+        elif args.primary_subparser == FileScanHelper.__stdin_fix_subcommand:
+            POGGER.debug("Fixing from: (stdin)")
+            return self.__fix_from_stdin(args)
+        else:
+            POGGER.debug("Scanning from: (stdin)")
+            self.__scan_from_stdin(args)
+        return False, did_fail_any_file, False
+
+    def __scan_files_in_parallel(
+        self, args: argparse.Namespace, files_to_scan: List[str]
+    ) -> bool:
+        """
+        Scan the files using a pool of worker processes, reporting the results
+        in the same order as if the files were scanned one after the other.
+        """
+        files_with_identifiers = [
+            (
+                next_file,
+                self.__check_file_name_against_per_file_disabled_identifiers(next_file),
+            )
+            for next_file in files_to_scan
+        ]
+
+        # Any results that are already in the cache are replayed in order, and only
+        # the remaining files are handed to the worker processes.
+        cached_results, file_contents_by_index, decoded_contents_by_index = (
+            self.__load_cached_results(files_with_identifiers)
+        )
+        files_to_send: List[FileToScan] = [
+            (
+                next_file,
+                per_file_disabled_identifiers,
+                decoded_contents_by_index.get(file_index),
+            )
+            for file_index, (next_file, per_file_disabled_identifiers) in enumerate(
+                files_with_identifiers
+            )
+            if file_index not in cached_results
+        ]
+
+        did_fail_any_file = False
+        scan_results = ParallelScanHelper.scan_files(
+            ParallelScanHelper.create_settings(args, self.__properties),
+            args.jobs,
+            files_to_send,
+            args.max_failures,
+            self.__scan_pool,
+        )
+        try:
+            for file_index, (next_file, per_file_disabled_identifiers) in enumerate(
+                files_with_identifiers
+            ):
+                if self.__is_failure_budget_reached():
+                    break
+                if file_index in cached_results:
+                    self.__plugins.replay_recorded_results(cached_results[file_index])
+                    continue
+
+                _, _, recorded_results = next(scan_results)
+                if recorded_results is not None:
+                    self.__plugins.replay_recorded_results(recorded_results)
+                    if (
+                        self.__scan_cache
+                        and file_index in file_contents_by_index
+                        and not self.__plugins.is_failure_budget_reached()
+                    ):
+                        self.__scan_cache.save_results(
+                            next_file,
+                            file_contents_by_index[file_index],
+                            per_file_disabled_identifiers,
+                            recorded_results,
+                        )
+                    continue
+
+                # Scanning the file raised an exception within the worker.  Scan the
+                # file again within this process so that the error is handled and
+                # reported exactly as it would be without any worker processes.
+                POGGER.info("Rescanning file '$' after worker error.", next_file)
+                if not self.__scan_specific_file(
+                    next_file,
+                    next_file,
+                    per_file_disabled_identifiers,
+                    decoded_contents_by_index.get(file_index),
+                ):
+                    did_fail_any_file = True
+        finally:
+            scan_results.close()
+        return did_fail_any_file
+
+    def __load_cached_results(
+        self, files_with_identifiers: List[Tuple[str, Set[str]]]
+    ) -> Tuple[Dict[int, RecordedResults], Dict[int, bytes], Dict[int, str]]:
+        """
+        Look up each file in the cache, keeping the contents of any file that
+        still needs to be scanned so that it is scanned from the hashed bytes.
+        """
+        cached_results: Dict[int, RecordedResults] = {}
+        file_contents_by_index: Dict[int, bytes] = {}
+        decoded_contents_by_index: Dict[int, str] = {}
+        if not self.__scan_cache:
+            return cached_results, file_contents_by_index, decoded_contents_by_index
+        for file_index, (next_file, per_file_disabled_identifiers) in enumerate(
+            files_with_identifiers
+        ):
+            if (file_contents := self.__read_file_for_cache(next_file)) is None:
+                continue
+            if (
+                recorded_results := self.__scan_cache.load_results(
+                    next_file, file_contents, per_file_disabled_identifiers
+                )
+            ) is not None:
+                cached_results[file_index] = recorded_results
+            elif (
+                decoded_contents := self.__decode_file_for_cache(file_contents)
+            ) is not None:
+                file_contents_by_index[file_index] = file_contents
+                decoded_contents_by_index[file_index] = decoded_contents
+        return cached_results, file_contents_by_index, decoded_contents_by_index
+
+    @staticmethod
+    def __read_file_for_cache(next_file: str) -> Optional[bytes]:
+        try:
+            with open(next_file, "rb") as source_file:
+                return source_file.read()
+        except OSError:
+            # Let the normal scan report any problems with reading the file.
+            return None
+
+    @staticmethod
+    def __decode_file_for_cache(file_contents: bytes) -> Optional[str]:
+        """
+        Decode the bytes that were hashed for the cache, so that the scan uses
+        exactly those bytes instead of reading the file a second time.
+        """
+        try:
+            return file_contents.decode("utf-8")
+        except UnicodeDecodeError:
+            # Let the normal scan report any problems with decoding the file.
+            return None
+
+    def __scan_specific_file_using_cache(
+        self, next_file: str, per_file_disabled_identifiers: Set[str]
+    ) -> bool:
+        assert self.__scan_cache is not None
+        if (file_contents := self.__read_file_for_cache(next_file)) is None:
+            return self.__scan_specific_file(
+                next_file, next_file, per_file_disabled_identifiers
+            )
+
+        if (
+            recorded_results := self.__scan_cache.load_results(
+                next_file, file_contents, per_file_disabled_identifiers
+            )
+        ) is not None:
+            self.__plugins.replay_recorded_results(recorded_results)
+            return True
+
+        if (decoded_contents := self.__decode_file_for_cache(file_contents)) is None:
+            return self.__scan_specific_file(
+                next_file, next_file, per_file_disabled_identifiers
+            )
+
+        self.__plugins.start_recording_results()
+        try:
+            did_succeed = self.__scan_specific_file(
+                next_file,
+                next_file,
+                per_file_disabled_identifiers,
+                decoded_contents,
+            )
+        finally:
+            recorded_results = self.__plugins.stop_recording_results()
+        # A file whose scan was stopped by the failure budget has incomplete results.
+        if did_succeed and not self.__plugins.is_failure_budget_reached():
+            self.__scan_cache.save_results(
+                next_file,
+                file_contents,
+                per_file_disabled_identifiers,
+                recorded_results,
+            )
+        return did_succeed
+
+    def scan_file_without_error_handling(
+        self,
+        next_file: str,
+        per_file_disabled_identifiers: Optional[Set[str]],
+        file_contents: Optional[str] = None,
+    ) -> None:
+        """
+        Scan the specified file, leaving any raised exceptions for the caller to handle.
+        If the contents of the file are supplied, the file itself is not read.
+        """
+        self.__scan_file(
+            FileSourceProvider(next_file, file_contents),
+            next_file,
+            per_file_disabled_identifiers,
+        )
+
     # pylint: disable=too-many-arguments
     def __fix_specific_file(
         self,
@@ -177,54 +419,134 @@ class FileScanHelper:
                 per_file_disabled_identifiers.update(disable_set)
         return per_file_disabled_identifiers
 
-    def __scan_from_stdin(
-        self, args: argparse.Namespace, string_to_scan: Optional[str]
-    ) -> None:
-        temporary_file = None
-        scan_exception = None
-        scan_id = "stdin" if string_to_scan is None else "in-memory"
-        try:
-            if args.x_test_stdin_fault:
-                raise IOError("made up")
-
-            with tempfile.NamedTemporaryFile(
-                "wt", delete=False, encoding="utf-8"
-            ) as outfile:
-                temporary_file = outfile.name
+    def __scan_documents(
+        self, args: argparse.Namespace, documents_to_scan: List[Tuple[str, str]]
+    ) -> bool:
+        """
+        Scan documents that are already in memory, without writing them to disk.
+        As with standard-in, no per-file disabled identifiers apply to them.
+        """
+        if self.__use_parallel_scan(args, len(documents_to_scan)):
+            return self.__scan_documents_in_parallel(args, documents_to_scan)
 
-                if string_to_scan:
-                    outfile.write(string_to_scan)
-                else:
-                    for line in sys.stdin:
-                        outfile.write(line)
+        did_fail_any_file = False
+        for document_name, document_text in documents_to_scan:
+            if self.__is_failure_budget_reached():
+                break
+            if not self.__scan_specific_file(
+                document_name, document_name, None, file_contents=document_text
+            ):
+                did_fail_any_file = True
+        return did_fail_any_file
 
-            # As the temporary file is being used to capture the standard-in, the file needs to be
-            # scanned without any possible per-file disabled identifiers.
-            self.__scan_specific_file(temporary_file, scan_id, None)
+    def __scan_documents_in_parallel(
+        self, args: argparse.Namespace, documents_to_scan: List[Tuple[str, str]]
+    ) -> bool:
+        scan_results = ParallelScanHelper.scan_files(
+            ParallelScanHelper.create_settings(args, self.__properties),
+            args.jobs,
+            [
+                (document_name, set(), document_text)
+                for document_name, document_text in documents_to_scan
+            ],
+            args.max_failures,
+            self.__scan_pool,
+        )
+        did_fail_any_file = False
+        try:
+            for document_name, document_text in documents_to_scan:
+                if self.__is_failure_budget_reached():
+                    break
+                _, _, recorded_results = next(scan_results)
+                if recorded_results is not None:
+                    self.__plugins.replay_recorded_results(recorded_results)
+                    continue
 
-        except IOError as this_exception:
-            scan_exception = this_exception
+                POGGER.info(
+                    "Rescanning document '$' after worker error.", document_name
+                )
+                if not self.__scan_specific_file(
+                    document_name, document_name, None, file_contents=document_text
+                ):
+                    did_fail_any_file = True
         finally:
-            if temporary_file and os.path.exists(temporary_file):
-                os.remove(temporary_file)
+            scan_results.close()
+        return did_fail_any_file
+
+    def __use_parallel_scan(self, args: argparse.Namespace, scan_count: int) -> bool:
+        # The time spent in each rule plugin is only kept for the plugins of this
+        # process, so profiling the rules always scans within this process.
+        return args.jobs > 1 and scan_count > 1 and not self.__plugins.rule_profiler
+
+    def __is_failure_budget_reached(self) -> bool:
+        # Closing the generator of results from any worker processes cancels any
+        # batches of files that those processes have not started on.
+        if self.__plugins.is_failure_budget_reached():
+            POGGER.info("Failure budget reached.  Remaining files will not be scanned.")
+            return True
+        return False
 
-        if scan_exception:
+    def __read_from_stdin(
+        self, args: argparse.Namespace, stdin_id: str
+    ) -> Optional[str]:
+        try:
+            if args.x_test_stdin_fault:
+                raise IOError("made up")
+            return sys.stdin.read()
+        except IOError as read_exception:
             try:
                 raise IOError(
-                    f"Temporary file to capture {scan_id} was not written ({scan_exception})."
-                ) from scan_exception
+                    f"Standard input was not read ({read_exception})."
+                ) from read_exception
             except IOError as this_exception:
-                self.__handle_scan_error(scan_id, this_exception)
+                self.__handle_scan_error(stdin_id, this_exception)
+        return None
+
+    def __scan_from_stdin(self, args: argparse.Namespace) -> None:
+        scan_id = "stdin"
+        if (document_text := self.__read_from_stdin(args, scan_id)) is not None:
+            # As the document is read from standard-in, the document needs to be
+            # scanned without any possible per-file disabled identifiers.
+            self.__scan_specific_file(
+                scan_id, scan_id, None, file_contents=document_text
+            )
+
+    def __fix_from_stdin(self, args: argparse.Namespace) -> Tuple[bool, bool, bool]:
+        fix_id = "stdin"
+        if (document_text := self.__read_from_stdin(args, fix_id)) is None:
+            return False, True, False
+
+        # As with scanning, no per-file disabled identifiers apply to standard-in.
+        # Instead of writing the fixed document back to a file, it is written to
+        # standard-out, whether any fixes were applied or not.
+        did_fix_document, did_succeed, did_attempt_at_least_one_fix = (
+            self.__fix_specific_file_with_error_handling(
+                fix_id,
+                fix_id,
+                args.x_fix_debug,
+                args.x_fix_file_debug,
+                args.x_fix_no_rescan_log,
+                None,
+                standard_input_text=document_text,
+            )
+        )
+        if did_succeed and not did_attempt_at_least_one_fix:
+            self.__presentation.print_system_error(
+                "Cannot fix files: No rule plugins are enabled have fix mode support."
+            )
+            return False, False, True
+        return did_fix_document, not did_succeed, False
 
     def __scan_specific_file(
         self,
         next_file: str,
         next_file_name: str,
         per_file_disabled_identifiers: Optional[Set[str]],
+        file_contents: Optional[str] = None,
     ) -> bool:
 
         try:
-            source_provider = FileSourceProvider(next_file)
+            source_provider = FileSourceProvider(next_file, file_contents)
             self.__scan_file(
                 source_provider, next_file_name, per_file_disabled_identifiers
             )
@@ -255,7 +577,9 @@ class FileScanHelper:
 
             POGGER.info("Scanning file '$' token-by-token.", next_file_name)
             actual_tokens = self.__tokenizer.transform_from_provider(
-                source_provider, do_add_end_of_stream_token=True
+                source_provider,
+                do_add_end_of_stream_token=True,
+                do_parse_inline=self.__plugins.is_inline_pass_required,
             )
             context = self.__plugins.starting_new_file(
                 next_file_name, actual_tokens, per_file_disabled_identifiers
@@ -294,18 +618,34 @@ class FileScanHelper:
             actual_tokens = actual_tokens[:-1]
 
         POGGER.info("Scanning file '$' tokens.", next_file_name)
+        check_failure_budget = self.__plugins.has_failure_budget
         for next_token in actual_tokens:
             POGGER.info("Processing token: $", next_token)
             self.__plugins.next_token(
                 context, next_token, per_file_disabled_identifiers
             )
+            if check_failure_budget and context.is_failure_budget_reached:
+                POGGER.info("Failure budget reached in file '$'.", next_file_name)
+                return
+        self.__plugins.scan_tokens(
+            context, actual_tokens, per_file_disabled_identifiers
+        )
+        if check_failure_budget and context.is_failure_budget_reached:
+            POGGER.info("Failure budget reached in file '$'.", next_file_name)
+            return
 
         POGGER.info("Completed scanning tokens in file '$'.", next_file_name)
 
-        POGGER.info("Scanning file '$' line-by-line.", next_file_name)
-        self.__process_lines_in_file(
-            source_provider, context, next_file_name, per_file_disabled_identifiers
-        )
+        if self.__plugins.is_line_pass_required:
+            POGGER.info("Scanning file '$' line-by-line.", next_file_name)
+            self.__process_lines_in_file(
+                source_provider, context, next_file_name, per_file_disabled_identifiers
+            )
+        else:
+            POGGER.info("Skipping line-by-line scan of file '$'.", next_file_name)
+            self.__plugins.completed_file(
+                context, source_provider.line_count + 1, per_file_disabled_identifiers
+            )
 
     # pylint: enable=too-many-arguments
 
@@ -318,6 +658,7 @@ class FileScanHelper:
         fix_file_debug: bool,
         fix_nolog_rescan: bool,
         per_file_disabled_identifiers: Optional[Set[str]],
+        standard_input_text: Optional[str] = None,
     ) -> Tuple[bool, bool, bool]:
         did_fix_file = False
         did_attempt_at_least_one_fix = False
@@ -333,6 +674,7 @@ class FileScanHelper:
                     fix_file_debug,
                     fix_nolog_rescan,
                     per_file_disabled_identifiers,
+                    standard_input_text,
                 )
 
                 POGGER.info("Ending file to fix '$'.", next_file_name)
@@ -381,13 +723,15 @@ class FileScanHelper:
             ReturnCodeHelper.exit_application(ApplicationResult.SYSTEM_ERROR)
 
     def __process_file_fix_rescan(
-        self, fix_debug: bool, fix_nolog_rescan: bool, next_file_two: str
+        self,
+        fix_debug: bool,
+        fix_nolog_rescan: bool,
+        next_file_name: str,
+        document_text: str,
     ) -> List[MarkdownToken]:
         _ = fix_debug
-        # if fix_debug:
-        #     print(f"scan: {next_file_two}")
-        POGGER.info("Rescanning file '$' before line-by-line fixes.", next_file_two)
-        source_provider = FileSourceProvider(next_file_two)
+        POGGER.info("Rescanning file '$' before line-by-line fixes.", next_file_name)
+        source_provider = FileSourceProvider(next_file_name, document_text)
 
         if fix_nolog_rescan:
             saved_log_level = logging.WARNING
@@ -418,24 +762,24 @@ class FileScanHelper:
     # pylint: disable=too-many-arguments, too-many-locals
     def __process_file_fix_pass(
         self,
-        next_file: str,
         next_file_name: str,
+        document_text: str,
         fix_debug: bool,
         fix_file_debug: bool,
         fix_nolog_rescan: bool,
         fix_list: List[str],
         collect_list: List[str],
         per_file_disabled_identifiers: Optional[Set[str]],
-    ) -> Tuple[bool, Set[str], Set[str]]:
-        # Scan the provided file for any token fixes.
+    ) -> Tuple[bool, str, Set[str], Set[str]]:
+        # Scan the provided document for any token fixes.
         (
-            next_file_two,
+            token_fixed_text,
             actual_tokens,
             did_any_tokens_get_fixed,
             collected_token_triggers,
         ) = self.__process_file_fix_tokens(
-            next_file,
             next_file_name,
+            document_text,
             fix_debug,
             fix_file_debug,
             fix_list,
@@ -454,19 +798,19 @@ class FileScanHelper:
             )
         else:
             actual_tokens = self.__process_file_fix_rescan(
-                fix_debug, fix_nolog_rescan, next_file_two
+                fix_debug, fix_nolog_rescan, next_file_name, token_fixed_text
             )
 
-        # As the lines are processed, a new temporary line file is written to. If either
-        # tokens were fixed or lines were fixed, the file contents of the file
-        # temporary_line_file_name will contain the updated document.
+        # As the lines are processed, each line is added to an in-memory line sink. If
+        # either tokens were fixed or lines were fixed, the contents of that line sink
+        # are the updated document.
         (
             this_file_fix_line_records,
-            temporary_line_file_name,
+            line_fixed_text,
             collected_line_triggers,
         ) = self.__process_file_fix_lines(
-            next_file_two,
             next_file_name,
+            token_fixed_text,
             actual_tokens,
             fix_debug,
             fix_file_debug,
@@ -475,23 +819,14 @@ class FileScanHelper:
             per_file_disabled_identifiers,
         )
 
-        # If anything was fixed, copy the temporary file on top of the original file
-        # that was scanned.
         did_any_lines_get_fixed = bool(this_file_fix_line_records)
         did_anything_get_fixed = did_any_lines_get_fixed or did_any_tokens_get_fixed
-        if did_anything_get_fixed:
-            if fix_debug and fix_file_debug:
-                print(f"Copy {temporary_line_file_name} to {next_file}")
-            shutil.copyfile(temporary_line_file_name, next_file)
-        if fix_debug and fix_file_debug:
-            print(f"Remove:{temporary_line_file_name}")
-        os.remove(temporary_line_file_name)
-        if next_file_two != next_file:
-            if fix_debug and fix_file_debug:
-                print(f"Remove:{next_file_two}")
-            os.remove(next_file_two)
-
-        return did_anything_get_fixed, collected_token_triggers, collected_line_triggers
+        return (
+            did_anything_get_fixed,
+            line_fixed_text if did_anything_get_fixed else document_text,
+            collected_token_triggers,
+            collected_line_triggers,
+        )
 
     # pylint: enable=too-many-arguments, too-many-locals
 
@@ -501,13 +836,13 @@ class FileScanHelper:
         plugins_by_fix_level: Dict[int, List[str]],
         minimum_fix_level: int,
         fixes_by_id: Dict[str, FoundPlugin],
-        next_file: str,
         next_file_name: str,
+        document_text: str,
         fix_debug: bool,
         fix_file_debug: bool,
         fix_nolog_rescan: bool,
         per_file_disabled_identifiers: Optional[Set[str]],
-    ) -> Tuple[bool, bool, int]:
+    ) -> Tuple[bool, bool, int, str]:
         keep_processing = False
         collect_list: List[str] = []
         fix_list = []
@@ -520,11 +855,12 @@ class FileScanHelper:
 
         (
             did_anything_get_fixed_this_time,
+            document_text,
             collected_token_triggers,
             collected_line_triggers,
         ) = self.__process_file_fix_pass(
-            next_file,
             next_file_name,
+            document_text,
             fix_debug,
             fix_file_debug,
             fix_nolog_rescan,
@@ -551,7 +887,12 @@ class FileScanHelper:
             keep_processing = True
             minimum_fix_level = new_minimum_fix_level
 
-        return keep_processing, did_anything_get_fixed_this_time, minimum_fix_level
+        return (
+            keep_processing,
+            did_anything_get_fixed_this_time,
+            minimum_fix_level,
+            document_text,
+        )
 
     # pylint: enable=too-many-arguments, too-many-locals
 
@@ -564,6 +905,7 @@ class FileScanHelper:
         fix_file_debug: bool,
         fix_nolog_rescan: bool,
         per_file_disabled_identifiers: Optional[Set[str]],
+        standard_input_text: Optional[str],
     ) -> Tuple[bool, bool]:
         enabled_plugins_with_fixes = filter(
             lambda x: x.plugin_supports_fix, self.__plugins.enabled_plugins
@@ -594,17 +936,25 @@ class FileScanHelper:
         keep_processing = did_attempt_at_least_one_fix
         minimum_fix_level = min(plugins_by_fix_level.keys()) if keep_processing else -1
 
+        # The document is read once, every fix level works on the document in memory,
+        # and the document is only written back once, after every level is done.
+        if standard_input_text is None:
+            with open(next_file, "rt", encoding="utf-8") as source_file:
+                document_text = source_file.read()
+        else:
+            document_text = standard_input_text
         while keep_processing:
             (
                 keep_processing,
                 did_anything_get_fixed_this_time,
                 minimum_fix_level,
+                document_text,
             ) = self.__process_file_fix_next_level(
                 plugins_by_fix_level,
                 minimum_fix_level,
                 fixes_by_id,
-                next_file,
                 next_file_name,
+                document_text,
                 fix_debug,
                 fix_file_debug,
                 fix_nolog_rescan,
@@ -614,15 +964,45 @@ class FileScanHelper:
                 did_anything_get_fixed or did_anything_get_fixed_this_time
             )
 
+        if standard_input_text is not None:
+            if did_attempt_at_least_one_fix:
+                self.__presentation.print_fixed_document(document_text)
+        elif did_anything_get_fixed:
+            if fix_debug and fix_file_debug:
+                print(f"Write {next_file}")
+            self.__write_file_atomically(next_file, document_text)
         return did_anything_get_fixed, did_attempt_at_least_one_fix
 
     # pylint: enable=too-many-arguments, too-many-locals
 
+    @staticmethod
+    def __write_file_atomically(next_file: str, document_text: str) -> None:
+        """
+        Write the document to a temporary file in the same directory, and then
+        rename it over the original file, so the original file is either left as
+        it was or completely replaced.  If the file is a symbolic link, the file
+        that it points to is replaced, leaving the link in place.
+        """
+        target_file = os.path.realpath(next_file)
+        file_descriptor, temporary_file_name = tempfile.mkstemp(
+            dir=os.path.dirname(target_file),
+            prefix=f".{os.path.basename(target_file)}.",
+            suffix=".tmp",
+        )
+        try:
+            with open(file_descriptor, "wt", encoding="utf-8") as temporary_file:
+                temporary_file.write(document_text)
+            shutil.copymode(target_file, temporary_file_name)
+            os.replace(temporary_file_name, target_file)
+        except BaseException:
+            os.remove(temporary_file_name)
+            raise
+
     # pylint: disable=too-many-arguments, too-many-locals
     def __process_file_fix_lines(
         self,
-        next_file: str,
         next_file_name: str,
+        document_text: str,
         actual_tokens: List[MarkdownToken],
         fix_debug: bool,
         fix_file_debug: bool,
@@ -630,60 +1010,63 @@ class FileScanHelper:
         collect_list: List[str],
         per_file_disabled_identifiers: Optional[Set[str]],
     ) -> Tuple[List[FixLineRecord], str, Set[str]]:
-        source_provider = FileSourceProvider(next_file)
-        with tempfile.NamedTemporaryFile() as temp_output:
-            temporary_file_name = temp_output.name
-        with open(temporary_file_name, "wt", encoding="utf-8") as source_file:
-            POGGER.info("Scanning before line-by-line fixes.")
-            fix_context = self.__plugins.starting_new_file(
-                next_file_name,
-                actual_tokens,
-                per_file_disabled_identifiers,
-                fix_mode=True,
-                temp_output=source_file,
-                fix_token_map=None,
-            )
-            report_context = self.__plugins.starting_new_file(
-                next_file_name,
-                actual_tokens,
-                per_file_disabled_identifiers,
-                constraint_id_list=collect_list,
-            )
-            context_map: Dict[str, PluginScanContext] = {
-                i: fix_context for i in fix_list
-            }
-            for i in collect_list:
-                context_map[i] = report_context
-
-            # Due to context required to process the line requirements, we need go
-            # through all the tokens first, before processing the lines.
-            #
-            # Basically, to allow any of the rules to build context applicable to
-            # the line being scanned, we rescan the tokens to present an updated
-            # picture of the tokens.
-            for next_token in actual_tokens:
-                POGGER.info("Processing tokens: $", next_token)
-                self.__plugins.next_token(
-                    fix_context, next_token, per_file_disabled_identifiers, context_map
-                )
+        source_provider = FileSourceProvider(next_file_name, document_text)
+        line_sink: List[str] = []
 
-            POGGER.info("Completed token scanning.")
-            self.__process_lines_in_file(
-                source_provider,
-                fix_context,
-                next_file_name,
-                per_file_disabled_identifiers,
-                context_map,
+        POGGER.info("Scanning before line-by-line fixes.")
+        fix_context = self.__plugins.starting_new_file(
+            next_file_name,
+            actual_tokens,
+            per_file_disabled_identifiers,
+            fix_mode=True,
+            line_sink=line_sink,
+            fix_token_map=None,
+        )
+        report_context = self.__plugins.starting_new_file(
+            next_file_name,
+            actual_tokens,
+            per_file_disabled_identifiers,
+            constraint_id_list=collect_list,
+        )
+        context_map: Dict[str, PluginScanContext] = {i: fix_context for i in fix_list}
+        for i in collect_list:
+            context_map[i] = report_context
+
+        # Due to context required to process the line requirements, we need go
+        # through all the tokens first, before processing the lines.
+        #
+        # Basically, to allow any of the rules to build context applicable to
+        # the line being scanned, we rescan the tokens to present an updated
+        # picture of the tokens.
+        for next_token in actual_tokens:
+            POGGER.info("Processing tokens: $", next_token)
+            self.__plugins.next_token(
+                fix_context, next_token, per_file_disabled_identifiers, context_map
             )
-            this_file_fix_line_records = fix_context.fix_line_records
-            if this_file_fix_line_records and fix_debug:
-                for next_record in fix_context.fix_line_records:
-                    print(next_record)
+        self.__plugins.scan_tokens(
+            fix_context, actual_tokens, per_file_disabled_identifiers, context_map
+        )
 
-        self.__print_file_in_debug_mode(fix_debug, fix_file_debug, temporary_file_name)
+        POGGER.info("Completed token scanning.")
+        self.__process_lines_in_file(
+            source_provider,
+            fix_context,
+            next_file_name,
+            per_file_disabled_identifiers,
+            context_map,
+        )
+        this_file_fix_line_records = fix_context.fix_line_records
+        if this_file_fix_line_records and fix_debug:
+            for next_record in fix_context.fix_line_records:
+                print(next_record)
+
+        line_fixed_text = "".join(line_sink)
+        self.__print_file_in_debug_mode(
+            fix_debug, fix_file_debug, next_file_name, line_fixed_text
+        )
         return (
             this_file_fix_line_records,
-            temporary_file_name,
+            line_fixed_text,
             report_context.get_triggered_rules(),
         )
 
@@ -692,18 +1075,20 @@ class FileScanHelper:
     # pylint: disable=too-many-arguments, too-many-locals
     def __process_file_fix_tokens(
         self,
-        next_file: str,
         next_file_name: str,
+        document_text: str,
         fix_debug: bool,
         fix_file_debug: bool,
         fix_list: List[str],
         collect_list: List[str],
         per_file_disabled_identifiers: Optional[Set[str]],
     ) -> Tuple[str, List[MarkdownToken], bool, Set[str]]:
-        self.__print_file_in_debug_mode(fix_debug, fix_file_debug, next_file)
+        self.__print_file_in_debug_mode(
+            fix_debug, fix_file_debug, next_file_name, document_text
+        )
 
         POGGER.info("Scanning file to fix '$' token-by-token.", next_file_name)
-        source_provider = FileSourceProvider(next_file)
+        source_provider = FileSourceProvider(next_file_name, document_text)
         actual_tokens = self.__tokenizer.transform_from_provider(
             source_provider, do_add_end_of_stream_token=True
         )
@@ -715,7 +1100,7 @@ class FileScanHelper:
             actual_tokens,
             per_file_disabled_identifiers,
             fix_mode=True,
-            temp_output=None,
+            line_sink=None,
             fix_token_map=fix_token_map,
             constraint_id_list=fix_list,
             replace_tokens_list=replace_tokens_list,
@@ -736,6 +1121,9 @@ class FileScanHelper:
             self.__plugins.next_token(
                 fix_context, next_token, per_file_disabled_identifiers, context_map
             )
+        self.__plugins.scan_tokens(
+            fix_context, actual_tokens, per_file_disabled_identifiers, context_map
+        )
 
         POGGER.info("Completed scanning file '$' for fixes.", next_file_name)
         self.__plugins.completed_file(
@@ -745,12 +1133,12 @@ class FileScanHelper:
         did_any_tokens_get_fixed = False
         if fix_context.get_fix_token_map() or fix_context.get_replace_tokens_list():
             (
-                next_file,
+                document_text,
                 actual_tokens,
                 did_any_tokens_get_fixed,
             ) = self.__process_file_fix_tokens_apply_fixes(
                 fix_context,
-                next_file,
+                next_file_name,
                 actual_tokens,
                 fix_token_map,
                 fix_debug,
@@ -758,7 +1146,7 @@ class FileScanHelper:
                 replace_tokens_list,
             )
         return (
-            next_file,
+            document_text,
             actual_tokens,
             did_any_tokens_get_fixed,
             report_context.get_triggered_rules(),
@@ -903,7 +1291,7 @@ class FileScanHelper:
     def __process_file_fix_tokens_apply_fixes(
         self,
         context: PluginScanContext,
-        next_file: str,
+        next_file_name: str,
         actual_tokens: List[MarkdownToken],
         fix_token_map: Dict[MarkdownToken, List[FixTokenRecord]],
         fix_debug: bool,
@@ -920,15 +1308,12 @@ class FileScanHelper:
 
         if fix_debug:
             print(f"MARKDOWN:{ParserHelper.make_value_visible(markdown_from_tokens)}")
-        with tempfile.NamedTemporaryFile() as temp_output:
-            temporary_file_name = temp_output.name
-        with open(temporary_file_name, "wt", encoding="utf-8") as source_file:
-            source_file.write(markdown_from_tokens)
-            next_file = temporary_file_name
-            actual_tokens.clear()
+        actual_tokens.clear()
 
-        self.__print_file_in_debug_mode(fix_debug, fix_file_debug, temporary_file_name)
-        return next_file, actual_tokens, did_any_tokens_get_fixed
+        self.__print_file_in_debug_mode(
+            fix_debug, fix_file_debug, next_file_name, markdown_from_tokens
+        )
+        return markdown_from_tokens, actual_tokens, did_any_tokens_get_fixed
 
     # pylint: enable=too-many-arguments
 
@@ -977,18 +1362,20 @@ class FileScanHelper:
     # pylint: enable=too-many-arguments
 
     def __print_file_in_debug_mode(
-        self, fix_debug: bool, fix_file_debug: bool, next_file: str
+        self,
+        fix_debug: bool,
+        fix_file_debug: bool,
+        next_file_name: str,
+        document_text: str,
     ) -> None:
         if fix_debug and fix_file_debug:
-            with open(next_file, "rt", encoding="utf-8") as source_file:
-                file_contents = source_file.read()
-                print(
-                    "\n--"
-                    + next_file
-                    + "--\n"
-                    + file_contents.replace("\n", "\\n")
-                    + "\n--"
-                )
+            print(
+                "\n--"
+                + next_file_name
+                + "--\n"
+                + document_text.replace("\n", "\\n")
+                + "\n--"
+            )
 
     def __apply_token_fix(
         self,
@@ -1059,6 +1446,13 @@ class FileScanHelper:
         per_file_disabled_identifiers: Optional[Set[str]],
         context_map: Optional[Dict[str, PluginScanContext]] = None,
     ) -> None:
+        check_failure_budget = self.__plugins.has_failure_budget
+        line_facts: Optional[List[LineFacts]] = (
+            None
+            if context.in_fix_mode or not self.__plugins.is_scan_lines_required
+            else []
+        )
+        previous_line: Optional[str] = None
         line_number, next_line = 1, source_provider.get_next_line()
         while next_line is not None:
             POGGER.info("Processing line $: $", line_number, next_line)
@@ -1071,9 +1465,31 @@ class FileScanHelper:
                 per_file_disabled_identifiers,
                 context_map,
             )
+            if check_failure_budget and context.is_failure_budget_reached:
+                POGGER.info("Failure budget reached in file '$'.", next_file_name)
+                return
+            if line_facts is not None:
+                line_facts.append(
+                    LineFacts.from_line(
+                        line_number,
+                        next_line,
+                        source_provider.is_at_end_of_file,
+                        previous_line,
+                    )
+                )
+                previous_line = next_line
             line_number += 1
             next_line = source_provider.get_next_line()
 
+        if line_facts is not None:
+            POGGER.info("Scanning all lines in file '$'.", next_file_name)
+            self.__plugins.scan_lines(
+                context, line_facts, per_file_disabled_identifiers
+            )
+            if check_failure_budget and context.is_failure_budget_reached:
+                POGGER.info("Failure budget reached in file '$'.", next_file_name)
+                return
+
         POGGER.info("Completed scanning lines in file '$'.", next_file_name)
         self.__plugins.completed_file(
             context, line_number, per_file_disabled_identifiers, context_map
@@ -1082,11 +1498,14 @@ class FileScanHelper:
     # pylint: enable=too-many-arguments
 
     @staticmethod
-    def is_scan_stdin_specified(args: argparse.Namespace) -> bool:
+    def is_standard_in_specified(args: argparse.Namespace) -> bool:
         """
-        Specifies whether scanning from stdin was specified.
+        Specifies whether scanning or fixing from stdin was specified.
         """
-        return FileScanHelper.__stdin_scan_subcommand == args.primary_subparser  # type: ignore
+        return args.primary_subparser in (
+            FileScanHelper.__stdin_scan_subcommand,
+            FileScanHelper.__stdin_fix_subcommand,
+        )
 
     @staticmethod
     def add_argparse_subparser(subparsers: argparse._SubParsersAction, is_fix_mode: bool) -> None:  # type: ignore
@@ -1108,7 +1527,12 @@ class FileScanHelper:
             new_sub_parser, ".md", "Markdown", show_respect_gitignore=True
         )
 
-        if not is_fix_mode:
+        if is_fix_mode:
+            subparsers.add_parser(
+                FileScanHelper.__stdin_fix_subcommand,
+                help="fix the standard input as a Markdown file, writing the result to standard output",
+            )
+        else:
             subparsers.add_parser(
                 FileScanHelper.__stdin_scan_subcommand,
                 help="scan the standard input as a Markdown file",
@@ -2,10 +2,15 @@
 Module to provide for the output of the PyMarkdown application.
 """
 
+import dataclasses
+import json
 import sys
-from typing import Optional
+from typing import List, Optional
+
+from columnar import columnar
 
 from pymarkdown.plugin_manager.plugin_scan_failure import PluginScanFailure
+from pymarkdown.plugin_manager.rule_profile import RuleProfile
 
 
 class MainPresentation:
@@ -19,6 +24,13 @@ class MainPresentation:
         """
         print(output_string, file=sys.stdout)
 
+    def print_system_output_text(self, output_text: str) -> None:
+        """
+        Root function to output text to standard out exactly as it is supplied,
+        without adding a line terminator.
+        """
+        sys.stdout.write(output_text)
+
     def print_system_error(self, error_string: str) -> None:
         """
         Root function to output to standard error.
@@ -69,3 +81,48 @@ class MainPresentation:
         Print a message indicating that a given file has been fixed.
         """
         self.print_system_output(f"Fixed: {file_fixed}")
+
+    def print_fixed_document(self, fixed_document: str) -> None:
+        """
+        Print a document read from standard input, with any fixes applied.
+        """
+        self.print_system_output_text(fixed_document)
+
+    def print_rule_profiles(
+        self, rule_profiles: List[RuleProfile], output_format: str
+    ) -> None:
+        """
+        Print the time spent in each callback of the rule plugins, either as a
+        table or as JSON.
+        """
+        if output_format == "json":
+            self.print_system_output(
+                json.dumps(
+                    [
+                        dataclasses.asdict(next_profile)
+                        for next_profile in rule_profiles
+                    ],
+                    indent=2,
+                )
+            )
+            return
+        if not rule_profiles:
+            self.print_system_output("No rule plugins were called.")
+            return
+
+        headers = ["id", "callback", "calls", "total ms", "slowest file", "file ms"]
+        show_rows = [
+            [
+                next_profile.plugin_id,
+                next_profile.callback_name,
+                str(next_profile.call_count),
+                f"{next_profile.total_nanoseconds / 1000000:.3f}",
+                next_profile.slowest_file or "",
+                f"{next_profile.slowest_file_nanoseconds / 1000000:.3f}",
+            ]
+            for next_profile in rule_profiles
+        ]
+        table = columnar(show_rows, headers, no_borders=True)
+        self.print_system_output(
+            "\n".join(next_row.rstrip() for next_row in table.split("\n"))
+        )
@@ -0,0 +1,16 @@
+"""
+Module to provide an indication of an error while scanning within a session.
+"""
+
+
+class SessionError(Exception):
+    """
+    Class to allow for an error that would have stopped the application to be
+    reported to the caller of a session, instead of exiting the application.
+    """
+
+    def __init__(self, formatted_message: str):
+        """
+        Initialize an instance of the SessionError class.
+        """
+        super().__init__(formatted_message)
@@ -2,6 +2,7 @@
 Module to provide a tokenization of a markdown-encoded string.
 """
 
+import io
 from abc import ABC, abstractmethod, abstractproperty
 from typing import List, Optional
 
@@ -72,13 +73,18 @@ class FileSourceProvider(SourceProvider):
     Class to provide for a source provider that is on media as a file.
     """
 
-    def __init__(self, file_to_open: str) -> None:
+    def __init__(self, file_to_open: str, file_contents: Optional[str] = None) -> None:
         """
-        Initialize an instance of the FileSourceProvider class.
+        Initialize an instance of the FileSourceProvider class.  If the contents
+        of the file are supplied, they are used instead of reading the file.
         """
 
-        with open(file_to_open, encoding="utf-8") as file_to_parse:
-            file_as_lines = file_to_parse.readlines()
+        if file_contents is None:
+            with open(file_to_open, encoding="utf-8") as file_to_parse:
+                file_as_lines = file_to_parse.readlines()
+        else:
+            # Translate line endings in the same manner as reading the file would.
+            file_as_lines = io.StringIO(file_contents, newline=None).readlines()
 
         self.__read_lines, self.__read_index, did_line_end_in_newline = [], 0, True
         for next_line in file_as_lines:
@@ -105,6 +111,13 @@ class FileSourceProvider(SourceProvider):
         """
         return self.__read_index >= len(self.__read_lines)
 
+    @property
+    def line_count(self) -> int:
+        """
+        Number of lines that the provider returns, including any empty final line.
+        """
+        return len(self.__read_lines)
+
     def get_next_line(self) -> Optional[str]:
         """
         Get the next line from the source provider.
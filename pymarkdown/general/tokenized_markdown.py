@@ -94,12 +94,15 @@ class TokenizedMarkdown:
         self,
         source_provider: Optional[SourceProvider],
         do_add_end_of_stream_token: bool = False,
+        do_parse_inline: bool = True,
     ) -> List[MarkdownToken]:
         """
         Transform the data from the source provider into a Markdown token stream.
+        If the inline elements are not parsed, the token stream only contains the
+        tokens produced by the block pass, with any text left as it was found.
         """
         self.__source_provider = source_provider
-        return self.__transform(do_add_end_of_stream_token)
+        return self.__transform(do_add_end_of_stream_token, do_parse_inline)
 
     def transform(
         self,
@@ -118,7 +121,9 @@ class TokenizedMarkdown:
         self.__source_provider = InMemorySourceProvider(your_text_string)
         return self.__transform(do_add_end_of_stream_token)
 
-    def __transform(self, do_add_end_of_stream_token: bool) -> List[MarkdownToken]:
+    def __transform(
+        self, do_add_end_of_stream_token: bool, do_parse_inline: bool = True
+    ) -> List[MarkdownToken]:
         """
         Transform a markdown-encoded string into an array of tokens.
         """
@@ -139,6 +144,8 @@ class TokenizedMarkdown:
             coalesced_results = CoalesceProcessor.coalesce_text_blocks(
                 first_pass_results
             )
+            if not do_parse_inline:
+                return coalesced_results
 
             POGGER.debug("\n\n>>>>>>>parse_inline>>>>>>")
             assert (
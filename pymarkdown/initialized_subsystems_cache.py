@@ -0,0 +1,81 @@
+"""
+Module to provide for keeping initialized subsystems around between requests.
+"""
+
+import argparse
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from application_properties import ApplicationProperties
+
+from pymarkdown.extension_manager.extension_manager import ExtensionManager
+from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+from pymarkdown.plugin_manager.plugin_manager import PluginManager
+
+
+@dataclass(frozen=True)
+class InitializedSubsystems:
+    """
+    Class to hold the subsystems that are expensive to initialize.
+    """
+
+    plugins: PluginManager
+    extensions: ExtensionManager
+    tokenizer: TokenizedMarkdown
+
+
+class InitializedSubsystemsCache:
+    """
+    Class to keep initialized subsystems around between requests, keyed by
+    everything that can change how those subsystems were initialized.
+    """
+
+    __maximum_entries = 8
+
+    def __init__(self) -> None:
+        """
+        Initialize a new instance of the InitializedSubsystemsCache class.
+        """
+        self.__subsystems_by_key: Dict[str, InitializedSubsystems] = {}
+
+    @staticmethod
+    def calculate_key(
+        args: argparse.Namespace,
+        properties: ApplicationProperties,
+        show_stack_trace: bool,
+    ) -> str:
+        """
+        Calculate the key for the subsystems initialized with these settings.
+        """
+        key_source = {
+            "add_plugin": args.add_plugin,
+            "enable_rules": args.enable_rules,
+            "disable_rules": args.disable_rules,
+            "enable_extensions": args.enable_extensions,
+            "fix_debug": args.x_fix_debug,
+            "profile_rules": bool(args.x_profile_rules),
+            "stack_trace": show_stack_trace,
+            "properties": [
+                [next_name, repr(properties.get_property(next_name, object))]
+                for next_name in sorted(properties.property_names)
+            ],
+        }
+        return hashlib.sha256(
+            json.dumps(key_source, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, subsystems_key: str) -> Optional[InitializedSubsystems]:
+        """
+        Get the subsystems for the key, if they have already been initialized.
+        """
+        return self.__subsystems_by_key.get(subsystems_key)
+
+    def add(self, subsystems_key: str, subsystems: InitializedSubsystems) -> None:
+        """
+        Add newly initialized subsystems, removing the oldest ones if needed.
+        """
+        while len(self.__subsystems_by_key) >= self.__maximum_entries:
+            del self.__subsystems_by_key[next(iter(self.__subsystems_by_key))]
+        self.__subsystems_by_key[subsystems_key] = subsystems
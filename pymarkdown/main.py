@@ -6,6 +6,7 @@ import argparse
 import logging
 import os
 import runpy
+import sys
 import traceback
 from typing import List, Optional, Tuple, cast
 
@@ -26,10 +27,19 @@ from pymarkdown.file_scan_helper import FileScanHelper
 from pymarkdown.general.bad_tokenization_error import BadTokenizationError
 from pymarkdown.general.main_presentation import MainPresentation
 from pymarkdown.general.parser_logger import ParserLogger
+from pymarkdown.general.session_error import SessionError
 from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+from pymarkdown.initialized_subsystems_cache import (
+    InitializedSubsystems,
+    InitializedSubsystemsCache,
+)
+from pymarkdown.parallel_scan_helper import ParallelScanPool
 from pymarkdown.plugin_manager.bad_plugin_error import BadPluginError
 from pymarkdown.plugin_manager.plugin_manager import PluginManager
 from pymarkdown.return_code_helper import ApplicationResult, ReturnCodeHelper
+from pymarkdown.scan_result_cache import ScanResultCache
+from pymarkdown.server_client import ServerClient
+from pymarkdown.server_helper import ServerHelper
 
 POGGER = ParserLogger(logging.getLogger(__name__))
 
@@ -42,19 +52,27 @@ class PyMarkdownLint:
     Class to provide for a simple implementation of a title case algorithm.
     """
 
+    # pylint: disable=too-many-arguments
     def __init__(
         self,
         presentation: Optional[MainPresentation] = None,
         show_stack_trace: bool = False,
         inherit_logging: bool = False,
-        string_to_scan: Optional[str] = None,
+        documents_to_scan: Optional[List[Tuple[str, str]]] = None,
+        subsystems_cache: Optional[InitializedSubsystemsCache] = None,
+        scan_pool: Optional[ParallelScanPool] = None,
     ) -> None:
         """
         Initialize a new instance of the PyMarkdownLint class.
         """
         self.__presentation = presentation or MainPresentation()
         self.__show_stack_trace = show_stack_trace
-        self.__string_to_scan = string_to_scan
+        self.__documents_to_scan = documents_to_scan
+        self.__subsystems_cache = subsystems_cache
+        self.__scan_pool = scan_pool
+        self.__is_server_request = subsystems_cache is not None
+        self.__raise_on_error = False
+        self.__file_scan_helper: Optional[FileScanHelper] = None
 
         self.__version_number = PyMarkdownLint.__get_semantic_version()
         self.__properties: ApplicationProperties = ApplicationProperties(
@@ -73,6 +91,8 @@ class PyMarkdownLint:
         self.__plugins: PluginManager = PluginManager(self.__presentation)
         self.__extensions: ExtensionManager = ExtensionManager(self.__presentation)
 
+    # pylint: enable=too-many-arguments
+
     @property
     def application_version(self) -> str:
         """
@@ -98,6 +118,8 @@ class PyMarkdownLint:
         ReturnCodeHelper.reset()
 
         args = self.__parse_arguments(direct_args=direct_args)
+        if args.server_socket and not self.__is_server_request:
+            self.__forward_to_server(args, direct_args)
         self.__set_initial_state(args)
 
         self.__show_stack_trace = args.show_stack_trace
@@ -173,6 +195,21 @@ class PyMarkdownLint:
             default="",
             help=argparse.SUPPRESS,
         )
+        parser.add_argument(
+            "--x-profile-rules",
+            dest="x_profile_rules",
+            action="store_const",
+            const="table",
+            default=None,
+            help=argparse.SUPPRESS,
+        )
+        parser.add_argument(
+            "--x-profile-rules-json",
+            dest="x_profile_rules",
+            action="store_const",
+            const="json",
+            help=argparse.SUPPRESS,
+        )
 
         parser.add_argument(
             "--add-plugin",
@@ -203,6 +240,37 @@ class PyMarkdownLint:
             default=False,
             help="if a tokenization or plugin error occurs, allow processing to continue",
         )
+        parser.add_argument(
+            "--max-failures",
+            dest="max_failures",
+            action="store",
+            default=None,
+            type=PyMarkdownLint.__positive_integer_type,
+            help="stop scanning once this many rule failures have been reported",
+        )
+        parser.add_argument(
+            "--fail-fast",
+            dest="max_failures",
+            action="store_const",
+            const=1,
+            help="stop scanning once the first rule failure has been reported",
+        )
+        parser.add_argument(
+            "--jobs",
+            dest="jobs",
+            action="store",
+            default=1,
+            type=PyMarkdownLint.__positive_integer_type,
+            help="number of processes to use when scanning multiple files",
+        )
+        parser.add_argument(
+            "--cache-dir",
+            dest="cache_directory",
+            action="store",
+            default=None,
+            help="directory used to cache the results of scanning files",
+        )
+        ServerHelper.add_command_line_arguments(parser)
         ApplicationLogging.add_default_command_line_arguments(parser)
         ReturnCodeHelper.add_command_line_arguments(parser)
 
@@ -211,6 +279,7 @@ class PyMarkdownLint:
         FileScanHelper.add_argparse_subparser(subparsers, True)
         PluginManager.add_argparse_subparser(subparsers)
         FileScanHelper.add_argparse_subparser(subparsers, False)
+        ServerHelper.add_argparse_subparser(subparsers)
 
         subparsers.add_parser("version", help="version of the application")
 
@@ -224,6 +293,18 @@ class PyMarkdownLint:
             ReturnCodeHelper.exit_application(ApplicationResult.SUCCESS)
         return parse_arguments
 
+    @staticmethod
+    def __positive_integer_type(argument: str) -> int:
+        try:
+            integer_value = int(argument)
+        except ValueError:
+            integer_value = 0
+        if integer_value < 1:
+            raise argparse.ArgumentTypeError(
+                f"Value '{argument}' is not a positive integer."
+            )
+        return integer_value
+
     def __set_initial_state(self, args: argparse.Namespace) -> None:
 
         # Set the return code first, to ensure any command line flags take effect as soon as possible.
@@ -242,8 +323,19 @@ class PyMarkdownLint:
         LOGGER.info("Configuration loaded and applied.  Initial state setup completed.")
 
     def __initialize_plugins_and_extensions(self, args: argparse.Namespace) -> None:
-        self.__initialize_plugins(args)
-        self.__initialize_extensions(args)
+        if args.primary_subparser == ServerHelper.argparse_subparser_name():
+            if self.__is_server_request:
+                self.__handle_error(
+                    "A server cannot be started by a request to another server.",
+                    None,
+                )
+            self.__subsystems_cache = InitializedSubsystemsCache()
+
+        if not self.__subsystems_cache:
+            self.__initialize_plugins(args)
+            self.__initialize_extensions(args)
+        else:
+            self.__initialize_subsystems_using_cache(args, self.__subsystems_cache)
 
         if args.primary_subparser == PluginManager.argparse_subparser_name():
             ReturnCodeHelper.exit_application(
@@ -254,12 +346,46 @@ class PyMarkdownLint:
                 self.__extensions.handle_argparse_subparser(args)
             )
 
+    def __initialize_subsystems_using_cache(
+        self, args: argparse.Namespace, subsystems_cache: InitializedSubsystemsCache
+    ) -> None:
+        subsystems_key = InitializedSubsystemsCache.calculate_key(
+            args, self.__properties, self.__show_stack_trace
+        )
+        if cached_subsystems := subsystems_cache.get(subsystems_key):
+            POGGER.info("Reusing initialized plugins, extensions, and parser.")
+            self.__plugins = cached_subsystems.plugins
+            self.__plugins.reset_failure_counts()
+            self.__extensions = cached_subsystems.extensions
+            self.__tokenizer = cached_subsystems.tokenizer
+            return
+
+        self.__initialize_plugins(args)
+        self.__initialize_extensions(args)
+        self.__initialize_parser()
+        assert self.__tokenizer is not None
+        subsystems_cache.add(
+            subsystems_key,
+            InitializedSubsystems(self.__plugins, self.__extensions, self.__tokenizer),
+        )
+
+    def __forward_to_server(
+        self, args: argparse.Namespace, direct_args: Optional[List[str]]
+    ) -> None:
+        ServerClient.forward_and_exit(
+            args.server_socket,
+            sys.argv[1:] if direct_args is None else direct_args,
+            FileScanHelper.is_standard_in_specified(args),
+        )
+
     def __initialize_plugins(self, args: argparse.Namespace) -> None:
         try:
             plugin_dir = os.path.join(
                 os.path.dirname(os.path.realpath(__file__)), "plugins"
             )
             self.__initialize_plugin_manager(args, plugin_dir)
+            if args.x_profile_rules:
+                self.__plugins.enable_rule_profiling()
             self.__apply_configuration_to_plugins()
         except ValueError as this_exception:
             self.__handle_error(
@@ -328,6 +454,8 @@ class PyMarkdownLint:
     # pylint: enable=broad-exception-caught
 
     def __initialize_parser(self) -> None:
+        if self.__tokenizer is not None:
+            return
         try:
             self.__tokenizer = TokenizedMarkdown()
             self.__tokenizer.apply_configuration(self.__properties, self.__extensions)
@@ -338,6 +466,29 @@ class PyMarkdownLint:
             )
             self.__handle_error(formatted_error, this_exception)
 
+    def __initialize_scan_cache(
+        self, args: argparse.Namespace
+    ) -> Optional[ScanResultCache]:
+        if not args.cache_directory:
+            return None
+        try:
+            return ScanResultCache(
+                args.cache_directory,
+                ScanResultCache.calculate_configuration_key(
+                    self.__properties,
+                    self.__plugins,
+                    self.__extensions,
+                    self.__version_number,
+                ),
+            )
+        except OSError as this_exception:
+            formatted_error = (
+                f"{type(this_exception).__name__} encountered while initializing cache:\n"
+                + f"{this_exception}"
+            )
+            self.__handle_error(formatted_error, this_exception)
+        return None
+
     def __handle_error(
         self,
         formatted_error: str,
@@ -358,6 +509,8 @@ class PyMarkdownLint:
             f"{print_prefix}{formatted_error}{stack_trace}"
         )
         if exit_on_error:
+            if self.__raise_on_error:
+                raise SessionError(formatted_error) from thrown_error
             ReturnCodeHelper.exit_application(ApplicationResult.SYSTEM_ERROR)
 
     def __handle_file_scanner_output(self, formatted_output: str) -> None:
@@ -386,17 +539,10 @@ class PyMarkdownLint:
         assert (
             self.__tokenizer is not None
         ), "When scanning, the tokenizer should have already been initialized."
-        fsh = FileScanHelper(
-            self.__tokenizer,
-            self.__plugins,
-            self.__presentation,
-            self.__show_stack_trace,
-            self.__handle_error,
-            self.__properties,
-        )
+        fsh = self.__file_scan_helper or self.__create_file_scan_helper(args)
         did_fix_any_files, did_fail_any_file, no_plugins_active_for_fix = (
             fsh.process_files_to_scan(
-                args, use_standard_in, files_to_scan, self.__string_to_scan
+                args, use_standard_in, files_to_scan, self.__documents_to_scan
             )
         )
         if no_plugins_active_for_fix:
@@ -410,13 +556,33 @@ class PyMarkdownLint:
         else:
             scan_result = ApplicationResult.SUCCESS
 
+        if rule_profiler := self.__plugins.rule_profiler:
+            self.__presentation.print_rule_profiles(
+                rule_profiler.collect_profiles(), args.x_profile_rules
+            )
+
         POGGER.info("Files have been processed.")
         return scan_result
 
+    def __create_file_scan_helper(self, args: argparse.Namespace) -> FileScanHelper:
+        assert (
+            self.__tokenizer is not None
+        ), "When scanning, the tokenizer should have already been initialized."
+        return FileScanHelper(
+            self.__tokenizer,
+            self.__plugins,
+            self.__presentation,
+            self.__show_stack_trace,
+            self.__handle_error,
+            self.__properties,
+            self.__initialize_scan_cache(args),
+            self.__scan_pool,
+        )
+
     def __find_files_to_scan(
         self, args: argparse.Namespace
     ) -> Tuple[bool, List[str], bool, bool]:
-        use_standard_in = FileScanHelper.is_scan_stdin_specified(args)
+        use_standard_in = FileScanHelper.is_standard_in_specified(args)
         if use_standard_in:
             return use_standard_in, [], False, False
 
@@ -453,6 +619,90 @@ class PyMarkdownLint:
             did_only_list_files,
         )
 
+    def __serve_requests(self, args: argparse.Namespace) -> None:
+        subsystems_cache = self.__subsystems_cache
+        assert subsystems_cache is not None
+
+        def handle_request(request_arguments: List[str]) -> None:
+            PyMarkdownLint(
+                presentation=self.__presentation,
+                show_stack_trace=self.__show_stack_trace,
+                subsystems_cache=subsystems_cache,
+            ).main(request_arguments)
+
+        ServerHelper(args.server_socket_path, handle_request).serve()
+        ReturnCodeHelper.exit_application(ApplicationResult.SUCCESS)
+
+    # pylint: disable=broad-exception-caught
+    def initialize_session(self, direct_args: List[str]) -> argparse.Namespace:
+        """
+        Parse the arguments, load the configuration, and initialize the plugins,
+        the extensions, the parser, and the file scanner once, so that they can be
+        reused by any number of calls to `scan_in_session`.  Instead of exiting the
+        application, any error is raised as a `SessionError`.
+        """
+        self.__raise_on_error = True
+        try:
+            args = self.__initialize_subsystems(direct_args)
+            self.__initialize_parser()
+            self.__file_scan_helper = self.__create_file_scan_helper(args)
+            return args
+        except SessionError:
+            raise
+        except Exception as this_exception:
+            self.__handle_session_error(this_exception)
+            raise
+
+    def scan_in_session(
+        self,
+        args: argparse.Namespace,
+        documents_to_scan: Optional[List[Tuple[str, str]]] = None,
+    ) -> ApplicationResult:
+        """
+        Scan or fix the paths in the arguments, or the in-memory documents, with
+        the subsystems initialized by `initialize_session`.  Only the state kept
+        for each scan is reset.  Instead of exiting the application, the result is
+        returned, and any error is raised as a `SessionError`.
+        """
+        assert self.__file_scan_helper is not None
+        self.__plugins.reset_failure_counts()
+        self.__documents_to_scan = documents_to_scan
+        try:
+            use_standard_in, files_to_scan, did_error_scanning_files, _ = (
+                self.__find_files_to_scan(args)
+            )
+            if not use_standard_in and not files_to_scan:
+                return ApplicationResult.NO_FILES_TO_SCAN
+            return self.__scan_files_if_no_errors(
+                args, use_standard_in, files_to_scan, did_error_scanning_files
+            )
+        except SessionError:
+            raise
+        except Exception as this_exception:
+            self.__handle_session_error(this_exception)
+            raise
+
+    # pylint: enable=broad-exception-caught
+
+    def __handle_session_error(self, this_exception: Exception) -> None:
+        if isinstance(this_exception, ValueError):
+            formatted_error = f"Configuration Error: {this_exception}"
+        else:
+            formatted_error = (
+                f"Unexpected Error({type(this_exception).__name__}): {this_exception}"
+            )
+        self.__handle_error(formatted_error, this_exception)
+
+    def close_session(self) -> None:
+        """
+        Close the session started by `initialize_session`, stopping any logging
+        that it started.
+        """
+        self.__file_scan_helper = None
+        if self.__logging:
+            self.__logging.terminate()
+        self.__logging = None
+
     # pylint: disable=broad-exception-caught
     def main(self, direct_args: Optional[List[str]] = None) -> None:
         """
@@ -460,6 +710,8 @@ class PyMarkdownLint:
         """
         try:
             args = self.__initialize_subsystems(direct_args)
+            if args.primary_subparser == ServerHelper.argparse_subparser_name():
+                self.__serve_requests(args)
 
             (
                 use_standard_in,
@@ -0,0 +1,328 @@
+"""
+Module to provide for scanning files using a pool of worker processes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Deque, Generator, List, Optional, Set, Tuple, Union
+
+from application_properties import ApplicationProperties
+
+from pymarkdown.extension_manager.extension_manager import ExtensionManager
+from pymarkdown.general.main_presentation import MainPresentation
+from pymarkdown.general.parser_logger import ParserLogger
+from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+from pymarkdown.initialized_subsystems_cache import InitializedSubsystemsCache
+from pymarkdown.plugin_manager.plugin_manager import PluginManager
+from pymarkdown.plugin_manager.plugin_scan_failure import PluginScanFailure
+from pymarkdown.plugin_manager.pragma_failure_record import PragmaFailureRecord
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pymarkdown.file_scan_helper import FileScanHelper
+
+POGGER = ParserLogger(logging.getLogger(__name__))
+
+RecordedResults = List[Union[PluginScanFailure, PragmaFailureRecord]]
+
+# The name of the file, any per-file disabled identifiers, and the contents of the
+# file if it is only in memory.
+FileToScan = Tuple[str, Set[str], Optional[str]]
+
+
+@dataclass(frozen=True)
+class ParallelScanSettings:
+    """
+    Class to hold the settings required to initialize a worker process in the
+    same manner as the parent process.  As the failure budget changes from one
+    scan to the next, it is supplied with each batch of files instead.
+    """
+
+    properties: ApplicationProperties
+    additional_plugin_paths: List[str]
+    enable_rules: str
+    disable_rules: str
+    enable_extensions: str
+    show_stack_trace: bool
+    settings_key: str
+
+
+class ParallelScanPool:
+    """
+    Class to keep a single pool of worker processes alive across several scans,
+    such as the batches of documents scanned by one call to the API's
+    `scan_strings` function.  The pool is only replaced if the settings that its
+    workers were initialized with change.
+    """
+
+    def __init__(self) -> None:
+        self.__executor: Optional[ProcessPoolExecutor] = None
+        self.__executor_key: Optional[Tuple[str, int]] = None
+
+    def get_executor(
+        self, settings: ParallelScanSettings, job_count: int
+    ) -> ProcessPoolExecutor:
+        """
+        Get the pool of worker processes for these settings, creating it if needed.
+        """
+        executor_key = (settings.settings_key, job_count)
+        if self.__executor is None or self.__executor_key != executor_key:
+            self.shutdown()
+            POGGER.info("Starting a pool of $ worker processes.", job_count)
+            self.__executor = ParallelScanHelper.create_executor(settings, job_count)
+            self.__executor_key = executor_key
+        return self.__executor
+
+    def shutdown(self) -> None:
+        """
+        Stop any worker processes in the pool.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True, cancel_futures=True)
+            self.__executor = None
+            self.__executor_key = None
+
+
+class _SilentPresentation(MainPresentation):
+    """
+    Class to swallow any output within a worker process.  Anything that needs to
+    be reported is recorded and then reported by the parent process.
+    """
+
+    def print_system_output(self, output_string: str) -> None:
+        """
+        Root function to output to standard out.
+        """
+
+    def print_system_output_text(self, output_text: str) -> None:
+        """
+        Root function to output text to standard out exactly as it is supplied.
+        """
+
+    def print_system_error(self, error_string: str) -> None:
+        """
+        Root function to output to standard error.
+        """
+
+
+class ParallelScanHelper:
+    """
+    Class to provide for scanning files using a pool of worker processes.  Each
+    worker process has its own tokenizer, plugin manager, and extension manager.
+    Files are handed out in batches, and the results are handed back in the
+    same order that the files were supplied in.
+    """
+
+    __worker_scan_helper: Optional[FileScanHelper] = None
+    __worker_plugins: Optional[PluginManager] = None
+    __maximum_batch_size = 32
+    __batches_per_job = 4
+    __pending_batches_per_job = 2
+
+    @staticmethod
+    def create_settings(
+        args: argparse.Namespace, properties: ApplicationProperties
+    ) -> ParallelScanSettings:
+        """
+        Extract the settings that each worker process needs from the parent process.
+        """
+        return ParallelScanSettings(
+            properties,
+            args.add_plugin,
+            args.enable_rules,
+            args.disable_rules,
+            args.enable_extensions,
+            args.show_stack_trace,
+            InitializedSubsystemsCache.calculate_key(
+                args, properties, args.show_stack_trace
+            ),
+        )
+
+    @staticmethod
+    def create_executor(
+        settings: ParallelScanSettings, job_count: int
+    ) -> ProcessPoolExecutor:
+        """
+        Create a pool of worker processes, each initialized with the settings.
+        """
+        return ProcessPoolExecutor(
+            max_workers=job_count,
+            initializer=ParallelScanHelper.initialize_worker,
+            initargs=(settings,),
+        )
+
+    @staticmethod
+    def calculate_batch_size(file_count: int, job_count: int) -> int:
+        """
+        Calculate how many files to give to a worker at once, balancing the cost
+        of communicating with the worker against keeping every worker busy.
+        """
+        batch_size = file_count // (job_count * ParallelScanHelper.__batches_per_job)
+        return max(1, min(batch_size, ParallelScanHelper.__maximum_batch_size))
+
+    @staticmethod
+    def scan_files(
+        settings: ParallelScanSettings,
+        job_count: int,
+        files_to_scan: List[FileToScan],
+        max_failures: Optional[int],
+        scan_pool: Optional[ParallelScanPool] = None,
+    ) -> Generator[Tuple[str, Set[str], Optional[RecordedResults]], None, None]:
+        """
+        Scan the files using a pool of worker processes, yielding the results for
+        each file in the order that the files were supplied.  If the scan of a file
+        raised an exception, the recorded results for that file are None.  If a
+        pool is supplied, its worker processes are used and left running,
+        otherwise a pool is created for this scan alone.
+
+        Only a few batches per job are handed to the workers at once, and another
+        batch is only handed out when the caller asks for more results, so a
+        caller that stops early does not leave the rest of the files queued.
+        """
+        batch_size = ParallelScanHelper.calculate_batch_size(
+            len(files_to_scan), job_count
+        )
+        batches = [
+            files_to_scan[i : i + batch_size]
+            for i in range(0, len(files_to_scan), batch_size)
+        ]
+        POGGER.info(
+            "Scanning $ files in $ batches with $ jobs.",
+            len(files_to_scan),
+            len(batches),
+            job_count,
+        )
+
+        owned_executor: Optional[ProcessPoolExecutor] = None
+        if scan_pool:
+            executor = scan_pool.get_executor(settings, job_count)
+        else:
+            executor = owned_executor = ParallelScanHelper.create_executor(
+                settings, job_count
+            )
+        remaining_batches = iter(batches)
+        batch_futures: Deque[
+            Future[List[Tuple[str, Set[str], Optional[RecordedResults]]]]
+        ] = deque(
+            executor.submit(
+                ParallelScanHelper.scan_batch_in_worker, next_batch, max_failures
+            )
+            for next_batch in itertools.islice(
+                remaining_batches,
+                job_count * ParallelScanHelper.__pending_batches_per_job,
+            )
+        )
+        try:
+            while batch_futures:
+                batch_results = batch_futures.popleft().result()
+                if next_batch := next(remaining_batches, None):
+                    batch_futures.append(
+                        executor.submit(
+                            ParallelScanHelper.scan_batch_in_worker,
+                            next_batch,
+                            max_failures,
+                        )
+                    )
+                yield from batch_results
+        finally:
+            for next_batch_future in batch_futures:
+                next_batch_future.cancel()
+            if owned_executor:
+                owned_executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def initialize_worker(settings: ParallelScanSettings) -> None:
+        """
+        Initialize the worker process with its own copies of the objects needed
+        to scan a file.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from pymarkdown.file_scan_helper import FileScanHelper
+
+        # pylint: enable=import-outside-toplevel
+
+        presentation = _SilentPresentation()
+        plugins = PluginManager(presentation)
+        plugins.initialize(
+            os.path.join(os.path.dirname(os.path.realpath(__file__)), "plugins"),
+            settings.additional_plugin_paths,
+            settings.enable_rules,
+            settings.disable_rules,
+            settings.properties,
+            settings.show_stack_trace,
+            False,
+        )
+        plugins.apply_configuration(settings.properties)
+
+        extensions = ExtensionManager(presentation)
+        extensions.initialize(settings.properties)
+        extensions.apply_configuration(settings.enable_extensions)
+
+        tokenizer = TokenizedMarkdown()
+        tokenizer.apply_configuration(settings.properties, extensions)
+
+        ParallelScanHelper.__worker_plugins = plugins
+        ParallelScanHelper.__worker_scan_helper = FileScanHelper(
+            tokenizer,
+            plugins,
+            presentation,
+            settings.show_stack_trace,
+            ParallelScanHelper.__handle_error_in_worker,
+            settings.properties,
+        )
+
+    @staticmethod
+    def __handle_error_in_worker(
+        formatted_error: str,
+        thrown_error: Optional[Exception],
+        exit_on_error: bool = True,
+        print_prefix: str = "\n\n",
+    ) -> None:
+        _ = (formatted_error, exit_on_error, print_prefix)
+        raise AssertionError(
+            "Errors are reported by the parent process, not the worker process."
+        ) from thrown_error
+
+    # pylint: disable=broad-exception-caught
+    @staticmethod
+    def scan_batch_in_worker(
+        batch: List[FileToScan], max_failures: Optional[int]
+    ) -> List[Tuple[str, Set[str], Optional[RecordedResults]]]:
+        """
+        Scan a batch of files within a worker process, recording the results
+        instead of reporting them.
+        """
+        assert ParallelScanHelper.__worker_scan_helper is not None
+        assert ParallelScanHelper.__worker_plugins is not None
+
+        ParallelScanHelper.__worker_plugins.set_failure_budget(max_failures)
+
+        batch_results: List[Tuple[str, Set[str], Optional[RecordedResults]]] = []
+        for next_file, per_file_disabled_identifiers, file_contents in batch:
+            # The failure budget of the parent process applies to each file, as a
+            # single file with that many failures reaches the budget on its own.
+            ParallelScanHelper.__worker_plugins.reset_failure_counts()
+            ParallelScanHelper.__worker_plugins.start_recording_results()
+            recorded_results: Optional[RecordedResults] = None
+            try:
+                ParallelScanHelper.__worker_scan_helper.scan_file_without_error_handling(
+                    next_file, per_file_disabled_identifiers, file_contents
+                )
+                recorded_results = (
+                    ParallelScanHelper.__worker_plugins.stop_recording_results()
+                )
+            except Exception:
+                ParallelScanHelper.__worker_plugins.stop_recording_results()
+            batch_results.append(
+                (next_file, per_file_disabled_identifiers, recorded_results)
+            )
+        return batch_results
+
+    # pylint: enable=broad-exception-caught
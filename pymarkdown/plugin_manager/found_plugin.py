@@ -4,7 +4,7 @@ Module to provide for an encapsulation of a plugin that was discovered.
 
 # pylint: disable=too-many-instance-attributes
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 
@@ -30,6 +30,9 @@ class FoundPlugin:
     plugin_supports_fix: bool
     plugin_fix_level: int
     plugin_identifiers: List[str]
+    plugin_uses_inline_tokens: bool = True
+    plugin_token_kinds: Optional[Set[str]] = None
+    plugin_uses_container_tracker: bool = False
 
 
 # pylint: enable=too-many-instance-attributes
@@ -0,0 +1,30 @@
+"""
+Module to hold one of the headings in the outline of a document.
+"""
+
+from dataclasses import dataclass
+from typing import List, Union
+
+from pymarkdown.tokens.atx_heading_markdown_token import AtxHeadingMarkdownToken
+from pymarkdown.tokens.markdown_token import EndMarkdownToken, MarkdownToken
+from pymarkdown.tokens.setext_heading_markdown_token import SetextHeadingMarkdownToken
+
+
+@dataclass(frozen=True)
+class HeadingOutlineEntry:
+    """
+    Class to hold one of the headings in the outline of a document, along with
+    the tokens that make up the text of that heading.
+    """
+
+    heading_token: Union[AtxHeadingMarkdownToken, SetextHeadingMarkdownToken]
+    end_token: EndMarkdownToken
+    contained_tokens: List[MarkdownToken]
+
+    @property
+    def level(self) -> int:
+        """
+        Level of the heading, with SetExt headings having the same level as the
+        equivalent Atx heading.
+        """
+        return self.heading_token.hash_count
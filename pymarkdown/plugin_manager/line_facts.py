@@ -0,0 +1,40 @@
+"""
+Module to hold the facts about a single line that the line-based rules share.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class LineFacts:
+    """
+    Class to hold the facts about a single line of a document, computed once and
+    shared by every plugin that looks at the lines of the document.
+    """
+
+    line_number: int
+    line: str
+    line_length: int
+    trailing_whitespace_length: int
+    first_tab_index: int
+    is_last_line: bool
+    is_prefaced_by_blank_line: bool
+
+    @staticmethod
+    def from_line(
+        line_number: int, line: str, is_last_line: bool, previous_line: Optional[str]
+    ) -> "LineFacts":
+        """
+        Compute the facts about a line, given the line before it, if any.
+        """
+        line_length = len(line)
+        return LineFacts(
+            line_number,
+            line,
+            line_length,
+            line_length - len(line.rstrip(" \t")),
+            line.find("\t"),
+            is_last_line,
+            previous_line is not None and not previous_line.strip(" \t"),
+        )
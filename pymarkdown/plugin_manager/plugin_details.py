@@ -40,10 +40,31 @@ class PluginDetailsV2(PluginDetails):
 @dataclass(frozen=True)
 class PluginDetailsV3(PluginDetailsV2):
     """
-    Class to provide details about a plugin, supplied by the plugin.
+    Class to provide details about a plugin, supplied by the plugin.  A plugin
+    that only looks at leaf and container block tokens may set
+    `plugin_uses_inline_tokens` to False, allowing the inline parsing of the
+    document to be skipped if no other enabled plugin needs it.
     """
 
     plugin_interface_version: int = 3
+    plugin_uses_inline_tokens: bool = True
+
+
+@dataclass(frozen=True)
+class PluginDetailsV4(PluginDetailsV3):
+    """
+    Class to provide details about a plugin, supplied by the plugin.  A plugin
+    that only looks at some kinds of tokens may set `plugin_token_kinds` to a
+    comma-separated list of the names of those tokens, such as `atx,setext`.
+    Its `next_token` function is then only called for tokens of those kinds,
+    and for their end tokens.  A plugin that sets `plugin_uses_container_tracker`
+    to True may look at the container tracker shared by all plugins from its
+    `next_token` function, instead of keeping its own.
+    """
+
+    plugin_interface_version: int = 4
+    plugin_token_kinds: Optional[str] = None
+    plugin_uses_container_tracker: bool = False
 
 
 @dataclass(frozen=True)
@@ -8,8 +8,7 @@ import logging
 import os
 import re
 import sys
-from io import TextIOWrapper
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from application_properties import ApplicationProperties, ApplicationPropertiesFacade
 from columnar import columnar
@@ -24,20 +23,30 @@ from pymarkdown.plugin_manager.bad_plugin_error import BadPluginError
 from pymarkdown.plugin_manager.fix_line_record import FixLineRecord
 from pymarkdown.plugin_manager.fix_token_record import FixTokenRecord
 from pymarkdown.plugin_manager.found_plugin import FoundPlugin
-from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2, QueryConfigItem
+from pymarkdown.plugin_manager.line_facts import LineFacts
+from pymarkdown.plugin_manager.plugin_details import (
+    PluginDetailsV2,
+    PluginDetailsV3,
+    PluginDetailsV4,
+    QueryConfigItem,
+)
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.plugin_scan_failure import PluginScanFailure
+from pymarkdown.plugin_manager.pragma_failure_record import PragmaFailureRecord
 from pymarkdown.plugin_manager.replace_tokens_record import ReplaceTokensRecord
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+from pymarkdown.plugin_manager.rule_profiler import RuleProfiler
+from pymarkdown.plugin_manager.suppression_range_index import SuppressionRangeIndex
+from pymarkdown.plugins.utils.container_token_manager import ContainerTokenManager
 from pymarkdown.return_code_helper import ApplicationResult
-from pymarkdown.tokens.markdown_token import MarkdownToken
+from pymarkdown.tokens.markdown_token import EndMarkdownToken, MarkdownToken
 
 LOGGER = logging.getLogger(__name__)
 
 # pylint: disable=too-many-lines
 
 
-# pylint: disable=too-many-instance-attributes
+# pylint: disable=too-many-instance-attributes,too-many-public-methods
 class PluginManager:
     """
     Manager object to take care of load and accessing plugin modules.
@@ -73,15 +82,29 @@ class PluginManager:
         self.__document_pragma_ranges: List[Tuple[int, int, Set[str]]]
         self.__general_pragma_ranges: List[Tuple[int, int, str]]
         self.__pragma_line_numbers: List[int]
+        self.__suppression_range_index = SuppressionRangeIndex()
 
         self.__registered_plugins: List[FoundPlugin] = []
         self.__enabled_plugins: List[FoundPlugin] = []
         self.__enabled_plugins_for_starting_new_file: List[FoundPlugin] = []
         self.__enabled_plugins_for_next_token: List[FoundPlugin] = []
+        self.__enabled_plugins_for_token_name: Dict[str, List[FoundPlugin]] = {}
+        self.__enabled_plugins_for_any_token: List[FoundPlugin] = []
+        self.__enabled_plugins_for_scan_tokens: List[FoundPlugin] = []
+        self.__scan_token_names: Dict[str, Set[str]] = {}
         self.__enabled_plugins_for_next_line: List[FoundPlugin] = []
+        self.__enabled_plugins_for_next_line_while_scanning: List[FoundPlugin] = []
+        self.__enabled_plugins_for_scan_lines: List[FoundPlugin] = []
         self.__enabled_plugins_for_completed_file: List[FoundPlugin] = []
+        self.__is_inline_pass_required = True
         self.__all_ids: Dict[str, FoundPlugin] = {}
         self.__properties: Optional[ApplicationProperties] = None
+        self.__recorded_results: Optional[
+            List[Union[PluginScanFailure, PragmaFailureRecord]]
+        ] = None
+        self.__failure_budget: Optional[int] = None
+        self.__rule_profiler: Optional[RuleProfiler] = None
+        self.__container_token_manager: Optional[ContainerTokenManager] = None
 
     # pylint: disable=too-many-arguments
     def initialize(
@@ -326,7 +349,7 @@ class PluginManager:
 
         actual_item_list = []
         if (
-            found_plugin.plugin_interface_version == 3
+            found_plugin.plugin_interface_version >= 3
             and found_plugin.plugin_instance.is_query_config_implemented_in_plugin
         ):
             try:
@@ -387,9 +410,10 @@ class PluginManager:
         PluginManager.__argparse_subparser.print_help()
         return ApplicationResult.COMMAND_LINE_ERROR
 
-    def log_scan_failure(self, scan_failure: PluginScanFailure) -> None:
+    def is_scan_failure_suppressed(self, scan_failure: PluginScanFailure) -> bool:
         """
-        Log the scan failure in the appropriate format.
+        Determine whether the scan failure is suppressed by any pragmas within the
+        current document.
         """
 
         rule_id = scan_failure.rule_id.lower()
@@ -397,24 +421,68 @@ class PluginManager:
             if scan_failure.line_number in self.__document_pragmas:
                 id_set = self.__document_pragmas[scan_failure.line_number]
                 if rule_id in id_set:
-                    return
+                    return True
             if (
                 scan_failure.is_error_token_prefaced_by_blank_line
                 and (scan_failure.line_number - 1) in self.__document_pragmas
             ):
                 id_set = self.__document_pragmas[scan_failure.line_number - 1]
                 if rule_id in id_set:
-                    return
+                    return True
+
+        return self.__suppression_range_index.is_line_suppressed(
+            rule_id, scan_failure.line_number
+        )
+
+    def set_failure_budget(self, failure_budget: Optional[int]) -> None:
+        """
+        Set the number of scan failures to report before any further scan failures
+        are ignored.  A value of None reports every scan failure.
+        """
+        self.__failure_budget = failure_budget
+
+    @property
+    def has_failure_budget(self) -> bool:
+        """
+        Whether a limit was placed on the number of scan failures to report.
+        """
+        return self.__failure_budget is not None
+
+    def is_failure_budget_reached(self) -> bool:
+        """
+        Determine whether the scan failures that were reported have reached the
+        failure budget.
+        """
+        return (
+            self.__failure_budget is not None
+            and self.number_of_scan_failures >= self.__failure_budget
+        )
+
+    def is_file_failure_budget_reached(self, pending_failure_count: int) -> bool:
+        """
+        Determine whether the failures that are waiting to be reported for a file
+        have reached the failure budget on their own.  The failures reported for
+        other files are not counted, so that a file is scanned just as far as it
+        is when scanned by a worker process.
+        """
+        return (
+            self.__failure_budget is not None
+            and pending_failure_count >= self.__failure_budget
+        )
+
+    def log_scan_failure(self, scan_failure: PluginScanFailure) -> None:
+        """
+        Log the scan failure in the appropriate format.
+        """
 
-        if self.__document_pragma_ranges:
-            for i, j, k in self.__document_pragma_ranges:
-                if i <= scan_failure.line_number <= j and rule_id in k:
-                    return
+        if (
+            self.is_scan_failure_suppressed(scan_failure)
+            or self.is_failure_budget_reached()
+        ):
+            return
 
-        if self.__general_pragma_ranges:
-            for i, j, m in self.__general_pragma_ranges:
-                if i <= scan_failure.line_number <= j and rule_id == m:
-                    return
+        if self.__recorded_results is not None:
+            self.__recorded_results.append(scan_failure)
 
         extra_info = (
             f" [{scan_failure.extra_error_information}]"
@@ -442,9 +510,63 @@ class PluginManager:
         """
         Log the pragma failure in the appropriate format.
         """
+        if self.__recorded_results is not None:
+            self.__recorded_results.append(
+                PragmaFailureRecord(scan_file, line_number, pragma_error)
+            )
         self.__presentation.print_pragma_failure(scan_file, line_number, pragma_error)
         self.number_of_pragma_failures += 1
 
+    def reset_failure_counts(self) -> None:
+        """
+        Reset the failure counts, allowing the plugins to be used for another run
+        without being initialized again.
+        """
+        self.number_of_scan_failures, self.number_of_pragma_failures = 0, 0
+
+    def start_recording_results(self) -> None:
+        """
+        Start recording any scan failures and pragma failures that are logged, in
+        the order that they are logged.
+        """
+        self.__recorded_results = []
+
+    def stop_recording_results(
+        self,
+    ) -> List[Union[PluginScanFailure, PragmaFailureRecord]]:
+        """
+        Stop recording and return any results recorded since recording was started.
+        """
+        recorded_results = self.__recorded_results or []
+        self.__recorded_results = None
+        return recorded_results
+
+    def replay_recorded_results(
+        self, recorded_results: List[Union[PluginScanFailure, PragmaFailureRecord]]
+    ) -> None:
+        """
+        Log a set of previously recorded results as if they were just produced.  As
+        the recorded scan failures already passed any pragma checks when they were
+        recorded, any pragmas from a previous file are cleared first.
+        """
+        self.__reset_pragmas()
+        for next_result in recorded_results:
+            if isinstance(next_result, PragmaFailureRecord):
+                self.log_pragma_failure(
+                    next_result.scan_file,
+                    next_result.line_number,
+                    next_result.pragma_error,
+                )
+            else:
+                self.log_scan_failure(next_result)
+
+    def __reset_pragmas(self) -> None:
+        self.__document_pragmas = {}
+        self.__document_pragma_ranges = []
+        self.__general_pragma_ranges = []
+        self.__pragma_line_numbers = []
+        self.__suppression_range_index.clear()
+
     def compile_pragmas(self, scan_file: str, pragma_lines: Dict[int, str]) -> None:
         """
         Go through the list of extracted pragmas and compile them.
@@ -467,6 +589,9 @@ class PluginManager:
                 self.__pragma_line_numbers,
             )
         PragmaExtension.end(active_general_pragmas, self.__general_pragma_ranges)
+        self.__suppression_range_index.build(
+            self.__document_pragma_ranges, self.__general_pragma_ranges
+        )
 
     @property
     def enabled_plugins(self) -> List[FoundPlugin]:
@@ -668,6 +793,7 @@ class PluginManager:
                 class_name=type(plugin_instance).__name__, field_name=field_name
             )
 
+    # pylint: disable=too-many-locals
     def __get_plugin_details(
         self, plugin_instance: RulePlugin, instance_file_name: str
     ) -> FoundPlugin:
@@ -687,6 +813,9 @@ class PluginManager:
             plugin_names,
             plugin_supports_fix,
             plugin_fix_level,
+            plugin_uses_inline_tokens,
+            plugin_token_kinds,
+            plugin_uses_container_tracker,
         ) = self.__unpack_plugin_details(plugin_instance)
 
         self.__verify_string_field(plugin_instance, "plugin_id", plugin_id)
@@ -711,6 +840,18 @@ class PluginManager:
             self.__verify_integer_field(
                 plugin_instance, "plugin_fix_level", plugin_fix_level
             )
+        self.__verify_boolean_field(
+            plugin_instance, "plugin_uses_inline_tokens", plugin_uses_inline_tokens
+        )
+        if plugin_token_kinds is not None:
+            self.__verify_string_field(
+                plugin_instance, "plugin_token_kinds", plugin_token_kinds
+            )
+        self.__verify_boolean_field(
+            plugin_instance,
+            "plugin_uses_container_tracker",
+            plugin_uses_container_tracker,
+        )
 
         plugin_object = FoundPlugin(
             plugin_id,
@@ -726,16 +867,29 @@ class PluginManager:
             plugin_supports_fix,
             plugin_fix_level,
             [plugin_id, *plugin_names],
+            plugin_uses_inline_tokens,
+            (
+                None
+                if plugin_token_kinds is None
+                else {
+                    next_kind.strip()
+                    for next_kind in plugin_token_kinds.split(",")
+                    if next_kind.strip()
+                }
+            ),
+            plugin_uses_container_tracker,
         )
 
-        if plugin_object.plugin_interface_version not in (1, 2, 3):
+        if plugin_object.plugin_interface_version not in (1, 2, 3, 4):
             raise BadPluginError(
                 formatted_message=f"Plugin '{instance_file_name}' with an interface version "
-                + f"('{plugin_object.plugin_interface_version}') that is not '1', '2', or '3'."
+                + f"('{plugin_object.plugin_interface_version}') that is not '1', '2', '3', or '4'."
             )
 
         return plugin_object
 
+    # pylint: enable=too-many-locals
+
     # pylint: disable=too-many-locals
     def __unpack_plugin_details(self, plugin_instance: RulePlugin) -> Tuple[
         str,
@@ -749,11 +903,17 @@ class PluginManager:
         List[str],
         bool,
         int,
+        bool,
+        Optional[str],
+        bool,
     ]:
         try:
             instance_details = plugin_instance.get_details()
             plugin_supports_fix = False
             plugin_fix_level = -1
+            plugin_uses_inline_tokens = True
+            plugin_token_kinds = None
+            plugin_uses_container_tracker = False
             (
                 plugin_id,
                 plugin_name,
@@ -779,6 +939,19 @@ class PluginManager:
             ):
                 plugin_supports_fix = instance_details.plugin_supports_fix
                 plugin_fix_level = instance_details.plugin_fix_level
+            if (
+                isinstance(instance_details, PluginDetailsV3)
+                and plugin_interface_version >= 3
+            ):
+                plugin_uses_inline_tokens = instance_details.plugin_uses_inline_tokens
+            if (
+                isinstance(instance_details, PluginDetailsV4)
+                and plugin_interface_version >= 4
+            ):
+                plugin_token_kinds = instance_details.plugin_token_kinds
+                plugin_uses_container_tracker = (
+                    instance_details.plugin_uses_container_tracker
+                )
         except Exception as this_exception:
             raise BadPluginError(
                 class_name=type(plugin_instance).__name__,
@@ -803,6 +976,9 @@ class PluginManager:
             plugin_names,
             plugin_supports_fix,
             plugin_fix_level,
+            plugin_uses_inline_tokens,
+            plugin_token_kinds,
+            plugin_uses_container_tracker,
         )
 
     # pylint: enable=too-many-locals
@@ -998,14 +1174,36 @@ class PluginManager:
                 cause=this_exception,
             ) from this_exception
 
-        if next_plugin.plugin_instance.is_next_token_implemented_in_plugin:
-            self.__enabled_plugins_for_next_token.append(next_plugin)
+        dispatch_plugin = (
+            self.__rule_profiler.wrap_plugin(next_plugin)
+            if self.__rule_profiler
+            else next_plugin
+        )
+        if next_plugin.plugin_instance.is_scan_tokens_implemented_in_plugin:
+            self.__enabled_plugins_for_scan_tokens.append(dispatch_plugin)
+            if next_plugin.plugin_uses_inline_tokens:
+                self.__is_inline_pass_required = True
+        elif next_plugin.plugin_instance.is_next_token_implemented_in_plugin:
+            self.__enabled_plugins_for_next_token.append(dispatch_plugin)
+            if next_plugin.plugin_uses_inline_tokens:
+                self.__is_inline_pass_required = True
+            if (
+                next_plugin.plugin_uses_container_tracker
+                and not self.__container_token_manager
+            ):
+                self.__container_token_manager = ContainerTokenManager()
         if next_plugin.plugin_instance.is_next_line_implemented_in_plugin:
-            self.__enabled_plugins_for_next_line.append(next_plugin)
+            self.__enabled_plugins_for_next_line.append(dispatch_plugin)
+            if not next_plugin.plugin_instance.is_scan_lines_implemented_in_plugin:
+                self.__enabled_plugins_for_next_line_while_scanning.append(
+                    dispatch_plugin
+                )
+        if next_plugin.plugin_instance.is_scan_lines_implemented_in_plugin:
+            self.__enabled_plugins_for_scan_lines.append(dispatch_plugin)
         if next_plugin.plugin_instance.is_completed_file_implemented_in_plugin:
-            self.__enabled_plugins_for_completed_file.append(next_plugin)
+            self.__enabled_plugins_for_completed_file.append(dispatch_plugin)
         if next_plugin.plugin_instance.is_starting_new_file_implemented_in_plugin:
-            self.__enabled_plugins_for_starting_new_file.append(next_plugin)
+            self.__enabled_plugins_for_starting_new_file.append(dispatch_plugin)
 
     def apply_configuration(
         self, properties: ApplicationProperties, use_full_list: bool = False
@@ -1017,15 +1215,122 @@ class PluginManager:
         (
             self.__enabled_plugins_for_starting_new_file,
             self.__enabled_plugins_for_next_token,
+            self.__enabled_plugins_for_scan_tokens,
             self.__enabled_plugins_for_next_line,
+            self.__enabled_plugins_for_next_line_while_scanning,
+            self.__enabled_plugins_for_scan_lines,
             self.__enabled_plugins_for_completed_file,
-        ) = ([], [], [], [])
+        ) = ([], [], [], [], [], [], [])
+        self.__is_inline_pass_required = False
+        self.__container_token_manager = None
 
         proper_list = (
             self.__registered_plugins if use_full_list else self.__enabled_plugins
         )
         for next_plugin in proper_list:
             self.__apply_configuration(next_plugin, properties)
+        self.__build_token_dispatch_table()
+
+    def __build_token_dispatch_table(self) -> None:
+        """
+        Build a table of which enabled plugins want to be informed of each kind of
+        token, keeping the plugins in the order that they were enabled in.  A
+        plugin that declares its token kinds is also informed of the end tokens of
+        those kinds.  Any token whose name is not in the table is only sent to the
+        plugins that do not declare any token kinds.
+
+        Plugins that are sent all the tokens of a file at once are only sent the
+        tokens of the kinds that they declare, and their end tokens.
+        """
+        self.__scan_token_names = {
+            next_plugin.plugin_id: {
+                next_token_name
+                for next_kind in next_plugin.plugin_token_kinds
+                for next_token_name in (
+                    next_kind,
+                    EndMarkdownToken.calculate_token_name(next_kind),
+                )
+            }
+            for next_plugin in self.__enabled_plugins_for_scan_tokens
+            if next_plugin.plugin_token_kinds is not None
+        }
+
+        self.__enabled_plugins_for_any_token = [
+            next_plugin
+            for next_plugin in self.__enabled_plugins_for_next_token
+            if next_plugin.plugin_token_kinds is None
+        ]
+
+        declared_token_names: Dict[str, str] = {}
+        for next_plugin in self.__enabled_plugins_for_next_token:
+            for next_kind in next_plugin.plugin_token_kinds or set():
+                declared_token_names[next_kind] = next_kind
+                declared_token_names[
+                    EndMarkdownToken.calculate_token_name(next_kind)
+                ] = next_kind
+
+        self.__enabled_plugins_for_token_name = {
+            next_token_name: [
+                next_plugin
+                for next_plugin in self.__enabled_plugins_for_next_token
+                if next_plugin.plugin_token_kinds is None
+                or next_kind in next_plugin.plugin_token_kinds
+            ]
+            for next_token_name, next_kind in declared_token_names.items()
+        }
+
+    def enable_rule_profiling(self) -> None:
+        """
+        Time each call to the enabled plugins from the next time that the
+        configuration is applied.  When profiling is not enabled, the plugins are
+        called directly, without any cost for timing them.
+        """
+        self.__rule_profiler = RuleProfiler()
+
+    @property
+    def rule_profiler(self) -> Optional[RuleProfiler]:
+        """
+        Profiler keeping track of the time spent in each plugin, if enabled.
+        """
+        return self.__rule_profiler
+
+    @property
+    def container_token_manager(self) -> ContainerTokenManager:
+        """
+        Container tracker shared by the enabled plugins that asked for it, kept
+        up to date with the token being sent to their `next_token` functions.
+        """
+        assert (
+            self.__container_token_manager is not None
+        ), "No enabled plugin asked for the container tracker."
+        return self.__container_token_manager
+
+    @property
+    def is_inline_pass_required(self) -> bool:
+        """
+        Whether any enabled plugin needs the inline tokens of a document.  If not,
+        a scan only needs the tokens produced by the block pass.
+        """
+        return self.__is_inline_pass_required
+
+    @property
+    def is_line_pass_required(self) -> bool:
+        """
+        Whether any enabled plugin needs to be called for each line of a document,
+        or to be sent all the lines of a document at once.
+        """
+        return bool(
+            self.__enabled_plugins_for_next_line
+            or self.__enabled_plugins_for_scan_lines
+        )
+
+    @property
+    def is_scan_lines_required(self) -> bool:
+        """
+        Whether any enabled plugin needs to be sent all the lines of a document at
+        once, along with the facts about each line, when scanning.
+        """
+        return bool(self.__enabled_plugins_for_scan_lines)
 
     # pylint: disable=too-many-arguments
     def __check_for_skip_of_plugin(
@@ -1060,7 +1365,7 @@ class PluginManager:
         actual_tokens: List[MarkdownToken],
         per_file_disabled_identifiers: Optional[Set[str]],
         fix_mode: bool = False,
-        temp_output: Optional[TextIOWrapper] = None,
+        line_sink: Optional[List[str]] = None,
         fix_token_map: Optional[Dict[MarkdownToken, List[FixTokenRecord]]] = None,
         constraint_id_list: Optional[List[str]] = None,
         replace_tokens_list: Optional[List[ReplaceTokensRecord]] = None,
@@ -1068,10 +1373,11 @@ class PluginManager:
         """
         Inform any listeners that a new current file has been started.
         """
-        self.__document_pragmas = {}
-        self.__document_pragma_ranges = []
-        self.__general_pragma_ranges = []
-        self.__pragma_line_numbers = []
+        self.__reset_pragmas()
+        if self.__rule_profiler:
+            self.__rule_profiler.start_file(file_being_started)
+        if self.__container_token_manager:
+            self.__container_token_manager.clear()
 
         for next_plugin in self.__enabled_plugins_for_starting_new_file:
             skip_plugin, _ = self.__check_for_skip_of_plugin(
@@ -1097,7 +1403,7 @@ class PluginManager:
             file_being_started,
             actual_tokens,
             fix_mode,
-            temp_output,
+            line_sink,
             fix_token_map,
             replace_tokens_list,
         )
@@ -1137,7 +1443,7 @@ class PluginManager:
                     "\t", "\\t"
                 )
                 print(f"cf-ltw:{replaced_line}:")
-            context.file_output.write(current_fix_line)
+            context.line_sink.append(current_fix_line)
 
             assert line_append_record is not None
             context.add_fix_line_record(line_append_record)
@@ -1229,7 +1535,7 @@ class PluginManager:
         if self.__show_fix_debug:
             replaced_line = line_to_write.replace("\n", "\\n").replace("\t", "\\t")
             print(f"nl-ltw:{replaced_line}:")
-        context.file_output.write(line_to_write)
+        context.line_sink.append(line_to_write)
         if was_line_fixed:
             context.set_last_line_fixed(line_to_write)
 
@@ -1274,7 +1580,11 @@ class PluginManager:
         Inform any listeners that a new line has been loaded.
         """
         context.line_number = line_number
-        for next_plugin in self.__enabled_plugins_for_next_line:
+        for next_plugin in (
+            self.__enabled_plugins_for_next_line
+            if context.in_fix_mode
+            else self.__enabled_plugins_for_next_line_while_scanning
+        ):
             skip_plugin, temp_context = self.__check_for_skip_of_plugin(
                 next_plugin, context_map, context, None, per_file_disabled_identifiers
             )
@@ -1320,7 +1630,11 @@ class PluginManager:
         """
         Inform any listeners of a new token that has been processed.
         """
-        for next_plugin in self.__enabled_plugins_for_next_token:
+        if self.__container_token_manager:
+            self.__container_token_manager.premanage_container_tokens(token)
+        for next_plugin in self.__enabled_plugins_for_token_name.get(
+            token.token_name, self.__enabled_plugins_for_any_token
+        ):
             skip_plugin, temp_context = self.__check_for_skip_of_plugin(
                 next_plugin, context_map, context, None, per_file_disabled_identifiers
             )
@@ -1343,6 +1657,73 @@ class PluginManager:
                     actual_token=actual_token,
                     cause=this_exception,
                 ) from this_exception
+        if self.__container_token_manager:
+            self.__container_token_manager.manage_container_tokens(token)
+
+    def scan_tokens(
+        self,
+        context: PluginScanContext,
+        tokens: List[MarkdownToken],
+        per_file_disabled_identifiers: Optional[Set[str]],
+        context_map: Optional[Dict[str, PluginScanContext]] = None,
+    ) -> None:
+        """
+        Inform any listeners that process all the tokens of a file at once of
+        those tokens.
+        """
+        for next_plugin in self.__enabled_plugins_for_scan_tokens:
+            skip_plugin, temp_context = self.__check_for_skip_of_plugin(
+                next_plugin, context_map, context, None, per_file_disabled_identifiers
+            )
+            if skip_plugin:
+                continue
+            # Was not None on the way in, so should not be None now.
+            assert temp_context is not None
+            context = temp_context
+
+            token_names = self.__scan_token_names.get(next_plugin.plugin_id)
+            if token_names is not None:
+                plugin_tokens = [
+                    next_token
+                    for next_token in tokens
+                    if next_token.token_name in token_names
+                ]
+            else:
+                plugin_tokens = tokens
+            try:
+                next_plugin.plugin_instance.scan_tokens(context, plugin_tokens)
+            except Exception as this_exception:
+                raise BadPluginError(
+                    next_plugin.plugin_id,
+                    inspect.stack()[0].function,
+                    cause=this_exception,
+                ) from this_exception
+
+    def scan_lines(
+        self,
+        context: PluginScanContext,
+        lines: List[LineFacts],
+        per_file_disabled_identifiers: Optional[Set[str]],
+    ) -> None:
+        """
+        Inform any listeners that scan all the lines of a file at once of those
+        lines, along with the facts about each line.
+        """
+        for next_plugin in self.__enabled_plugins_for_scan_lines:
+            skip_plugin, _ = self.__check_for_skip_of_plugin(
+                next_plugin, None, context, None, per_file_disabled_identifiers
+            )
+            if skip_plugin:
+                continue
+
+            try:
+                next_plugin.plugin_instance.scan_lines(context, lines)
+            except Exception as this_exception:
+                raise BadPluginError(
+                    next_plugin.plugin_id,
+                    inspect.stack()[0].function,
+                    cause=this_exception,
+                ) from this_exception
 
 
-# pylint: enable=too-many-instance-attributes
+# pylint: enable=too-many-instance-attributes,too-many-public-methods
@@ -4,24 +4,27 @@ Module to provide context when reporting any errors.
 
 from __future__ import annotations
 
-from io import TextIOWrapper
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union, cast
 
 from typing_extensions import override
 
 from pymarkdown.plugin_manager.bad_plugin_error import BadPluginError
 from pymarkdown.plugin_manager.fix_line_record import FixLineRecord
 from pymarkdown.plugin_manager.fix_token_record import FixTokenRecord
+from pymarkdown.plugin_manager.heading_outline_entry import HeadingOutlineEntry
 from pymarkdown.plugin_manager.plugin_modify_context import PluginModifyContext
 from pymarkdown.plugin_manager.plugin_scan_failure import PluginScanFailure
 from pymarkdown.plugin_manager.replace_tokens_record import ReplaceTokensRecord
-from pymarkdown.tokens.markdown_token import MarkdownToken
+from pymarkdown.tokens.atx_heading_markdown_token import AtxHeadingMarkdownToken
+from pymarkdown.tokens.markdown_token import EndMarkdownToken, MarkdownToken
+from pymarkdown.tokens.setext_heading_markdown_token import SetextHeadingMarkdownToken
 
 if TYPE_CHECKING:  # pragma: no cover
     from pymarkdown.plugin_manager.plugin_manager import PluginManager
+    from pymarkdown.plugins.utils.container_token_manager import ContainerTokenManager
 
 
-# pylint: disable=too-many-instance-attributes
+# pylint: disable=too-many-instance-attributes,too-many-public-methods
 class PluginScanContext(PluginModifyContext):
     """
     Class to provide context when reporting any errors.
@@ -34,7 +37,7 @@ class PluginScanContext(PluginModifyContext):
         scan_file: str,
         actual_tokens: List[MarkdownToken],
         fix_mode: bool,
-        file_output: Optional[TextIOWrapper],
+        line_sink: Optional[List[str]],
         fix_token_map: Optional[Dict[MarkdownToken, List[FixTokenRecord]]],
         replace_tokens_list: Optional[List[ReplaceTokensRecord]],
     ):
@@ -47,14 +50,18 @@ class PluginScanContext(PluginModifyContext):
             0,
         )
         self.__reported: List[PluginScanFailure] = []
+        self.__pending_failure_count = 0
         self.__in_fix_mode = fix_mode
         self.__current_fix_line: Optional[str] = None
         self.__last_line_fixed: Optional[str] = None
         self.__line_change_record: List[FixLineRecord] = []
-        self.__file_output = file_output
+        self.__line_sink = line_sink
         self.__fix_token_map = fix_token_map
         self.__replace_token_list = replace_tokens_list
         self.__actual_tokens = actual_tokens
+        self.__heading_outline: Optional[List[HeadingOutlineEntry]] = None
+        self.__token_index_map: Optional[Dict[Tuple[int, int, str], int]] = None
+        self.__prefaced_by_blank_line: Optional[List[bool]] = None
 
     # pylint: enable=too-many-arguments
 
@@ -121,7 +128,7 @@ class PluginScanContext(PluginModifyContext):
         """
         Get an indication of whether the linter is currently doing a line pass.
         """
-        return self.__file_output is not None
+        return self.__line_sink is not None
 
     @property
     @override
@@ -158,12 +165,12 @@ class PluginScanContext(PluginModifyContext):
         self.__current_fix_line = new_line
 
     @property
-    def file_output(self) -> TextIOWrapper:
+    def line_sink(self) -> List[str]:
         """
-        File object to use for writing fix information.
+        In-memory list that each line of the fixed document is appended to.
         """
-        assert self.__file_output
-        return self.__file_output
+        assert self.__line_sink is not None
+        return self.__line_sink
 
     def add_fix_line_record(self, change_record: FixLineRecord) -> None:
         """
@@ -220,51 +227,162 @@ class PluginScanContext(PluginModifyContext):
             is_error_token_prefaced_by_blank_line,
         )
         self.__reported.append(new_entry)
+        if (
+            self.owning_manager.has_failure_budget
+            and not self.owning_manager.is_scan_failure_suppressed(new_entry)
+        ):
+            self.__pending_failure_count += 1
 
     # pylint: enable=too-many-arguments
 
-    def __calc_x_rewind_if_inline(
-        self, index_to_check: int, current_token: MarkdownToken, dd: bool
-    ) -> Tuple[int, MarkdownToken, bool, bool]:
+    @property
+    def is_failure_budget_reached(self) -> bool:
+        """
+        Whether enough scan failures were found that the rest of the file does not
+        need to be scanned.
+        """
+        return self.owning_manager.is_file_failure_budget_reached(
+            self.__pending_failure_count
+        )
+
+    @property
+    def heading_outline(self) -> List[HeadingOutlineEntry]:
+        """
+        Outline of the headings in the document, in the order that they appear.
+        The outline is only built the first time that it is asked for, so every
+        plugin that looks at it shares the cost of building it.
+        """
+        if self.__heading_outline is None:
+            self.__heading_outline = self.__build_heading_outline()
+        return self.__heading_outline
+
+    def __build_heading_outline(self) -> List[HeadingOutlineEntry]:
+        heading_outline: List[HeadingOutlineEntry] = []
+        heading_token: Optional[
+            Union[AtxHeadingMarkdownToken, SetextHeadingMarkdownToken]
+        ] = None
+        contained_tokens: List[MarkdownToken] = []
+        for next_token in self.__actual_tokens:
+            if heading_token is None:
+                if next_token.is_atx_heading:
+                    heading_token = cast(AtxHeadingMarkdownToken, next_token)
+                    contained_tokens = []
+                elif next_token.is_setext_heading:
+                    heading_token = cast(SetextHeadingMarkdownToken, next_token)
+                    contained_tokens = []
+            elif next_token.is_atx_heading_end or next_token.is_setext_heading_end:
+                heading_outline.append(
+                    HeadingOutlineEntry(
+                        heading_token,
+                        cast(EndMarkdownToken, next_token),
+                        contained_tokens,
+                    )
+                )
+                heading_token = None
+            else:
+                contained_tokens.append(next_token)
+        return heading_outline
+
+    @property
+    def container_token_manager(self) -> ContainerTokenManager:
+        """
+        Container tracker shared by the plugins that set their
+        `plugin_uses_container_tracker` field.  It describes the containers that
+        the current token is within, and must not be changed by the plugins.
+        """
+        return self.owning_manager.container_token_manager
+
+    def __calc_x(self, error_token: Optional[MarkdownToken]) -> bool:
+        if error_token is None:
+            return False
+
+        if self.__token_index_map is None:
+            self.__build_prefaced_by_blank_line_table()
+        assert self.__token_index_map is not None
+        assert self.__prefaced_by_blank_line is not None
+
+        # The error token is matched by its position and name, not its identity, as
+        # plugins may report on a copy of the token.
+        token_index = self.__token_index_map.get(
+            (error_token.line_number, error_token.column_number, error_token.token_name)
+        )
+        return token_index is not None and self.__prefaced_by_blank_line[token_index]
+
+    def __build_prefaced_by_blank_line_table(self) -> None:
+        """
+        Build the table of whether each token is prefaced by a blank line in a
+        single pass over the tokens, keeping track of the indices that would
+        otherwise be found by walking backwards from each token that a failure is
+        reported on.
+        """
+        self.__token_index_map = {}
+        self.__prefaced_by_blank_line = []
+        last_text_or_paragraph_index = last_leaf_index = -1
+        last_leaf_indices: List[int] = []
+        list_end_run_starts: List[int] = []
+        for token_index, next_token in enumerate(self.__actual_tokens):
+            self.__token_index_map.setdefault(
+                (
+                    next_token.line_number,
+                    next_token.column_number,
+                    next_token.token_name,
+                ),
+                token_index,
+            )
+            if next_token.is_text or next_token.is_paragraph:
+                last_text_or_paragraph_index = token_index
+            if next_token.is_leaf:
+                last_leaf_index = token_index
+            last_leaf_indices.append(last_leaf_index)
+            list_end_run_starts.append(
+                list_end_run_starts[token_index - 1]
+                if token_index and self.__actual_tokens[token_index - 1].is_list_end
+                else token_index
+            )
+            self.__prefaced_by_blank_line.append(
+                self.__calc_is_prefaced_by_blank_line(
+                    token_index,
+                    last_text_or_paragraph_index,
+                    last_leaf_indices,
+                    list_end_run_starts,
+                )
+            )
+
+    def __calc_is_prefaced_by_blank_line(
+        self,
+        index_to_check: int,
+        last_text_or_paragraph_index: int,
+        last_leaf_indices: List[int],
+        list_end_run_starts: List[int],
+    ) -> bool:
+        current_token = self.__actual_tokens[index_to_check]
+        dd = False
+
         # For an inline, rewind back to the last text token.  If the text token was
         # not on the same line as the inline token, by definition there is text on
-        # the line, so break out of this check.
+        # the line, so it is not prefaced by a blank line.
         #
         # Note that in special cases, such as a link being at the start of a parapgrah,
         # we may not have any text element before the paragraph element.
-        do_break = False
         if (
             not current_token.is_leaf
             and not current_token.is_container
             and not current_token.is_text
         ):
-            while (
-                index_to_check >= 0
-                and not self.__actual_tokens[index_to_check].is_text
-                and not self.__actual_tokens[index_to_check].is_paragraph
-            ):
-                index_to_check -= 1
-            assert index_to_check >= 0
             if (
-                current_token.line_number
-                != self.__actual_tokens[index_to_check].line_number
+                last_text_or_paragraph_index < 0
+                or current_token.line_number
+                != self.__actual_tokens[last_text_or_paragraph_index].line_number
             ):
-                do_break = True
-            else:
-                current_token = self.__actual_tokens[index_to_check]
-                dd = True
-        return index_to_check, current_token, dd, do_break
+                return False
+            index_to_check = last_text_or_paragraph_index
+            current_token = self.__actual_tokens[index_to_check]
+            dd = True
 
-    def __calc_x_rewind_if_text(
-        self, index_to_check: int, current_token: MarkdownToken, dd: bool
-    ) -> Tuple[int, MarkdownToken, bool]:
+        # Text blocks can only occur within leaf elements, so work backwards until
+        # we hit a leaf element.
         if current_token.is_text:
-            # Text blocks can only occur within leaf elements, so work backwards until
-            # we hit a leaf element.
-            while (
-                index_to_check >= 0 and not self.__actual_tokens[index_to_check].is_leaf
-            ):
-                index_to_check -= 1
+            index_to_check = last_leaf_indices[index_to_check]
             if index_to_check > 0:
                 index_to_check -= 1
             current_token = self.__actual_tokens[index_to_check]
@@ -273,56 +391,18 @@ class PluginScanContext(PluginModifyContext):
             if index_to_check > 0:
                 index_to_check -= 1
             current_token = self.__actual_tokens[index_to_check]
-        return index_to_check, current_token, dd
-
-    def __calc_x(self, error_token: Optional[MarkdownToken]) -> bool:
-        if error_token is None:
-            return False
-
-        is_error_token_prefaced_by_blank_line = False
-        for i, j in enumerate(self.__actual_tokens):  # pragma: no cover
-            if not (
-                j.line_number == error_token.line_number
-                and j.column_number == error_token.column_number
-                and j.token_name == error_token.token_name
-            ):
-                continue
-
-            index_to_check = i
-            current_token = error_token
-            dd = False
-
-            index_to_check, current_token, dd, do_break = (
-                self.__calc_x_rewind_if_inline(index_to_check, current_token, dd)
-            )
-            if do_break:
-                break
-
-            index_to_check, current_token, dd = self.__calc_x_rewind_if_text(
-                index_to_check, current_token, dd
-            )
 
-            # Lists can have trailing
-            if current_token.is_list_start:
-                while (
-                    index_to_check >= 0
-                    and self.__actual_tokens[index_to_check - 1].is_list_end
-                ):
-                    index_to_check -= 1
-                    # should we be doing this more generally? i.e. list closing and opening a fcb... ?
-                    # assert False  -- check to see if we need is_list_end or is_block_quote_end
-                if index_to_check > 0:
-                    index_to_check -= 1
-                current_token = self.__actual_tokens[index_to_check]
-                dd = True
-            assert index_to_check >= 0
-            if not dd and index_to_check > 0:
+        # Lists can have trailing
+        if current_token.is_list_start:
+            index_to_check = list_end_run_starts[index_to_check]
+            if index_to_check > 0:
                 index_to_check -= 1
-            is_error_token_prefaced_by_blank_line = self.__actual_tokens[
-                index_to_check
-            ].is_blank_line
-            break
-        return is_error_token_prefaced_by_blank_line
+            dd = True
+        if index_to_check < 0:
+            return False
+        if not dd and index_to_check > 0:
+            index_to_check -= 1
+        return self.__actual_tokens[index_to_check].is_blank_line
 
     def report_on_triggered_rules(self) -> None:
         """
@@ -332,6 +412,7 @@ class PluginScanContext(PluginModifyContext):
         for next_entry in sorted(self.__reported):
             self.owning_manager.log_scan_failure(next_entry)
         self.__reported.clear()
+        self.__pending_failure_count = 0
 
     def get_triggered_rules(self) -> Set[str]:
         """
@@ -357,4 +438,4 @@ class PluginScanContext(PluginModifyContext):
         return pragma_offset
 
 
-# pylint: enable=too-many-instance-attributes
+# pylint: enable=too-many-instance-attributes,too-many-public-methods
@@ -0,0 +1,16 @@
+"""
+Module to hold information regarding a pragma that failed to compile.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PragmaFailureRecord:
+    """
+    Class to hold information regarding a pragma that failed to compile.
+    """
+
+    scan_file: str
+    line_number: int
+    pragma_error: str
@@ -8,6 +8,7 @@ from typing import List, Optional, Union, cast
 from application_properties import ApplicationPropertiesFacade
 
 from pymarkdown.my_application_properties_facade import MyApplicationPropertiesFacade
+from pymarkdown.plugin_manager.line_facts import LineFacts
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetails,
     PluginDetailsV2,
@@ -35,7 +36,9 @@ class RulePlugin(ABC):
             self.__is_starting_new_file_implemented_in_plugin,
             self.__is_completed_file_implemented_in_plugin,
             self.__is_query_config_implemented_in_plugin,
-        ) = (True, True, True, True, False)
+            self.__is_scan_tokens_implemented_in_plugin,
+            self.__is_scan_lines_implemented_in_plugin,
+        ) = (True, True, True, True, False, False, False)
         self.__plugin_specific_facade: Optional[MyApplicationPropertiesFacade] = None
 
     @abstractmethod
@@ -77,6 +80,12 @@ class RulePlugin(ABC):
         self.__is_completed_file_implemented_in_plugin = (
             "completed_file" in self.__class__.__dict__
         )
+        self.__is_scan_tokens_implemented_in_plugin = (
+            "scan_tokens" in self.__class__.__dict__
+        )
+        self.__is_scan_lines_implemented_in_plugin = (
+            "scan_lines" in self.__class__.__dict__
+        )
 
     @property
     def is_query_config_implemented_in_plugin(self) -> bool:
@@ -113,6 +122,20 @@ class RulePlugin(ABC):
         """
         return self.__is_completed_file_implemented_in_plugin
 
+    @property
+    def is_scan_tokens_implemented_in_plugin(self) -> bool:
+        """
+        Return whether the scan_tokens function is implemented in the plugin.
+        """
+        return self.__is_scan_tokens_implemented_in_plugin
+
+    @property
+    def is_scan_lines_implemented_in_plugin(self) -> bool:
+        """
+        Return whether the scan_lines function is implemented in the plugin.
+        """
+        return self.__is_scan_lines_implemented_in_plugin
+
     # pylint: disable=too-many-arguments
     def register_fix_token_request(
         self,
@@ -176,6 +199,33 @@ class RulePlugin(ABC):
 
     # pylint: enable=too-many-arguments
 
+    def report_line_error(
+        self,
+        context: PluginScanContext,
+        line_facts: LineFacts,
+        column_number: int,
+        extra_error_information: Optional[str] = None,
+    ) -> None:
+        """
+        Report an error with one of the lines passed to the scan_lines function.
+        """
+        does_support_fix = False
+        plugin_details = self.get_details()
+        if isinstance(plugin_details, PluginDetailsV2):
+            does_support_fix = plugin_details.plugin_supports_fix
+
+        context.add_triggered_rule(
+            context.scan_file,
+            line_facts.line_number,
+            column_number,
+            plugin_details.plugin_id,
+            plugin_details.plugin_name,
+            plugin_details.plugin_description,
+            extra_error_information,
+            does_support_fix,
+            override_is_error_token_prefaced_by_blank_line=line_facts.is_prefaced_by_blank_line,
+        )
+
     # pylint: disable=too-many-arguments
     def report_next_token_error(
         self,
@@ -256,3 +306,20 @@ class RulePlugin(ABC):
         """
         Event that a new token is being processed.
         """
+
+    def scan_tokens(  # noqa: B027
+        self, context: PluginScanContext, tokens: List[MarkdownToken]
+    ) -> None:
+        """
+        Event that all the tokens of a file are being processed at once.  If this
+        function is implemented, the next_token function is not called.
+        """
+
+    def scan_lines(  # noqa: B027
+        self, context: PluginScanContext, lines: List[LineFacts]
+    ) -> None:
+        """
+        Event that all the lines of a file are being scanned at once, along with
+        the facts about each line.  If this function is implemented, the next_line
+        function is only called when fixing a file.
+        """
@@ -0,0 +1,21 @@
+"""
+Module to hold the time spent in one of the callbacks of a rule plugin.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class RuleProfile:
+    """
+    Class to hold the time spent in one of the callbacks of a rule plugin, along
+    with the file that the callback spent the most time on.
+    """
+
+    plugin_id: str
+    callback_name: str
+    call_count: int
+    total_nanoseconds: int
+    slowest_file: Optional[str]
+    slowest_file_nanoseconds: int
@@ -0,0 +1,198 @@
+"""
+Module to keep track of the time spent in each of the callbacks of the rule plugins.
+"""
+
+import dataclasses
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from pymarkdown.plugin_manager.found_plugin import FoundPlugin
+from pymarkdown.plugin_manager.line_facts import LineFacts
+from pymarkdown.plugin_manager.plugin_details import PluginDetails
+from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
+from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+from pymarkdown.plugin_manager.rule_profile import RuleProfile
+from pymarkdown.tokens.markdown_token import MarkdownToken
+
+
+@dataclass
+class _CallbackStatistics:
+    """
+    Class to accumulate the time spent in one callback of one rule plugin.
+    """
+
+    call_count: int = 0
+    total_nanoseconds: int = 0
+    current_file_nanoseconds: int = 0
+    slowest_file_nanoseconds: int = 0
+    slowest_file: Optional[str] = None
+
+
+class RuleProfiler:
+    """
+    Class to keep track of the time spent in each of the callbacks of the rule
+    plugins.  Instead of checking whether profiling is enabled for every call,
+    the plugin manager dispatches to wrapped plugins that time each call.
+    """
+
+    def __init__(self) -> None:
+        self.__current_file: Optional[str] = None
+        self.__statistics: Dict[Tuple[str, str], _CallbackStatistics] = {}
+
+    def wrap_plugin(self, found_plugin: FoundPlugin) -> FoundPlugin:
+        """
+        Create a copy of the found plugin whose callbacks are timed.
+        """
+        return dataclasses.replace(
+            found_plugin,
+            plugin_instance=_ProfiledRulePlugin(
+                found_plugin.plugin_instance, found_plugin.plugin_id, self
+            ),
+        )
+
+    def start_file(self, file_being_started: str) -> None:
+        """
+        Start timing the callbacks for a new file.
+        """
+        self.__complete_current_file()
+        self.__current_file = file_being_started
+
+    def record_call(
+        self, plugin_id: str, callback_name: str, elapsed_nanoseconds: int
+    ) -> None:
+        """
+        Record the time spent in a single call to a callback.
+        """
+        statistics_key = (plugin_id, callback_name)
+        if not (callback_statistics := self.__statistics.get(statistics_key)):
+            callback_statistics = _CallbackStatistics()
+            self.__statistics[statistics_key] = callback_statistics
+        callback_statistics.call_count += 1
+        callback_statistics.total_nanoseconds += elapsed_nanoseconds
+        callback_statistics.current_file_nanoseconds += elapsed_nanoseconds
+
+    def collect_profiles(self) -> List[RuleProfile]:
+        """
+        Collect the time spent in each callback since the profiles were last
+        collected, ordered from the most time spent to the least.
+        """
+        self.__complete_current_file()
+        self.__current_file = None
+
+        rule_profiles = [
+            RuleProfile(
+                plugin_id,
+                callback_name,
+                callback_statistics.call_count,
+                callback_statistics.total_nanoseconds,
+                callback_statistics.slowest_file,
+                callback_statistics.slowest_file_nanoseconds,
+            )
+            for (
+                plugin_id,
+                callback_name,
+            ), callback_statistics in self.__statistics.items()
+        ]
+        self.__statistics = {}
+        return sorted(
+            rule_profiles,
+            key=lambda x: (-x.total_nanoseconds, x.plugin_id, x.callback_name),
+        )
+
+    def __complete_current_file(self) -> None:
+        for callback_statistics in self.__statistics.values():
+            if (
+                callback_statistics.current_file_nanoseconds
+                > callback_statistics.slowest_file_nanoseconds
+            ):
+                callback_statistics.slowest_file_nanoseconds = (
+                    callback_statistics.current_file_nanoseconds
+                )
+                callback_statistics.slowest_file = self.__current_file
+            callback_statistics.current_file_nanoseconds = 0
+
+
+class _ProfiledRulePlugin(RulePlugin):
+    """
+    Class to time each call to the callbacks of a rule plugin, passing the call
+    on to the rule plugin itself.
+    """
+
+    def __init__(
+        self, plugin_instance: RulePlugin, plugin_id: str, rule_profiler: RuleProfiler
+    ) -> None:
+        super().__init__()
+        self.__plugin_instance = plugin_instance
+        self.__plugin_id = plugin_id
+        self.__rule_profiler = rule_profiler
+
+    def get_details(self) -> PluginDetails:
+        """
+        Get the details for the plugin.
+        """
+        return self.__plugin_instance.get_details()
+
+    def starting_new_file(self) -> None:
+        """
+        Event that a new file to be scanned is starting.
+        """
+        start_time = time.perf_counter_ns()
+        self.__plugin_instance.starting_new_file()
+        self.__rule_profiler.record_call(
+            self.__plugin_id,
+            "starting_new_file",
+            time.perf_counter_ns() - start_time,
+        )
+
+    def completed_file(self, context: PluginScanContext) -> None:
+        """
+        Event that the file being currently scanned is now completed.
+        """
+        start_time = time.perf_counter_ns()
+        self.__plugin_instance.completed_file(context)
+        self.__rule_profiler.record_call(
+            self.__plugin_id, "completed_file", time.perf_counter_ns() - start_time
+        )
+
+    def next_line(self, context: PluginScanContext, line: str) -> None:
+        """
+        Event that a new line is being processed.
+        """
+        start_time = time.perf_counter_ns()
+        self.__plugin_instance.next_line(context, line)
+        self.__rule_profiler.record_call(
+            self.__plugin_id, "next_line", time.perf_counter_ns() - start_time
+        )
+
+    def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
+        """
+        Event that a new token is being processed.
+        """
+        start_time = time.perf_counter_ns()
+        self.__plugin_instance.next_token(context, token)
+        self.__rule_profiler.record_call(
+            self.__plugin_id, "next_token", time.perf_counter_ns() - start_time
+        )
+
+    def scan_tokens(
+        self, context: PluginScanContext, tokens: List[MarkdownToken]
+    ) -> None:
+        """
+        Event that all the tokens of a file are being processed at once.
+        """
+        start_time = time.perf_counter_ns()
+        self.__plugin_instance.scan_tokens(context, tokens)
+        self.__rule_profiler.record_call(
+            self.__plugin_id, "scan_tokens", time.perf_counter_ns() - start_time
+        )
+
+    def scan_lines(self, context: PluginScanContext, lines: List[LineFacts]) -> None:
+        """
+        Event that all the lines of a file are being scanned at once.
+        """
+        start_time = time.perf_counter_ns()
+        self.__plugin_instance.scan_lines(context, lines)
+        self.__rule_profiler.record_call(
+            self.__plugin_id, "scan_lines", time.perf_counter_ns() - start_time
+        )
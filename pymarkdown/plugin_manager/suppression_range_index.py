@@ -0,0 +1,66 @@
+"""
+Module to provide an index of the line ranges where each rule is suppressed.
+"""
+
+import bisect
+from typing import Dict, List, Set, Tuple
+
+
+class SuppressionRangeIndex:
+    """
+    Class to provide an index of the line ranges where each rule is suppressed
+    by pragmas.  The ranges for each rule id are merged into sorted, disjoint
+    ranges, so that determining whether a line is suppressed is a binary search
+    instead of a walk through every range in the document.
+    """
+
+    def __init__(self) -> None:
+        self.__range_starts: Dict[str, List[int]] = {}
+        self.__range_ends: Dict[str, List[int]] = {}
+
+    def clear(self) -> None:
+        """
+        Remove any ranges from a previous document.
+        """
+        self.__range_starts = {}
+        self.__range_ends = {}
+
+    def build(
+        self,
+        document_pragma_ranges: List[Tuple[int, int, Set[str]]],
+        general_pragma_ranges: List[Tuple[int, int, str]],
+    ) -> None:
+        """
+        Build the index from the ranges compiled from the pragmas in a document.
+        """
+        ranges_by_rule_id: Dict[str, List[Tuple[int, int]]] = {}
+        for start_line, end_line, rule_ids in document_pragma_ranges:
+            for rule_id in rule_ids:
+                ranges_by_rule_id.setdefault(rule_id, []).append((start_line, end_line))
+        for start_line, end_line, rule_id in general_pragma_ranges:
+            ranges_by_rule_id.setdefault(rule_id, []).append((start_line, end_line))
+
+        self.clear()
+        for rule_id, rule_ranges in ranges_by_rule_id.items():
+            range_starts: List[int] = []
+            range_ends: List[int] = []
+            for start_line, end_line in sorted(rule_ranges):
+                if range_ends and start_line <= range_ends[-1] + 1:
+                    range_ends[-1] = max(range_ends[-1], end_line)
+                else:
+                    range_starts.append(start_line)
+                    range_ends.append(end_line)
+            self.__range_starts[rule_id] = range_starts
+            self.__range_ends[rule_id] = range_ends
+
+    def is_line_suppressed(self, rule_id: str, line_number: int) -> bool:
+        """
+        Determine whether the specified line is within any of the ranges where the
+        rule is suppressed.
+        """
+        if not (range_starts := self.__range_starts.get(rule_id)):
+            return False
+        range_index = bisect.bisect_right(range_starts, line_number) - 1
+        return (
+            range_index >= 0 and line_number <= self.__range_ends[rule_id][range_index]
+        )
@@ -8,7 +8,7 @@ from typing import List, cast
 from pymarkdown.extensions.front_matter_markdown_token import FrontMatterMarkdownToken
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetailsV2,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
@@ -35,7 +35,7 @@ class RuleMd001(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="heading-increment,header-increment",
             plugin_id="MD001",
             plugin_enabled_by_default=True,
@@ -44,6 +44,8 @@ class RuleMd001(RulePlugin):
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md001.md",
             plugin_configuration="front_matter_title",
             plugin_supports_fix=True,
+            plugin_uses_inline_tokens=False,
+            plugin_token_kinds="atx,setext,front-matter",
         )
 
     def initialize_from_config(self) -> None:
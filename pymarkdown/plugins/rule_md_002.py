@@ -7,7 +7,7 @@ from typing import List, cast
 
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetails,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
@@ -34,7 +34,7 @@ class RuleMd002(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="first-heading-h1,first-header-h1",
             plugin_id="MD002",
             plugin_enabled_by_default=False,
@@ -42,6 +42,8 @@ class RuleMd002(RulePlugin):
             plugin_version="0.6.1",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md002.md",
             plugin_configuration="level",
+            plugin_uses_inline_tokens=False,
+            plugin_token_kinds="atx,setext",
         )
 
     @classmethod
@@ -7,7 +7,7 @@ from typing import List, Tuple, cast
 
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetails,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
@@ -52,7 +52,7 @@ class RuleMd003(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="heading-style,header-style",
             plugin_id="MD003",
             plugin_enabled_by_default=True,
@@ -60,6 +60,8 @@ class RuleMd003(RulePlugin):
             plugin_version="0.6.1",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md003.md",
             plugin_configuration="style",
+            plugin_uses_inline_tokens=False,
+            plugin_token_kinds="atx,setext",
         )
 
     @classmethod
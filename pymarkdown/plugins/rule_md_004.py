@@ -7,7 +7,7 @@ from typing import Dict, List, cast
 
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetailsV2,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
@@ -51,7 +51,7 @@ class RuleMd004(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             # bullet, ul
             plugin_name="ul-style",
             plugin_id="MD004",
@@ -61,6 +61,8 @@ class RuleMd004(RulePlugin):
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md004.md",
             plugin_configuration="style",
             plugin_supports_fix=True,
+            plugin_uses_inline_tokens=False,
+            plugin_token_kinds="ulist",
         )
 
     @classmethod
@@ -596,27 +596,32 @@ class RuleMd005(RulePlugin):
             )
         return newlines_in_text_token
 
-    def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
+    def scan_tokens(
+        self, context: PluginScanContext, tokens: List[MarkdownToken]
+    ) -> None:
         """
-        Event that a new token is being processed.
+        Event that all the tokens of a file are being processed at once.
         """
-        # print(f"token>>{ParserHelper.make_value_visible(token)}")
-        if token.is_unordered_list_start:
-            unordered_list_start_token = cast(UnorderedListStartMarkdownToken, token)
-            self.__handle_unordered_list_start(context, unordered_list_start_token)
-        elif token.is_ordered_list_start:
-            ordered_list_start_token = cast(OrderedListStartMarkdownToken, token)
-            self.__handle_ordered_list_start(ordered_list_start_token)
-        elif token.is_unordered_list_end or token.is_ordered_list_end:
-            end_token = cast(EndMarkdownToken, token)
-            self.__handle_list_end(context, end_token)
-        elif token.is_new_list_item:
-            new_list_item_token = cast(NewListItemMarkdownToken, token)
-            self.__handle_list_item(context, new_list_item_token)
-        elif list_stack_length := len(self.__list_stack):
-            self.__line_count[list_stack_length] += self.__count_newlines_in_token(
-                token
-            )
+        for token in tokens:
+            # print(f"token>>{ParserHelper.make_value_visible(token)}")
+            if token.is_unordered_list_start:
+                unordered_list_start_token = cast(
+                    UnorderedListStartMarkdownToken, token
+                )
+                self.__handle_unordered_list_start(context, unordered_list_start_token)
+            elif token.is_ordered_list_start:
+                ordered_list_start_token = cast(OrderedListStartMarkdownToken, token)
+                self.__handle_ordered_list_start(ordered_list_start_token)
+            elif token.is_unordered_list_end or token.is_ordered_list_end:
+                end_token = cast(EndMarkdownToken, token)
+                self.__handle_list_end(context, end_token)
+            elif token.is_new_list_item:
+                new_list_item_token = cast(NewListItemMarkdownToken, token)
+                self.__handle_list_item(context, new_list_item_token)
+            elif list_stack_length := len(self.__list_stack):
+                self.__line_count[list_stack_length] += self.__count_newlines_in_token(
+                    token
+                )
 
 
 # pylint: enable=too-many-instance-attributes,protected-access
@@ -6,7 +6,7 @@ start at the beginning of the line.
 from typing import List, cast
 
 from pymarkdown.general.parser_helper import ParserHelper
-from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2, PluginDetailsV4
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 from pymarkdown.tokens.block_quote_markdown_token import BlockQuoteMarkdownToken
@@ -31,7 +31,7 @@ class RuleMd006(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV2(
+        return PluginDetailsV4(
             plugin_name="ul-start-left",
             plugin_id="MD006",
             plugin_enabled_by_default=False,
@@ -39,6 +39,7 @@ class RuleMd006(RulePlugin):
             plugin_version="0.5.1",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md006.md",
             plugin_supports_fix=True,
+            plugin_token_kinds="ulist,olist,block-quote,li",
         )
 
     def starting_new_file(self) -> None:
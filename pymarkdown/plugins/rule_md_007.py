@@ -8,7 +8,7 @@ from typing import List, Tuple, cast
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetailsV2,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
@@ -32,13 +32,12 @@ class RuleMd007(RulePlugin):
         super().__init__()
         self.__indent_basis = 0
         self.__start_indented = False
-        self.__container_manager = ContainerTokenManager()
 
     def get_details(self) -> PluginDetailsV2:
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="ul-indent",
             plugin_id="MD007",
             plugin_enabled_by_default=True,
@@ -48,6 +47,8 @@ class RuleMd007(RulePlugin):
             plugin_configuration="indent,start_indented",
             plugin_supports_fix=True,
             plugin_fix_level=3,
+            plugin_token_kinds="ulist,li",
+            plugin_uses_container_tracker=True,
         )
 
     @classmethod
@@ -82,36 +83,29 @@ class RuleMd007(RulePlugin):
             QueryConfigItem("start_indented", self.__start_indented),
         ]
 
-    def starting_new_file(self) -> None:
-        """
-        Event that the a new file to be scanned is starting.
-        """
-        self.__container_manager.clear()
-
     def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
         """
         Event that a new token is being processed.
         """
         # print(f">>>{token}".replace(ParserHelper.newline_character, "\\n"))
-        self.__container_manager.premanage_container_tokens(token)
-
+        container_manager = context.container_token_manager
         if token.is_unordered_list_start or (
             token.is_new_list_item
-            and self.__container_manager.container_token_stack[
-                -1
-            ].is_unordered_list_start
+            and container_manager.container_token_stack[-1].is_unordered_list_start
         ):
             self.__check(context, token)
 
-        self.__container_manager.manage_container_tokens(token)
-
     def __calculate_base_column_ordered_list(
-        self, stack_index: int, ignore_list_starts: bool, container_base_column: int
+        self,
+        container_manager: ContainerTokenManager,
+        stack_index: int,
+        ignore_list_starts: bool,
+        container_base_column: int,
     ) -> Tuple[bool, int]:
         if not ignore_list_starts:
             list_token = cast(
                 ListStartMarkdownToken,
-                self.__container_manager.container_token_stack[stack_index],
+                container_manager.container_token_stack[stack_index],
             )
             current_indent_level = (
                 list_token.last_new_list_token.indent_level
@@ -123,13 +117,17 @@ class RuleMd007(RulePlugin):
         return ignore_list_starts, container_base_column
 
     def __calculate_base_column_block_quote(
-        self, stack_index: int, container_base_column: int, block_quote_base: int
+        self,
+        container_manager: ContainerTokenManager,
+        stack_index: int,
+        container_base_column: int,
+        block_quote_base: int,
     ) -> Tuple[bool, int, int]:
         block_quote_token = cast(
             BlockQuoteMarkdownToken,
-            self.__container_manager.container_token_stack[stack_index],
+            container_manager.container_token_stack[stack_index],
         )
-        bq_index = self.__container_manager.bq_line_index[stack_index + 1]
+        bq_index = container_manager.bq_line_index[stack_index + 1]
         assert block_quote_token.bleading_spaces is not None
         split_leading_spaces = block_quote_token.bleading_spaces.split(
             ParserHelper.newline_character
@@ -144,15 +142,17 @@ class RuleMd007(RulePlugin):
         ignore_list_starts = False
         return ignore_list_starts, container_base_column, block_quote_base
 
-    def __calculate_base_column(self) -> Tuple[int, int, int]:
+    def __calculate_base_column(
+        self, container_manager: ContainerTokenManager
+    ) -> Tuple[int, int, int]:
         container_base_column = 0
         block_quote_base = 0
         list_depth = 0
-        if self.__container_manager.container_token_stack:
-            stack_index = len(self.__container_manager.container_token_stack) - 1
+        if container_manager.container_token_stack:
+            stack_index = len(container_manager.container_token_stack) - 1
             while (
                 stack_index >= 0
-                and self.__container_manager.container_token_stack[
+                and container_manager.container_token_stack[
                     stack_index
                 ].is_unordered_list_start
             ):
@@ -163,16 +163,19 @@ class RuleMd007(RulePlugin):
             while stack_index >= 0:
                 # print(f"stack_index>{stack_index}," + \
                 #   f"token={self.__container_token_stack[stack_index]}".replace(ParserHelper.newline_character, "\\n"))
-                if self.__container_manager.container_token_stack[
+                if container_manager.container_token_stack[
                     stack_index
                 ].is_ordered_list_start:
                     (
                         ignore_list_starts,
                         container_base_column,
                     ) = self.__calculate_base_column_ordered_list(
-                        stack_index, ignore_list_starts, container_base_column
+                        container_manager,
+                        stack_index,
+                        ignore_list_starts,
+                        container_base_column,
                     )
-                elif self.__container_manager.container_token_stack[
+                elif container_manager.container_token_stack[
                     stack_index
                 ].is_block_quote_start:
                     (
@@ -180,7 +183,10 @@ class RuleMd007(RulePlugin):
                         container_base_column,
                         block_quote_base,
                     ) = self.__calculate_base_column_block_quote(
-                        stack_index, container_base_column, block_quote_base
+                        container_manager,
+                        stack_index,
+                        container_base_column,
+                        block_quote_base,
                     )
                 # print(f"container_base_column>{container_base_column}")
                 stack_index -= 1
@@ -249,7 +255,7 @@ class RuleMd007(RulePlugin):
             container_base_column,
             block_quote_base,
             list_depth,
-        ) = self.__calculate_base_column()
+        ) = self.__calculate_base_column(context.container_token_manager)
         # print(f"container_base_column={container_base_column}, block_quote_base={block_quote_base}, list_depth={list_depth}")
 
         # print(f"list_depth={list_depth}")
@@ -4,7 +4,7 @@ Module to implement a plugin that looks for trailing spaces in the files.
 
 from typing import List, Optional, cast
 
-from pymarkdown.general.parser_helper import ParserHelper
+from pymarkdown.plugin_manager.line_facts import LineFacts
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetails,
     PluginDetailsV3,
@@ -114,9 +114,24 @@ class RuleMd009(RulePlugin):
         """
         Event that a new line is being processed.
         """
+        self.__check_line(
+            context,
+            LineFacts.from_line(self.__line_index, line, False, self.__last_line),
+        )
+        self.__line_index += 1
+        self.__last_line = line
+
+    def scan_lines(self, context: PluginScanContext, lines: List[LineFacts]) -> None:
+        """
+        Event that all the lines of a file are being scanned at once.
+        """
+        for next_line_facts in lines:
+            self.__check_line(context, next_line_facts)
+
+    def __check_line(self, context: PluginScanContext, line_facts: LineFacts) -> None:
         if (
             self.__leaf_token_index + 1 < len(self.__leaf_tokens)
-            and self.__line_index
+            and line_facts.line_number
             == self.__leaf_tokens[self.__leaf_token_index + 1].line_number
             and self.__leaf_tokens[self.__leaf_token_index + 1].is_leaf
         ):
@@ -124,29 +139,26 @@ class RuleMd009(RulePlugin):
             self.__inline_token_index = self.__leaf_token_index
         if (
             self.__inline_token_index + 1 < len(self.__leaf_tokens)
-            and self.__line_index
+            and line_facts.line_number
             == self.__leaf_tokens[self.__inline_token_index + 1].line_number
         ):
             self.__inline_token_index += 1
 
         if (
-            self.__leaf_token_index < len(self.__leaf_tokens)
+            line_facts.trailing_whitespace_length
+            and line_facts.line[-1] == " "
+            and self.__leaf_token_index < len(self.__leaf_tokens)
             and not self.__leaf_tokens[self.__leaf_token_index].is_code_block
-            and line
-            and line[-1] == " "
         ):
-            self.__next_line_check_for_error(line, context)
-        self.__line_index += 1
-        self.__last_line = line.strip(" \t")
+            self.__next_line_check_for_error(line_facts, context)
 
     def __next_line_check_for_error(
-        self, line: str, context: PluginScanContext
+        self, line_facts: LineFacts, context: PluginScanContext
     ) -> None:
-        (
-            first_non_whitespace_index,
-            extracted_whitespace,
-        ) = ParserHelper.extract_spaces_from_end(line)
-        extracted_whitespace_length = len(extracted_whitespace)
+        extracted_whitespace_length = line_facts.trailing_whitespace_length
+        first_non_whitespace_index = (
+            line_facts.line_length - extracted_whitespace_length
+        )
 
         is_within_list = False
         new_list_indent = -1
@@ -172,7 +184,7 @@ class RuleMd009(RulePlugin):
             if context.in_fix_mode:
                 self.__report_fix(
                     context,
-                    line,
+                    line_facts.line,
                     new_list_indent,
                     extracted_whitespace_length,
                     first_non_whitespace_index,
@@ -180,6 +192,7 @@ class RuleMd009(RulePlugin):
             else:
                 self.__report_error(
                     context,
+                    line_facts,
                     extracted_whitespace_length,
                     first_non_whitespace_index,
                     expected_list_indent,
@@ -211,9 +224,11 @@ class RuleMd009(RulePlugin):
 
     # pylint: enable=too-many-arguments
 
+    # pylint: disable=too-many-arguments
     def __report_error(
         self,
         context: PluginScanContext,
+        line_facts: LineFacts,
         extracted_whitespace_length: int,
         first_non_whitespace_index: int,
         expected_list_indent: int,
@@ -224,17 +239,15 @@ class RuleMd009(RulePlugin):
             extra_error_information = "0"
         else:
             extra_error_information = f"0 or {self.__break_spaces}"
-        extra_error_information = f"Expected: {extra_error_information}; Actual: {extracted_whitespace_length}"
-        override_is_error_token_prefaced_by_blank_line = (
-            self.__last_line is not None and not self.__last_line
-        )
-        self.report_next_line_error(
+        self.report_line_error(
             context,
+            line_facts,
             first_non_whitespace_index + 1,
-            extra_error_information=extra_error_information,
-            override_is_error_token_prefaced_by_blank_line=override_is_error_token_prefaced_by_blank_line,
+            extra_error_information=f"Expected: {extra_error_information}; Actual: {extracted_whitespace_length}",
         )
 
+    # pylint: enable=too-many-arguments
+
     def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
         """
         Event that a new token is being processed.
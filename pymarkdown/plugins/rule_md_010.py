@@ -5,6 +5,7 @@ Module to implement a plugin that looks for hard tabs in the files.
 from typing import List, Optional, cast
 
 from pymarkdown.general.tab_helper import TabHelper
+from pymarkdown.plugin_manager.line_facts import LineFacts
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetails,
     PluginDetailsV3,
@@ -49,6 +50,7 @@ class RuleMd010(RulePlugin):
             plugin_configuration="code_blocks",
             plugin_supports_fix=True,
             plugin_fix_level=0,
+            plugin_uses_inline_tokens=False,
         )
 
     def initialize_from_config(self) -> None:
@@ -103,7 +105,7 @@ class RuleMd010(RulePlugin):
         elif token.is_fenced_code_block_end:
             self.__last_fenced_code_end_token = cast(EndMarkdownToken, token)
 
-    def __is_line_inside_of_fenced_code_block(self) -> bool:
+    def __is_line_inside_of_fenced_code_block(self, line_number: int) -> bool:
         is_inside_of_fenced_code_block = False
         leaf_token = self.__leaf_tokens[self.__leaf_token_index]
         if leaf_token.is_fenced_code_block:
@@ -118,8 +120,7 @@ class RuleMd010(RulePlugin):
                 else last_line_number - 1
             )
             is_inside_of_fenced_code_block = (
-                self.__line_index > fenced_leaf_token.line_number
-                and self.__line_index < end_code_block_line_number
+                fenced_leaf_token.line_number < line_number < end_code_block_line_number
             )
         return is_inside_of_fenced_code_block
 
@@ -127,57 +128,47 @@ class RuleMd010(RulePlugin):
         """
         Event that a new line is being processed.
         """
+        self.__check_line(
+            context,
+            LineFacts.from_line(self.__line_index, line, False, self.__last_line),
+        )
+        self.__line_index += 1
+        self.__last_line = line
+
+    def scan_lines(self, context: PluginScanContext, lines: List[LineFacts]) -> None:
+        """
+        Event that all the lines of a file are being scanned at once.
+        """
+        for next_line_facts in lines:
+            self.__check_line(context, next_line_facts)
+
+    def __check_line(self, context: PluginScanContext, line_facts: LineFacts) -> None:
         if (
             self.__leaf_token_index + 1 < len(self.__leaf_tokens)
-            and self.__line_index
+            and line_facts.line_number
             == self.__leaf_tokens[self.__leaf_token_index + 1].line_number
         ):
             self.__leaf_token_index += 1
 
-        if "\t" in line:
-            is_inside_of_fenced_code_block = (
-                self.__is_line_inside_of_fenced_code_block()
-            )
-            can_trigger = (
-                not self.__check_in_code_blocks and not is_inside_of_fenced_code_block
-            )
-            do_process = self.__check_in_code_blocks or can_trigger
-            # if not do_process and not xx:
-            #     ff = 0
-            #     fj = []
-            #     while ff < len(self.__container_tokens):
-            #         fg = self.__container_tokens[ff]
-            #         if self.__line_index < fg.line_number:
-            #             break
-            #         fh = self.__container_end_line_numbers[fg]
-            #         if self.__line_index >fg.line_number and self.__line_index < fh:
-            #             fj.append(fg)
-            #         ff += 1
-            #     x = 1
-            #     assert False
-        else:
-            do_process = False
-        if do_process:
-            if context.in_fix_mode:
-                context.set_current_fix_line(TabHelper.detabify_string(line))
-            else:
-                next_index = line.find("\t", 0)
-                while next_index != -1:
-                    line_before_tab = line[:next_index]
-                    untabified_line_before_tab = TabHelper.detabify_string(
-                        line_before_tab
-                    )
-                    column_number_of_tab = len(untabified_line_before_tab) + 1
-                    override_is_error_token_prefaced_by_blank_line = (
-                        self.__last_line is not None and not self.__last_line
-                    )
-                    self.report_next_line_error(
-                        context,
-                        column_number_of_tab,
-                        extra_error_information=f"Column: {column_number_of_tab}",
-                        override_is_error_token_prefaced_by_blank_line=override_is_error_token_prefaced_by_blank_line,
-                    )
-                    next_index = line.find("\t", next_index + 1)
+        if line_facts.first_tab_index == -1 or not (
+            self.__check_in_code_blocks
+            or not self.__is_line_inside_of_fenced_code_block(line_facts.line_number)
+        ):
+            return
 
-        self.__line_index += 1
-        self.__last_line = line.strip(" \t")
+        line = line_facts.line
+        if context.in_fix_mode:
+            context.set_current_fix_line(TabHelper.detabify_string(line))
+        else:
+            next_index = line_facts.first_tab_index
+            while next_index != -1:
+                column_number_of_tab = (
+                    len(TabHelper.detabify_string(line[:next_index])) + 1
+                )
+                self.report_line_error(
+                    context,
+                    line_facts,
+                    column_number_of_tab,
+                    extra_error_information=f"Column: {column_number_of_tab}",
+                )
+                next_index = line.find("\t", next_index + 1)
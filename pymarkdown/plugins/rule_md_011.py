@@ -4,8 +4,9 @@ it appear like the author got the inline link syntax reversed.
 """
 
 import re
-from typing import List, Optional
+from typing import List
 
+from pymarkdown.plugin_manager.line_facts import LineFacts
 from pymarkdown.plugin_manager.plugin_details import PluginDetails
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
@@ -25,9 +26,7 @@ class RuleMd011(RulePlugin):
         super().__init__()
         self.__reverse_link_syntax = re.compile(r"\(.*\)\[\s*[^\^].*\s*]")
         self.__leaf_tokens: List[MarkdownToken] = []
-        self.__line_index = 0
         self.__leaf_token_index = 0
-        self.__last_line: Optional[str] = None
 
     def get_details(self) -> PluginDetails:
         """
@@ -48,46 +47,38 @@ class RuleMd011(RulePlugin):
         Event that the a new file to be scanned is starting.
         """
         self.__leaf_tokens = []
-        self.__line_index = 1
         self.__leaf_token_index = 0
-        self.__last_line = None
 
     # pylint: disable=too-many-boolean-expressions
-    def next_line(self, context: PluginScanContext, line: str) -> None:
+    def scan_lines(self, context: PluginScanContext, lines: List[LineFacts]) -> None:
         """
-        Event that a new line is being processed.
+        Event that all the lines of a file are being scanned at once.
         """
-        if (
-            self.__leaf_token_index + 1 < len(self.__leaf_tokens)
-            and self.__line_index
-            == self.__leaf_tokens[self.__leaf_token_index + 1].line_number
-        ):
-            self.__leaf_token_index += 1
+        for next_line_facts in lines:
+            if (
+                self.__leaf_token_index + 1 < len(self.__leaf_tokens)
+                and next_line_facts.line_number
+                == self.__leaf_tokens[self.__leaf_token_index + 1].line_number
+            ):
+                self.__leaf_token_index += 1
 
-        if (
-            self.__leaf_token_index < len(self.__leaf_tokens)
-            and not self.__leaf_tokens[self.__leaf_token_index].is_code_block
-            and not self.__leaf_tokens[self.__leaf_token_index].is_html_block
-            and line
-            and "(" in line
-            and "[" in line
-        ):
-            if regex_search := self.__reverse_link_syntax.search(line):
+            line = next_line_facts.line
+            if (
+                "(" in line
+                and "[" in line
+                and self.__leaf_token_index < len(self.__leaf_tokens)
+                and not self.__leaf_tokens[self.__leaf_token_index].is_code_block
+                and not self.__leaf_tokens[self.__leaf_token_index].is_html_block
+                and (regex_search := self.__reverse_link_syntax.search(line))
+            ):
                 regex_span = regex_search.span()
-                extra_error_information = line[regex_span[0] : regex_span[1]]
-                override_is_error_token_prefaced_by_blank_line = (
-                    self.__last_line is not None and not self.__last_line
-                )
-                self.report_next_line_error(
+                self.report_line_error(
                     context,
+                    next_line_facts,
                     regex_span[0] + 1,
-                    extra_error_information=extra_error_information,
-                    override_is_error_token_prefaced_by_blank_line=override_is_error_token_prefaced_by_blank_line,
+                    extra_error_information=line[regex_span[0] : regex_span[1]],
                 )
 
-        self.__line_index += 1
-        self.__last_line = line.strip(" \t")
-
     # pylint: enable=too-many-boolean-expressions
 
     def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
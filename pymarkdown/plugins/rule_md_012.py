@@ -59,6 +59,7 @@ class RuleMd012(RulePlugin):
             plugin_configuration="maximum",
             plugin_supports_fix=True,
             plugin_fix_level=1,
+            plugin_uses_inline_tokens=False,
         )
 
     @classmethod
@@ -2,9 +2,10 @@
 Module to implement a plugin that looks for excessively long lines in the file.
 """
 
-from typing import List, Optional, Tuple
+from typing import List, Tuple
 
 from pymarkdown.general.parser_helper import ParserHelper
+from pymarkdown.plugin_manager.line_facts import LineFacts
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetails,
     PluginDetailsV3,
@@ -29,7 +30,6 @@ class RuleMd013(RulePlugin):
         """
         super().__init__()
         self.__leaf_tokens: List[MarkdownToken] = []
-        self.__line_index = 0
         self.__leaf_token_index = 0
         self.__line_length = 0
         self.__code_block_line_length = 0
@@ -41,7 +41,6 @@ class RuleMd013(RulePlugin):
         self.__tables_active = False
         self.__strict_mode = False
         self.__stern_mode = False
-        self.__last_line: Optional[str] = None
 
     def get_details(self) -> PluginDetails:
         """
@@ -56,6 +55,7 @@ class RuleMd013(RulePlugin):
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md013.md",
             plugin_configuration="line_length,heading_line_length,code_block_line_length,"
             + "code_blocks,headings,strict,stern",
+            plugin_uses_inline_tokens=False,
         )
 
     @classmethod
@@ -152,15 +152,11 @@ class RuleMd013(RulePlugin):
         Event that the a new file to be scanned is starting.
         """
         self.__leaf_tokens = []
-        self.__line_index = 1
         self.__leaf_token_index = 0
-        self.__last_line = None
 
     def __is_really_longer(
         self, line_length: int, compare_length: int
     ) -> Tuple[bool, int]:
-        # print("line(" + str(self.__line_index) + ")->len=(" + str(line_length) + "):" + str(line))
-        # print("-->" + str(self.__leaf_tokens[self.__leaf_token_index]))
         if (
             self.__leaf_tokens[self.__leaf_token_index].is_fenced_code_block
             or self.__leaf_tokens[self.__leaf_token_index].is_indented_code_block
@@ -190,35 +186,33 @@ class RuleMd013(RulePlugin):
             )
         return line_length > compare_length, compare_length
 
-    def next_line(self, context: PluginScanContext, line: str) -> None:
+    def scan_lines(self, context: PluginScanContext, lines: List[LineFacts]) -> None:
         """
-        Event that a new line is being processed.
+        Event that all the lines of a file are being scanned at once.
         """
-
-        if (
-            self.__leaf_token_index + 1 < len(self.__leaf_tokens)
-            and self.__line_index
-            == self.__leaf_tokens[self.__leaf_token_index + 1].line_number
-        ):
-            self.__leaf_token_index += 1
-
-        line_length = len(line)
-        compare_length = self.__line_length
-        if line_length > self.__minimum_line_length:
-            is_actually_longer, compare_length = self.__is_really_longer(
-                line_length, compare_length
-            )
-        else:
-            is_actually_longer = False
+        for next_line_facts in lines:
+            if (
+                self.__leaf_token_index + 1 < len(self.__leaf_tokens)
+                and next_line_facts.line_number
+                == self.__leaf_tokens[self.__leaf_token_index + 1].line_number
+            ):
+                self.__leaf_token_index += 1
+
+            if next_line_facts.line_length > self.__minimum_line_length:
+                self.__check_line(context, next_line_facts)
+
+    def __check_line(self, context: PluginScanContext, line_facts: LineFacts) -> None:
+        line_length = line_facts.line_length
+        is_actually_longer, compare_length = self.__is_really_longer(
+            line_length, self.__line_length
+        )
         if is_actually_longer:
-            # trigger_rule = False
             if self.__strict_mode:
                 trigger_rule = True
             else:
                 next_space_index, _ = ParserHelper.extract_until_spaces(
-                    line, compare_length
+                    line_facts.line, compare_length
                 )
-                # print("next_index=" + str(next_space_index))
                 trigger_rule = (
                     line_length == next_space_index
                     if self.__stern_mode
@@ -226,20 +220,12 @@ class RuleMd013(RulePlugin):
                 )
 
             if trigger_rule:
-                extra_error_information = (
-                    f"Expected: {compare_length}, Actual: {line_length}"
-                )
-                override_is_error_token_prefaced_by_blank_line = (
-                    self.__last_line is not None and not self.__last_line
-                )
-                self.report_next_line_error(
+                self.report_line_error(
                     context,
+                    line_facts,
                     1,
-                    extra_error_information=extra_error_information,
-                    override_is_error_token_prefaced_by_blank_line=override_is_error_token_prefaced_by_blank_line,
+                    extra_error_information=f"Expected: {compare_length}, Actual: {line_length}",
                 )
-        self.__line_index += 1
-        self.__last_line = line.strip(" \t")
 
     def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
         """
@@ -7,7 +7,7 @@ from typing import Optional, cast
 
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.tab_helper import TabHelper
-from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2, PluginDetailsV4
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 from pymarkdown.tokens.atx_heading_markdown_token import AtxHeadingMarkdownToken
@@ -32,7 +32,7 @@ class RuleMd019(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV2(
+        return PluginDetailsV4(
             plugin_name="no-multiple-space-atx",
             plugin_id="MD019",
             plugin_enabled_by_default=True,
@@ -40,6 +40,7 @@ class RuleMd019(RulePlugin):
             plugin_version="0.5.1",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md019.md",
             plugin_supports_fix=True,
+            plugin_token_kinds="atx,para,text",
         )
 
     def starting_new_file(self) -> None:
@@ -7,7 +7,7 @@ from typing import Optional, cast
 
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.tab_helper import TabHelper
-from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2, PluginDetailsV4
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 from pymarkdown.tokens.atx_heading_markdown_token import AtxHeadingMarkdownToken
@@ -35,7 +35,7 @@ class RuleMd021(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV2(
+        return PluginDetailsV4(
             plugin_name="no-multiple-space-closed-atx",
             plugin_id="MD021",
             plugin_enabled_by_default=True,
@@ -43,6 +43,7 @@ class RuleMd021(RulePlugin):
             plugin_version="0.5.1",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md021.md",
             plugin_supports_fix=True,
+            plugin_token_kinds="atx,para,text",
         )
 
     def starting_new_file(self) -> None:
@@ -6,10 +6,9 @@ beginning of the line.
 from typing import Dict, List, Optional, cast
 
 from pymarkdown.general.parser_helper import ParserHelper
-from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2, PluginDetailsV4
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
-from pymarkdown.plugins.utils.container_token_manager import ContainerTokenManager
 from pymarkdown.tokens.atx_heading_markdown_token import AtxHeadingMarkdownToken
 from pymarkdown.tokens.list_start_markdown_token import ListStartMarkdownToken
 from pymarkdown.tokens.markdown_token import EndMarkdownToken, MarkdownToken
@@ -31,7 +30,6 @@ class RuleMd023(RulePlugin):
         self.__setext_start_token: Optional[SetextHeadingMarkdownToken] = None
         self.__any_leading_whitespace_detected = False
         self.__seen_first_line_of_setext = False
-        self.__container_manager = ContainerTokenManager()
         self.__last_skipped_text_token: Optional[TextMarkdownToken] = None
         self.__leading_spaces_split: Dict[ListStartMarkdownToken, List[str]] = {}
 
@@ -39,7 +37,7 @@ class RuleMd023(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV2(
+        return PluginDetailsV4(
             plugin_name="heading-start-left, header-start-left",
             plugin_id="MD023",
             plugin_enabled_by_default=True,
@@ -47,6 +45,7 @@ class RuleMd023(RulePlugin):
             plugin_version="0.5.3",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md023.md",
             plugin_supports_fix=True,
+            plugin_uses_container_tracker=True,
         )
 
     def starting_new_file(self) -> None:
@@ -56,14 +55,16 @@ class RuleMd023(RulePlugin):
         self.__setext_start_token = None
         self.__any_leading_whitespace_detected = False
         self.__seen_first_line_of_setext = False
-        self.__container_manager.clear()
         self.__leading_spaces_split = {}
         self.__last_skipped_text_token = None
 
-    def __fix_adjustments(self, ex_ws: str, ind: int = 0) -> str:
-        if self.__container_manager.container_token_stack:
-            stack_length = len(self.__container_manager.container_token_stack)
-            atx_container_token = self.__container_manager.container_token_stack[
+    def __fix_adjustments(
+        self, context: PluginScanContext, ex_ws: str, ind: int = 0
+    ) -> str:
+        container_manager = context.container_token_manager
+        if container_manager.container_token_stack:
+            stack_length = len(container_manager.container_token_stack)
+            atx_container_token = container_manager.container_token_stack[
                 stack_length - 1
             ]
         else:
@@ -78,12 +79,8 @@ class RuleMd023(RulePlugin):
                 if ex_ws[0] == "\t":
 
                     list_start_token = cast(ListStartMarkdownToken, atx_container_token)
-                    track_line_index = self.__container_manager.bq_line_index[
-                        stack_length
-                    ]
-                    adjust_line_index = self.__container_manager.list_adjust_map[
-                        stack_length
-                    ]
+                    track_line_index = container_manager.bq_line_index[stack_length]
+                    adjust_line_index = container_manager.list_adjust_map[stack_length]
 
                     if list_start_token in self.__leading_spaces_split:
                         split_spaces = self.__leading_spaces_split[list_start_token]
@@ -108,7 +105,7 @@ class RuleMd023(RulePlugin):
                 token,
                 "next_token",
                 "extracted_whitespace",
-                self.__fix_adjustments(token.extracted_whitespace),
+                self.__fix_adjustments(context, token.extracted_whitespace),
             )
         else:
             self.report_next_token_error(context, token)
@@ -145,7 +142,7 @@ class RuleMd023(RulePlugin):
                     token,
                     "next_token",
                     "extracted_whitespace",
-                    self.__fix_adjustments(token.extracted_whitespace),
+                    self.__fix_adjustments(context, token.extracted_whitespace),
                 )
 
         if self.__any_leading_whitespace_detected:
@@ -156,14 +153,20 @@ class RuleMd023(RulePlugin):
         self.__setext_start_token = None
 
     def __handle_text_split_end(
-        self, next_split_end_whitespace: str, split_index: int, new_end_parts: List[str]
+        self,
+        context: PluginScanContext,
+        next_split_end_whitespace: str,
+        split_index: int,
+        new_end_parts: List[str],
     ) -> None:
         split_next_split = next_split_end_whitespace.split(
             ParserHelper.whitespace_split_character
         )
         if len(split_next_split) == 2 and split_next_split[0]:
             self.__any_leading_whitespace_detected = True
-            fix_string = self.__fix_adjustments(split_next_split[0], ind=split_index)
+            fix_string = self.__fix_adjustments(
+                context, split_next_split[0], ind=split_index
+            )
             new_split_value = (
                 fix_string
                 + ParserHelper.whitespace_split_character
@@ -207,12 +210,12 @@ class RuleMd023(RulePlugin):
                 next_split_text = next_split_text[end_index + 1 :]
 
                 ind = -1 if is_setext_end else 0
-                self.__fix_adjustments("\t", ind=ind)
+                self.__fix_adjustments(context, "\t", ind=ind)
             new_text_parts.append(next_split_text)
 
         if self.__seen_first_line_of_setext and next_split_end_whitespace is not None:
             self.__handle_text_split_end(
-                next_split_end_whitespace, split_index, new_end_parts
+                context, next_split_end_whitespace, split_index, new_end_parts
             )
         else:
             self.__seen_first_line_of_setext = True
@@ -287,8 +290,6 @@ class RuleMd023(RulePlugin):
         """
         Event that a new token is being processed.
         """
-        self.__container_manager.premanage_container_tokens(token)
-
         if token.is_atx_heading:
             atx_token = cast(AtxHeadingMarkdownToken, token)
             self.__handle_atx_heading(context, atx_token)
@@ -315,5 +316,3 @@ class RuleMd023(RulePlugin):
                     "leading_spaces",
                     "\n".join(new_leading_spaces),
                 )
-
-        self.__container_manager.manage_container_tokens(token)
@@ -3,8 +3,9 @@ Module to implement a plugin that looks for multiple heading lines with the same
 content.
 """
 
-from typing import Dict, List, Optional, cast
+from typing import Dict, List, cast
 
+from pymarkdown.plugin_manager.heading_outline_entry import HeadingOutlineEntry
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetails,
     PluginDetailsV3,
@@ -12,7 +13,6 @@ from pymarkdown.plugin_manager.plugin_details import (
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
-from pymarkdown.tokens.atx_heading_markdown_token import AtxHeadingMarkdownToken
 from pymarkdown.tokens.markdown_token import MarkdownToken
 from pymarkdown.tokens.text_markdown_token import TextMarkdownToken
 
@@ -28,8 +28,6 @@ class RuleMd024(RulePlugin):
         Initialize an instance of the RuleMd024 class.
         """
         super().__init__()
-        self.__heading_text: Optional[str] = None
-        self.__start_token: Optional[MarkdownToken] = None
         self.__hash_count: int = -1
         self.__last_hash_count: int = 0
         self.__siblings_only: bool = False
@@ -75,49 +73,35 @@ class RuleMd024(RulePlugin):
         """
         Event that the a new file to be scanned is starting.
         """
-        self.__heading_text = None
-        self.__start_token = None
         self.__hash_count = -1
         self.__last_hash_count = 0
         self.__heading_content_map = (
             [{}, {}, {}, {}, {}, {}] if self.__siblings_only else [{}]
         )
 
-    def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
+    def scan_tokens(
+        self, context: PluginScanContext, tokens: List[MarkdownToken]
+    ) -> None:
         """
-        Event that a new token is being processed.
+        Event that all the tokens of a file are being processed at once.
         """
-        skip_this_token = False
-        if token.is_setext_heading or token.is_atx_heading:
-            atx_heading_token = cast(AtxHeadingMarkdownToken, token)
-            self.handle_heading_start(atx_heading_token)
-            skip_this_token = True
-        elif token.is_setext_heading_end or token.is_atx_heading_end:
-            self.handler_heading_end(context, token)
+        _ = tokens
+        for next_heading in context.heading_outline:
+            self.__hash_count = next_heading.level if self.__siblings_only else 1
+            self.__handle_heading(context, next_heading)
 
-        if not skip_this_token and self.__heading_text is not None:
-            new_token_debug = token.debug_string(include_column_row_info=False)
-            if token.is_text and not self.__heading_text:
-                text_token = cast(TextMarkdownToken, token)
+    def __handle_heading(
+        self, context: PluginScanContext, heading: HeadingOutlineEntry
+    ) -> None:
+        heading_text = ""
+        for next_token in heading.contained_tokens:
+            new_token_debug = next_token.debug_string(include_column_row_info=False)
+            if next_token.is_text and not heading_text:
+                text_token = cast(TextMarkdownToken, next_token)
                 suffix_to_look_for = f":{text_token.extracted_whitespace}]"
                 if new_token_debug.endswith(suffix_to_look_for):
                     new_token_debug = f"{new_token_debug[:-len(suffix_to_look_for)]}:]"
-            self.__heading_text += new_token_debug
-
-    def handle_heading_start(self, token: AtxHeadingMarkdownToken) -> None:
-        """
-        Process the start heading token, atx or setext
-        """
-        self.__heading_text = ""
-        self.__start_token = token
-        self.__hash_count = token.hash_count if self.__siblings_only else 1
-
-    def handler_heading_end(
-        self, context: PluginScanContext, token: MarkdownToken
-    ) -> None:
-        """
-        Process the end heading token, atx or setext
-        """
+            heading_text += new_token_debug
 
         if self.__last_hash_count:
             while self.__last_hash_count < self.__hash_count:
@@ -129,15 +113,12 @@ class RuleMd024(RulePlugin):
 
         past_headings_map = self.__heading_content_map[self.__hash_count - 1]
 
-        assert self.__heading_text is not None
-        if self.__heading_text in past_headings_map:
-            assert self.__start_token is not None
+        if heading_text in past_headings_map:
             self.report_next_token_error(
                 context,
-                self.__start_token,
-                use_original_position=token.is_setext_heading_end,
+                heading.heading_token,
+                use_original_position=heading.end_token.is_setext_heading_end,
             )
         else:
-            past_headings_map[self.__heading_text] = self.__heading_text
-        self.__heading_text = None
+            past_headings_map[heading_text] = heading_text
         self.__last_hash_count = self.__hash_count
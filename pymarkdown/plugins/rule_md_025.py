@@ -7,7 +7,7 @@ from typing import List, cast
 from pymarkdown.extensions.front_matter_markdown_token import FrontMatterMarkdownToken
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetails,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
@@ -34,7 +34,7 @@ class RuleMd025(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="single-title,single-h1",
             plugin_id="MD025",
             plugin_enabled_by_default=True,
@@ -42,6 +42,8 @@ class RuleMd025(RulePlugin):
             plugin_version="0.6.1",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md025.md",
             plugin_configuration="level, front_matter_title",
+            plugin_uses_inline_tokens=False,
+            plugin_token_kinds="atx,setext,front-matter",
         )
 
     @classmethod
@@ -2,9 +2,10 @@
 Module to implement a plugin that looks for trailing punctuation in headings.
 """
 
-from typing import List, Optional, cast
+from typing import List, cast
 
 from pymarkdown.general.parser_helper import ParserHelper
+from pymarkdown.plugin_manager.heading_outline_entry import HeadingOutlineEntry
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetails,
     PluginDetailsV3,
@@ -26,8 +27,6 @@ class RuleMd026(RulePlugin):
         Initialize an instance of the RuleMd026 class.
         """
         super().__init__()
-        self.__start_token: Optional[MarkdownToken] = None
-        self.__heading_text = ""
         self.__punctuation = ""
 
     def get_details(self) -> PluginDetails:
@@ -58,59 +57,47 @@ class RuleMd026(RulePlugin):
         """
         return [QueryConfigItem("punctuation", self.__punctuation)]
 
-    def starting_new_file(self) -> None:
-        """
-        Event that the a new file to be scanned is starting.
-        """
-        self.__start_token = None
-        self.__heading_text = ""
-
-    def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
+    def scan_tokens(
+        self, context: PluginScanContext, tokens: List[MarkdownToken]
+    ) -> None:
         """
-        Event that a new token is being processed.
+        Event that all the tokens of a file are being processed at once.
         """
-        if token.is_setext_heading or token.is_atx_heading:
-            self.__heading_text = ""
-            self.__start_token = token
-        elif token.is_end_token:
-            self.__next_token_end(token, context)
-        elif self.__start_token:
-            if token.is_text:
-                text_token = cast(TextMarkdownToken, token)
-                self.__heading_text += text_token.token_text
-            else:
-                self.__heading_text = ""
+        _ = tokens
+        for next_heading in context.heading_outline:
+            heading_text = ""
+            for next_token in next_heading.contained_tokens:
+                if next_token.is_text:
+                    text_token = cast(TextMarkdownToken, next_token)
+                    heading_text += text_token.token_text
+                else:
+                    heading_text = ""
+            if heading_text:
+                self.__check_heading_text(context, next_heading, heading_text)
 
-    def __next_token_end(
-        self, token: MarkdownToken, context: PluginScanContext
+    def __check_heading_text(
+        self,
+        context: PluginScanContext,
+        heading: HeadingOutlineEntry,
+        heading_text: str,
     ) -> None:
-        if token.is_setext_heading_end or token.is_atx_heading_end:
-            if self.__heading_text:
-                if token.is_atx_heading_end:
-                    use_original_position = False
-                    line_delta = 0
-                    column_delta = len(self.__heading_text) - 1
-                else:
-                    use_original_position = True
-                    line_delta = self.__heading_text.count(
-                        ParserHelper.newline_character
-                    )
-                    if line_delta:
-                        split_heading_text = self.__heading_text.split(
-                            ParserHelper.newline_character
-                        )
-                        column_delta = len(split_heading_text[-1]) - 1
-                    else:
-                        column_delta = len(self.__heading_text) - 1
-                if self.__heading_text[-1] in self.__punctuation:
-                    assert self.__start_token is not None
-                    self.report_next_token_error(
-                        context,
-                        self.__start_token,
-                        line_number_delta=line_delta,
-                        column_number_delta=column_delta,
-                        use_original_position=use_original_position,
-                    )
-            self.__start_token = None
+        if heading.end_token.is_atx_heading_end:
+            use_original_position = False
+            line_delta = 0
+            column_delta = len(heading_text) - 1
         else:
-            self.__heading_text = ""
+            use_original_position = True
+            line_delta = heading_text.count(ParserHelper.newline_character)
+            if line_delta:
+                split_heading_text = heading_text.split(ParserHelper.newline_character)
+                column_delta = len(split_heading_text[-1]) - 1
+            else:
+                column_delta = len(heading_text) - 1
+        if heading_text[-1] in self.__punctuation:
+            self.report_next_token_error(
+                context,
+                heading.heading_token,
+                line_number_delta=line_delta,
+                column_number_delta=column_delta,
+                use_original_position=use_original_position,
+            )
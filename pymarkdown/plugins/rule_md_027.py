@@ -356,10 +356,19 @@ class RuleMd027(RulePlugin):
         ):
             self.__previous_tokens.clear()
 
-    def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
+    def scan_tokens(
+        self, context: PluginScanContext, tokens: List[MarkdownToken]
+    ) -> None:
         """
-        Event that a new token is being processed.
+        Event that all the tokens of a file are being processed at once.
         """
+        process_next_token = self.__process_next_token
+        for token in tokens:
+            process_next_token(context, token)
+
+    def __process_next_token(
+        self, context: PluginScanContext, token: MarkdownToken
+    ) -> None:
         # if self.__debug_on:
         #     print(f">>{ParserHelper.make_value_visible(token)}")
         if (
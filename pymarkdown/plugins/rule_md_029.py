@@ -7,7 +7,7 @@ from typing import List, Optional, Tuple, cast
 
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetailsV2,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
@@ -48,7 +48,7 @@ class RuleMd029(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="ol-prefix",
             plugin_id="MD029",
             plugin_enabled_by_default=True,
@@ -57,6 +57,8 @@ class RuleMd029(RulePlugin):
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md029.md",
             plugin_configuration="style,allow_extended_start_values",
             plugin_supports_fix=True,
+            plugin_uses_inline_tokens=False,
+            plugin_token_kinds="ulist,olist,li",
         )
 
     @classmethod
@@ -51,6 +51,7 @@ class RuleMd030(RulePlugin):
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md030.md",
             plugin_configuration="ul_single,ol_single,ul_multi,ol_multi",
             plugin_supports_fix=True,
+            plugin_uses_inline_tokens=False,
         )
 
     @classmethod
@@ -1386,10 +1386,19 @@ class RuleMd031(RulePlugin):
 
         return special_case, special_case_2
 
-    def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
+    def scan_tokens(
+        self, context: PluginScanContext, tokens: List[MarkdownToken]
+    ) -> None:
         """
-        Event that a new token is being processed.
+        Event that all the tokens of a file are being processed at once.
         """
+        process_next_token = self.__process_next_token
+        for token in tokens:
+            process_next_token(context, token)
+
+    def __process_next_token(
+        self, context: PluginScanContext, token: MarkdownToken
+    ) -> None:
 
         # There are special cases where this rule tries to submit 2 fixes for the same token,
         # especially in the scenario where two fenced code blocks are one after another with no blank line in between.
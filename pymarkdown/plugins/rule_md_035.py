@@ -6,7 +6,7 @@ from typing import List, cast
 
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetailsV2,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
@@ -34,7 +34,7 @@ class RuleMd035(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="hr-style",
             plugin_id="MD035",
             plugin_enabled_by_default=True,
@@ -43,6 +43,8 @@ class RuleMd035(RulePlugin):
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md035.md",
             plugin_configuration="style",
             plugin_supports_fix=True,
+            plugin_uses_inline_tokens=False,
+            plugin_token_kinds="tbreak",
         )
 
     @classmethod
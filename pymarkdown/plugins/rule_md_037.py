@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import List, Optional, Tuple, cast
 
 from pymarkdown.general.parser_helper import ParserHelper
-from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2, PluginDetailsV4
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 from pymarkdown.tokens.markdown_token import MarkdownToken
@@ -56,7 +56,7 @@ class RuleMd037(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV2(
+        return PluginDetailsV4(
             plugin_name="no-space-in-emphasis",
             plugin_id="MD037",
             plugin_enabled_by_default=True,
@@ -64,6 +64,7 @@ class RuleMd037(RulePlugin):
             plugin_version="0.5.2",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md037.md",
             plugin_supports_fix=True,
+            plugin_token_kinds="atx,setext,para,text",
         )
 
     def starting_new_file(self) -> None:
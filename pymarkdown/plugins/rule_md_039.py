@@ -5,7 +5,7 @@ Module to implement a plugin that looks for spaces within link labels.
 from typing import cast
 
 from pymarkdown.general.constants import Constants
-from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2, PluginDetailsV4
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 from pymarkdown.tokens.link_reference_definition_markdown_token import (
@@ -24,7 +24,7 @@ class RuleMd039(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV2(
+        return PluginDetailsV4(
             plugin_name="no-space-in-links",
             plugin_id="MD039",
             plugin_enabled_by_default=True,
@@ -32,6 +32,7 @@ class RuleMd039(RulePlugin):
             plugin_version="0.5.2",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md039.md",
             plugin_supports_fix=True,
+            plugin_token_kinds="link,image,link-ref-def",
         )
 
     def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
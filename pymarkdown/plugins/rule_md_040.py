@@ -5,7 +5,7 @@ Module to implement a plugin that looks for fenced code blocks without a languag
 from typing import cast
 
 from pymarkdown.general.constants import Constants
-from pymarkdown.plugin_manager.plugin_details import PluginDetails
+from pymarkdown.plugin_manager.plugin_details import PluginDetails, PluginDetailsV4
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 from pymarkdown.tokens.fenced_code_block_markdown_token import (
@@ -23,14 +23,14 @@ class RuleMd040(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetails(
+        return PluginDetailsV4(
             plugin_name="fenced-code-language",
             plugin_id="MD040",
             plugin_enabled_by_default=True,
             plugin_description="Fenced code blocks should have a language specified",
             plugin_version="0.5.0",
-            plugin_interface_version=1,
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md040.md",
+            plugin_token_kinds="fcode-block",
         )
 
     def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
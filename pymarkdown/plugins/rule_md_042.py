@@ -5,7 +5,7 @@ Module to implement a plugin that looks for inline links with empty link URIs.
 from typing import cast
 
 from pymarkdown.general.constants import Constants
-from pymarkdown.plugin_manager.plugin_details import PluginDetails
+from pymarkdown.plugin_manager.plugin_details import PluginDetails, PluginDetailsV4
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 from pymarkdown.tokens.link_start_markdown_token import LinkStartMarkdownToken
@@ -21,14 +21,14 @@ class RuleMd042(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetails(
+        return PluginDetailsV4(
             plugin_name="no-empty-links",
             plugin_id="MD042",
             plugin_enabled_by_default=True,
             plugin_description="No empty links",
             plugin_version="0.5.0",
-            plugin_interface_version=1,
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md042.md",
+            plugin_token_kinds="link,image",
         )
 
     def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
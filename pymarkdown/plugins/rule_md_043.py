@@ -28,7 +28,6 @@ class RuleMd043(RulePlugin):
         """
         super().__init__()
         # self.__show_debug = False
-        self.__collected_tokens: List[MarkdownToken] = []
         self.__all_tokens: List[List[MarkdownToken]] = []
         self.__headings_have_wildcards: bool = False
         self.__compiled_headings: List[Union[str, Tuple[int, str]]] = []
@@ -319,155 +318,83 @@ class RuleMd043(RulePlugin):
         """
         Event that the a new file to be scanned is starting.
         """
-        self.__collected_tokens = []
         self.__all_tokens = []
 
-    def __do_recursive(
+    def __match_wildcard_groups(
         self,
-        remaining_headings: List[Union[str, Tuple[int, str]]],
         top_heading_index: int,
-        remaining_tokens: List[List[MarkdownToken]],
+        bottom_heading_index: int,
         top_token_index: int,
+        bottom_token_index: int,
     ) -> bool:
-        bottom_heading_index = top_heading_index + len(remaining_headings)
-
-        # if self.__show_debug:
-        #     print(
-        #         "remaining_headings:"
-        #         + str(remaining_headings)
-        #         + ",top="
-        #         + str(top_heading_index)
-        #         + ",bottom="
-        #         + str(bottom_heading_index)
-        #     )
-        #     print(
-        #         "remaining_tokens:"
-        #         + str(remaining_tokens)
-        #         + ",index="
-        #         + str(top_token_index)
-        #     )
-        assert remaining_headings[0] == "*" and remaining_headings[-1] == "*"
-        start_index = 1
-        end_index = 2
-        while remaining_headings[end_index] != "*":
-            end_index += 1
-        delta = end_index - start_index
-        # if self.__show_debug:
-        #     print(
-        #         "start_index="
-        #         + str(start_index)
-        #         + ",end_index="
-        #         + str(end_index)
-        #         + ",delta="
-        #         + str(delta)
-        #     )
-        #     print("headings:" + str(remaining_headings[start_index:end_index]))
-        search_index = 0
-        heading_index = top_heading_index + 1
-        scan_limit = top_heading_index + 1 + delta
-        found_match = False
-        while search_index < len(remaining_headings) and search_index < len(
-            remaining_tokens
-        ):
-            found_match, search_index = self.__do_recursive_loop(
-                heading_index,
-                top_token_index,
-                search_index,
-                scan_limit,
-                bottom_heading_index,
-                top_heading_index,
-                remaining_tokens,
-                remaining_headings,
-            )
-            if found_match:
-                break
-        return found_match
-
-    # pylint: disable=too-many-arguments
-    def __do_recursive_loop(
-        self,
-        heading_index: int,
-        top_token_index: int,
-        search_index: int,
-        scan_limit: int,
-        bottom_heading_index: int,
-        top_heading_index: int,
-        remaining_tokens: List[List[MarkdownToken]],
-        remaining_headings: List[Union[str, Tuple[int, str]]],
-    ) -> Tuple[bool, int]:
-        (
-            end_heading_index,
-            end_token_index,
-            failure_token,
-            _,
-        ) = self.__verify_group_heading_match(
-            heading_index, top_token_index + search_index, scan_limit=scan_limit
-        )
-        # if self.__show_debug:
-        #     print(str((end_heading_index, end_token_index, failure_token)))
-        if not failure_token and end_heading_index < len(self.__compiled_headings):
-            # if self.__show_debug:
-            #     print(
-            #         "FOUND:"
-            #         + str((end_heading_index, end_token_index, failure_token))
-            #     )
-            if end_heading_index == bottom_heading_index - 1:
-                # if self.__show_debug:
-                #     print("done")
-                found_match = True
-            else:
-                found_match = self.__prepare_and_do_recurse(
-                    end_heading_index,
-                    top_heading_index,
+        """
+        Determine whether the groups of headings between the wildcards in the
+        range of compiled headings can all be matched, in order, within the
+        range of heading tokens.  Instead of backtracking through each possible
+        way of matching the groups, this works forward one group at a time,
+        keeping the sorted token indices where the next group may start.  Each
+        group is only tried once at each token index, so the cost is bounded by
+        the number of headings times the length of the pattern.
+        """
+        group_start_token_indices = [top_token_index]
+        wildcard_heading_index = top_heading_index
+        while True:
+            group_end_heading_index = wildcard_heading_index + 1
+            while self.__compiled_headings[group_end_heading_index] != "*":
+                group_end_heading_index += 1
+            maximum_skipped_headings = bottom_heading_index - wildcard_heading_index
+
+            # A wildcard may only skip fewer headings than there are compiled
+            # headings from it to the end of the range, so only the nearest index
+            # where the group may start decides whether a token index is valid.
+            next_group_start_token_indices: List[int] = []
+            nearest_start_index = 0
+            for token_index in range(group_start_token_indices[0], bottom_token_index):
+                while (
+                    nearest_start_index + 1 < len(group_start_token_indices)
+                    and group_start_token_indices[nearest_start_index + 1]
+                    <= token_index
+                ):
+                    nearest_start_index += 1
+                if (
+                    token_index - group_start_token_indices[nearest_start_index]
+                    >= maximum_skipped_headings
+                ):
+                    continue
+                (
+                    _,
                     end_token_index,
-                    top_token_index,
-                    remaining_headings,
-                    remaining_tokens,
+                    failure_token,
+                    _,
+                ) = self.__verify_group_heading_match(
+                    wildcard_heading_index + 1,
+                    token_index,
+                    scan_limit=group_end_heading_index,
                 )
-                # if self.__show_debug:
-                #     print("found_match=" + str(found_match))
-        else:
-            found_match = False
-        if not found_match:
-            search_index += 1
-        return found_match, search_index
-
-    # pylint: enable=too-many-arguments
-
-    # pylint: disable=too-many-arguments
-    def __prepare_and_do_recurse(
-        self,
-        end_heading_index: int,
-        top_heading_index: int,
-        end_token_index: int,
-        top_token_index: int,
-        remaining_headings: List[Union[str, Tuple[int, str]]],
-        remaining_tokens: List[List[MarkdownToken]],
-    ) -> bool:
-        new_top_heading_index = end_heading_index
-        new_remaining_headings = remaining_headings[
-            (end_heading_index - top_heading_index) :
-        ]
-
-        new_remaining_tokens = remaining_tokens[(end_token_index - top_token_index) :]
-        new_top_token_index = end_token_index
-
-        return self.__do_recursive(
-            new_remaining_headings,
-            new_top_heading_index,
-            new_remaining_tokens,
-            new_top_token_index,
-        )
-
-    # pylint: enable=too-many-arguments
-
-    def completed_file(self, context: PluginScanContext) -> None:
+                if not failure_token:
+                    if group_end_heading_index == bottom_heading_index - 1:
+                        return True
+                    next_group_start_token_indices.append(end_token_index)
+            if not next_group_start_token_indices:
+                return False
+            group_start_token_indices = next_group_start_token_indices
+            wildcard_heading_index = group_end_heading_index
+
+    def scan_tokens(
+        self, context: PluginScanContext, tokens: List[MarkdownToken]
+    ) -> None:
         """
-        Event that the file being currently scanned is now completed.
+        Event that all the tokens of a file are being processed at once.
         """
+        _ = tokens
         if not self.__compiled_headings:
             return
 
+        self.__all_tokens = [
+            [next_heading.heading_token, *next_heading.contained_tokens]
+            for next_heading in context.heading_outline
+        ]
+
         # if self.__show_debug:
         #     print("self.__compiled_headings>" + str(self.__compiled_headings))
         #     print("self.__all_tokens>" + str(self.__all_tokens))
@@ -527,13 +454,12 @@ class RuleMd043(RulePlugin):
             #         + str(remaining_tokens)
             #     )
             if len(remaining_headings) != 1:
-                recurse_result = self.__do_recursive(
-                    remaining_headings,
+                if not self.__match_wildcard_groups(
                     top_heading_index,
-                    remaining_tokens,
+                    bottom_heading_index,
                     top_token_index,
-                )
-                if not recurse_result:
+                    bottom_token_index,
+                ):
                     self.report_next_token_error(
                         context,
                         remaining_tokens[0][0],
@@ -547,19 +473,3 @@ class RuleMd043(RulePlugin):
                 extra_error_information="Wildcard heading match failed.",
                 use_original_position=failure_token.is_setext_heading,
             )
-
-    def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
-        """
-        Event that a new token is being processed.
-        """
-        _ = context
-
-        if self.__collected_tokens:
-            if token.is_atx_heading_end or token.is_setext_heading_end:
-                self.__all_tokens.append(self.__collected_tokens)
-                self.__collected_tokens = []
-            else:
-                self.__collected_tokens.append(token)
-        elif self.__compiled_headings:
-            if token.is_atx_heading or token.is_setext_heading:
-                self.__collected_tokens = [token]
@@ -15,6 +15,7 @@ from pymarkdown.plugin_manager.plugin_details import (
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+from pymarkdown.plugins.utils.name_matcher import NameMatcher
 from pymarkdown.tokens.image_start_markdown_token import ImageStartMarkdownToken
 from pymarkdown.tokens.inline_code_span_markdown_token import (
     InlineCodeSpanMarkdownToken,
@@ -50,6 +51,7 @@ class RuleMd044(RulePlugin):
         """
         super().__init__()
         self.__proper_name_list: List[str] = []
+        self.__name_matcher: NameMatcher = NameMatcher([])
         self.__check_in_code_blocks: bool = False
         self.__check_in_code_spans: bool = False
         self.__is_in_code_block: bool = False
@@ -112,6 +114,7 @@ class RuleMd044(RulePlugin):
                     )
                 lower_list.append(next_name.lower())
                 self.__proper_name_list.append(next_name)
+        self.__name_matcher = NameMatcher(self.__proper_name_list)
 
     def query_config(self) -> List[QueryConfigItem]:
         """
@@ -179,7 +182,6 @@ class RuleMd044(RulePlugin):
         self,
         string_to_check: str,
         string_to_check_lower: str,
-        search_start: int,
         found_index: int,
         start_x_offset: int,
         start_y_offset: int,
@@ -190,7 +192,7 @@ class RuleMd044(RulePlugin):
         part_context: str,
     ) -> None:
         col_adjust, line_adjust = ParserHelper.adjust_for_newlines(
-            string_to_check_lower, search_start, found_index
+            string_to_check_lower, 0, found_index
         )
         if line_adjust == 0 and start_y_offset == 0:
             assert col_adjust >= 0
@@ -233,27 +235,21 @@ class RuleMd044(RulePlugin):
         if not keep_text_with_markers:
             string_to_check = ParserHelper.remove_all_from_text(string_to_check)
         string_to_check_lower = string_to_check.lower()
-        for next_name in self.__proper_name_list:
-            next_name_lower = next_name.lower()
-            search_start = 0
-            found_index = string_to_check_lower.find(next_name_lower, search_start)
-            while found_index != -1:
-                self.__search_for_possible_matches(
-                    string_to_check,
-                    string_to_check_lower,
-                    search_start,
-                    found_index,
-                    start_x_offset,
-                    start_y_offset,
-                    same_line_offset,
-                    next_name,
-                    context,
-                    token,
-                    part_context,
-                )
-
-                search_start = found_index + len(next_name)
-                found_index = string_to_check_lower.find(next_name_lower, search_start)
+        for name_index, found_index in self.__name_matcher.find_matches(
+            string_to_check_lower
+        ):
+            self.__search_for_possible_matches(
+                string_to_check,
+                string_to_check_lower,
+                found_index,
+                start_x_offset,
+                start_y_offset,
+                same_line_offset,
+                self.__proper_name_list[name_index],
+                context,
+                token,
+                part_context,
+            )
 
     # pylint: enable=too-many-arguments
 
@@ -2,8 +2,9 @@
 Module to implement a plugin to ensure all files end with a blank line.
 """
 
-from typing import Optional
+from typing import List, Optional
 
+from pymarkdown.plugin_manager.line_facts import LineFacts
 from pymarkdown.plugin_manager.plugin_details import PluginDetails, PluginDetailsV2
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
@@ -53,6 +54,17 @@ class RuleMd047(RulePlugin):
             self.__previous_last_line = self.__last_line
         self.__last_line = line
 
+    def scan_lines(self, context: PluginScanContext, lines: List[LineFacts]) -> None:
+        """
+        Event that all the lines of a file are being scanned at once.  Only the
+        last two lines are needed to check the end of the file.
+        """
+        _ = context
+        if lines:
+            self.__last_line = lines[-1].line
+        if len(lines) > 1:
+            self.__previous_last_line = lines[-2].line
+
     def completed_file(self, context: PluginScanContext) -> None:
         """
         Event that the file being currently scanned is now completed.
@@ -6,7 +6,7 @@ from typing import List, cast
 
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetailsV2,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
@@ -43,7 +43,7 @@ class RuleMd048(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="code-fence-style",
             plugin_id="MD048",
             plugin_enabled_by_default=True,
@@ -53,6 +53,8 @@ class RuleMd048(RulePlugin):
             plugin_configuration="style",
             plugin_supports_fix=True,
             plugin_fix_level=2,
+            plugin_uses_inline_tokens=False,
+            plugin_token_kinds="fcode-block",
         )
 
     @classmethod
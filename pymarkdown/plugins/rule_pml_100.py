@@ -8,7 +8,7 @@ from pymarkdown.extensions.disallowed_raw_html import MarkdownDisallowRawHtmlExt
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetails,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
@@ -31,7 +31,6 @@ class RulePml100(RulePlugin):
         Initialize an instance of the RulePml100 class.
         """
         super().__init__()
-        self.__container_manager = ContainerTokenManager()
         self.__in_block = False
         self.__disallowed_tag_names: Set[str] = set()
         self.__modify_tag_names: str = ""
@@ -40,7 +39,7 @@ class RulePml100(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="disallowed-html",
             plugin_id="PML100",
             plugin_enabled_by_default=False,
@@ -49,6 +48,7 @@ class RulePml100(RulePlugin):
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_pml100.md",
             plugin_configuration=None,
             plugin_supports_fix=False,
+            plugin_uses_container_tracker=True,
         )
 
     def initialize_from_config(self) -> None:
@@ -108,7 +108,6 @@ class RulePml100(RulePlugin):
         Event that the a new file to be scanned is starting.
         """
         self.__in_block = False
-        self.__container_manager.clear()
 
     def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
         """
@@ -123,8 +122,6 @@ class RulePml100(RulePlugin):
         elif token.is_inline_raw_html:
             self.__scan_text_token(context, cast(RawHtmlMarkdownToken, token))
 
-        self.__container_manager.manage_container_tokens(token)
-
     def __find_delta_column(self, delta_text: str) -> Tuple[int, int]:
         if "\n" in delta_text:
             split_delta_text = delta_text.split(ParserHelper.newline_character)
@@ -150,9 +147,10 @@ class RulePml100(RulePlugin):
                     text_so_far
                 )
 
-                if len(self.__container_manager.container_token_stack) > 0:
+                container_manager = context.container_token_manager
+                if len(container_manager.container_token_stack) > 0:
                     if container_base_column := self.__calculate_base_column(
-                        column_number_delta, text_so_far
+                        container_manager, column_number_delta, text_so_far
                     ):
                         column_number_delta -= container_base_column
 
@@ -180,16 +178,19 @@ class RulePml100(RulePlugin):
             )
 
     def __calculate_base_column(
-        self, column_number_delta: int, text_so_far: str
+        self,
+        container_manager: ContainerTokenManager,
+        column_number_delta: int,
+        text_so_far: str,
     ) -> int:
         container_base_column = 0
-        stack_index = len(self.__container_manager.container_token_stack) - 1
-        top_one = self.__container_manager.container_token_stack[-1]
+        stack_index = len(container_manager.container_token_stack) - 1
+        top_one = container_manager.container_token_stack[-1]
         if top_one.is_list_start:
             if column_number_delta < 0:
                 list_token = cast(
                     ListStartMarkdownToken,
-                    self.__container_manager.container_token_stack[stack_index],
+                    container_manager.container_token_stack[stack_index],
                 )
                 container_base_column = list_token.indent_level
         else:
@@ -198,12 +199,12 @@ class RulePml100(RulePlugin):
             count_of_block_quote_characters = text_so_far.count(">")
             if count_of_block_quote_characters > 0:
                 bq_index = (
-                    self.__container_manager.bq_line_index[stack_index + 1]
+                    container_manager.bq_line_index[stack_index + 1]
                     + count_of_block_quote_characters
                 )
                 block_quote_token = cast(
                     BlockQuoteMarkdownToken,
-                    self.__container_manager.container_token_stack[stack_index],
+                    container_manager.container_token_stack[stack_index],
                 )
                 assert block_quote_token.bleading_spaces is not None
                 split_leading_spaces = block_quote_token.bleading_spaces.split(
@@ -7,7 +7,7 @@ from typing import List, Tuple, cast
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetailsV2,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
@@ -28,13 +28,12 @@ class RulePml101(RulePlugin):
         """
         super().__init__()
         self.__indent_basis = 0
-        self.__container_manager = ContainerTokenManager()
 
     def get_details(self) -> PluginDetailsV2:
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="list-anchored-indent",
             plugin_id="PML101",
             plugin_enabled_by_default=False,
@@ -44,6 +43,8 @@ class RulePml101(RulePlugin):
             plugin_configuration="indent",
             plugin_supports_fix=False,
             plugin_fix_level=3,
+            plugin_token_kinds="ulist,olist,li",
+            plugin_uses_container_tracker=True,
         )
 
     @classmethod
@@ -73,12 +74,6 @@ class RulePml101(RulePlugin):
             QueryConfigItem("indent", self.__indent_basis),
         ]
 
-    def starting_new_file(self) -> None:
-        """
-        Event that the a new file to be scanned is starting.
-        """
-        self.__container_manager.clear()
-
     def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
         """
         Event that a new token is being processed.
@@ -86,16 +81,18 @@ class RulePml101(RulePlugin):
         if token.is_list_start or token.is_new_list_item:
             self.__check(context, token)
 
-        self.__container_manager.manage_container_tokens(token)
-
     def __calculate_base_column_block_quote(
-        self, stack_index: int, container_base_column: int, block_quote_base: int
+        self,
+        container_manager: ContainerTokenManager,
+        stack_index: int,
+        container_base_column: int,
+        block_quote_base: int,
     ) -> Tuple[int, int]:
         block_quote_token = cast(
             BlockQuoteMarkdownToken,
-            self.__container_manager.container_token_stack[stack_index],
+            container_manager.container_token_stack[stack_index],
         )
-        bq_index = self.__container_manager.bq_line_index[stack_index + 1]
+        bq_index = container_manager.bq_line_index[stack_index + 1]
         assert block_quote_token.bleading_spaces is not None
         split_leading_spaces = block_quote_token.bleading_spaces.split(
             ParserHelper.newline_character
@@ -107,29 +104,32 @@ class RulePml101(RulePlugin):
         container_base_column += len(split_leading_spaces[bq_index])
         return container_base_column, block_quote_base
 
-    def __calculate_base_column(self) -> Tuple[int, int, int]:
+    def __calculate_base_column(
+        self, container_manager: ContainerTokenManager
+    ) -> Tuple[int, int, int]:
         container_base_column = 0
         block_quote_base = 0
         list_depth = 0
-        if self.__container_manager.container_token_stack:
-            stack_index = len(self.__container_manager.container_token_stack) - 1
+        if container_manager.container_token_stack:
+            stack_index = len(container_manager.container_token_stack) - 1
             while (
                 stack_index >= 0
-                and self.__container_manager.container_token_stack[
-                    stack_index
-                ].is_list_start
+                and container_manager.container_token_stack[stack_index].is_list_start
             ):
                 list_depth += 1
                 stack_index -= 1
             while stack_index >= 0:
-                if self.__container_manager.container_token_stack[
+                if container_manager.container_token_stack[
                     stack_index
                 ].is_block_quote_start:
                     (
                         container_base_column,
                         block_quote_base,
                     ) = self.__calculate_base_column_block_quote(
-                        stack_index, container_base_column, block_quote_base
+                        container_manager,
+                        stack_index,
+                        container_base_column,
+                        block_quote_base,
                     )
                 stack_index -= 1
         return container_base_column, block_quote_base, list_depth
@@ -194,7 +194,7 @@ class RulePml101(RulePlugin):
             container_base_column,
             block_quote_base,
             list_depth,
-        ) = self.__calculate_base_column()
+        ) = self.__calculate_base_column(context.container_token_manager)
 
         if token.is_new_list_item:
             list_depth -= 1
@@ -0,0 +1,87 @@
+"""
+Module to help rules find a set of names within some text.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# pylint: disable=too-few-public-methods
+
+
+class NameMatcher:
+    """
+    Class to help rules find every occurrence of a set of names within some text
+    in a single pass over that text, instead of one pass for each name.
+
+    The names are compiled into a trie, which is turned into a single regular
+    expression that finds the longest name starting at each position of the text.
+    As every other name starting at that same position must be a prefix of that
+    longest name, those names are looked up instead of being searched for.
+    """
+
+    def __init__(self, names: List[str]) -> None:
+        self.__name_lengths = [len(next_name) for next_name in names]
+        lower_names = [next_name.lower() for next_name in names]
+
+        self.__prefix_name_indices: Dict[str, List[int]] = {
+            next_lower_name: [
+                name_index
+                for name_index, other_lower_name in enumerate(lower_names)
+                if next_lower_name.startswith(other_lower_name)
+            ]
+            for next_lower_name in lower_names
+        }
+
+        self.__search_regex: Optional[re.Pattern[str]] = (
+            re.compile(f"(?=({NameMatcher.__build_trie_regex(lower_names)}))")
+            if lower_names
+            else None
+        )
+
+    @staticmethod
+    def __build_trie_regex(name_suffixes: List[str]) -> str:
+        suffixes_by_first_character: Dict[str, List[str]] = {}
+        for next_suffix in name_suffixes:
+            if next_suffix:
+                suffixes_by_first_character.setdefault(next_suffix[0], []).append(
+                    next_suffix[1:]
+                )
+        if not suffixes_by_first_character:
+            return ""
+        alternatives = [
+            re.escape(next_character) + NameMatcher.__build_trie_regex(next_suffixes)
+            for next_character, next_suffixes in suffixes_by_first_character.items()
+        ]
+        node_regex = (
+            alternatives[0]
+            if len(alternatives) == 1
+            else f"(?:{'|'.join(alternatives)})"
+        )
+        # Trying the longer names before the name that ends here means that the
+        # longest name starting at any position is always the one that is found.
+        return f"(?:{node_regex})?" if "" in name_suffixes else node_regex
+
+    def find_matches(self, lower_text: str) -> List[Tuple[int, int]]:
+        """
+        Find the occurrences of the names within the already lowercased text,
+        returning the index of the name and the index of the occurrence, ordered
+        by name and then by occurrence.  As with repeatedly calling `str.find`,
+        occurrences of the same name do not overlap.
+        """
+        found_matches: List[Tuple[int, int]] = []
+        if not self.__search_regex:
+            return found_matches
+        next_search_indices: Dict[int, int] = {}
+        for next_match in self.__search_regex.finditer(lower_text):
+            found_index = next_match.start()
+            for name_index in self.__prefix_name_indices[next_match.group(1)]:
+                if found_index >= next_search_indices.get(name_index, 0):
+                    found_matches.append((name_index, found_index))
+                    next_search_indices[name_index] = (
+                        found_index + self.__name_lengths[name_index]
+                    )
+        found_matches.sort()
+        return found_matches
+
+
+# pylint: enable=too-few-public-methods
@@ -0,0 +1,246 @@
+"""
+Module to provide for a persistent cache of the results of scanning files.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Set
+
+from application_properties import ApplicationProperties
+
+from pymarkdown.extension_manager.extension_manager import ExtensionManager
+from pymarkdown.general.parser_logger import ParserLogger
+from pymarkdown.parallel_scan_helper import RecordedResults
+from pymarkdown.plugin_manager.plugin_manager import PluginManager
+from pymarkdown.plugin_manager.plugin_scan_failure import PluginScanFailure
+from pymarkdown.plugin_manager.pragma_failure_record import PragmaFailureRecord
+
+POGGER = ParserLogger(logging.getLogger(__name__))
+
+
+class ScanResultCache:
+    """
+    Class to provide for a persistent cache of the results of scanning files.
+
+    Each entry is keyed by the contents of the file, the name the file was
+    scanned as, and a configuration key that captures everything else that
+    can change the results of a scan.  Entries are written to a temporary file
+    and then renamed into place, so that concurrent writers never expose a
+    partial entry.  Once the cache exceeds its size limit, the least recently
+    used entries are removed.
+    """
+
+    __entry_suffix = ".json"
+    __entry_format_version = 1
+    default_size_limit = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        cache_directory: str,
+        configuration_key: str,
+        size_limit: int = default_size_limit,
+    ) -> None:
+        """
+        Initialize a new instance of the ScanResultCache class.
+        """
+        self.__cache_directory = cache_directory
+        self.__configuration_key = configuration_key
+        self.__size_limit = size_limit
+        self.__estimated_size: Optional[int] = None
+        os.makedirs(self.__cache_directory, exist_ok=True)
+
+    @staticmethod
+    def calculate_configuration_key(
+        properties: ApplicationProperties,
+        plugins: PluginManager,
+        extensions: ExtensionManager,
+        application_version: str,
+    ) -> str:
+        """
+        Calculate a key that changes whenever anything other than the file itself
+        may change the results of scanning that file.
+        """
+        key_source = {
+            "format": ScanResultCache.__entry_format_version,
+            "version": application_version,
+            "properties": [
+                [next_name, repr(properties.get_property(next_name, object))]
+                for next_name in sorted(properties.property_names)
+            ],
+            "plugins": sorted(
+                [
+                    next_plugin.plugin_id,
+                    next_plugin.plugin_version,
+                    next_plugin.plugin_file_name,
+                ]
+                for next_plugin in plugins.enabled_plugins
+            ),
+            "extensions": sorted(
+                [next_extension.extension_id, next_extension.extension_version]
+                for next_extension in extensions.enabled_extensions
+            ),
+        }
+        return hashlib.sha256(
+            json.dumps(key_source, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def __calculate_entry_path(
+        self,
+        file_name: str,
+        file_contents: bytes,
+        per_file_disabled_identifiers: Optional[Set[str]],
+    ) -> str:
+        entry_hash = hashlib.sha256()
+        entry_hash.update(self.__configuration_key.encode("utf-8"))
+        entry_hash.update(b"\0")
+        entry_hash.update(file_name.encode("utf-8"))
+        entry_hash.update(b"\0")
+        entry_hash.update(
+            ",".join(sorted(per_file_disabled_identifiers or [])).encode("utf-8")
+        )
+        entry_hash.update(b"\0")
+        entry_hash.update(hashlib.sha256(file_contents).digest())
+        return os.path.join(
+            self.__cache_directory,
+            entry_hash.hexdigest() + ScanResultCache.__entry_suffix,
+        )
+
+    def load_results(
+        self,
+        file_name: str,
+        file_contents: bytes,
+        per_file_disabled_identifiers: Optional[Set[str]],
+    ) -> Optional[RecordedResults]:
+        """
+        Load the recorded results for the file, returning None if there are no
+        usable results in the cache.
+        """
+        entry_path = self.__calculate_entry_path(
+            file_name, file_contents, per_file_disabled_identifiers
+        )
+        try:
+            with open(entry_path, "rt", encoding="utf-8") as entry_file:
+                serialized_results = json.load(entry_file)
+            recorded_results = ScanResultCache.__deserialize_results(serialized_results)
+        except (OSError, ValueError, TypeError, KeyError) as this_exception:
+            POGGER.debug(
+                "Cache miss for file '$' ($).", file_name, type(this_exception).__name__
+            )
+            return None
+
+        # Touch the entry so that eviction removes the least recently used entries.
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        POGGER.info("Cache hit for file '$'.", file_name)
+        return recorded_results
+
+    def save_results(
+        self,
+        file_name: str,
+        file_contents: bytes,
+        per_file_disabled_identifiers: Optional[Set[str]],
+        recorded_results: RecordedResults,
+    ) -> None:
+        """
+        Save the recorded results for the file.  Any failure to write to the
+        cache only means that the file will be scanned again next time.
+        """
+        entry_path = self.__calculate_entry_path(
+            file_name, file_contents, per_file_disabled_identifiers
+        )
+        entry_data = json.dumps(
+            ScanResultCache.__serialize_results(recorded_results)
+        ).encode("utf-8")
+        temporary_path = None
+        try:
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=self.__cache_directory, suffix=".tmp"
+            )
+            with os.fdopen(file_descriptor, "wb") as entry_file:
+                entry_file.write(entry_data)
+            os.replace(temporary_path, entry_path)
+            temporary_path = None
+        except OSError as this_exception:
+            POGGER.info(
+                "Unable to write cache entry for file '$': $",
+                file_name,
+                this_exception,
+            )
+            return
+        finally:
+            if temporary_path is not None and os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+        # Only go to the expense of looking at every entry in the cache when it
+        # looks like the cache may have grown past its limit.
+        if self.__estimated_size is None:
+            self.__estimated_size = self.__evict_entries()
+        else:
+            self.__estimated_size += len(entry_data)
+            if self.__estimated_size > self.__size_limit:
+                self.__estimated_size = self.__evict_entries()
+
+    def __evict_entries(self) -> int:
+        entries = []
+        total_size = 0
+        with os.scandir(self.__cache_directory) as directory_iterator:
+            for next_entry in directory_iterator:
+                if not next_entry.name.endswith(ScanResultCache.__entry_suffix):
+                    continue
+                try:
+                    entry_stat = next_entry.stat()
+                except OSError:
+                    continue
+                entries.append(
+                    (entry_stat.st_mtime, entry_stat.st_size, next_entry.path)
+                )
+                total_size += entry_stat.st_size
+        if total_size <= self.__size_limit:
+            return total_size
+
+        entries.sort()
+        for _, entry_size, entry_path in entries:
+            if total_size <= self.__size_limit:
+                break
+            POGGER.debug("Evicting cache entry '$'.", entry_path)
+            try:
+                os.remove(entry_path)
+            except OSError:
+                # Another process may have already evicted the same entry.
+                pass
+            total_size -= entry_size
+        return total_size
+
+    @staticmethod
+    def __serialize_results(
+        recorded_results: RecordedResults,
+    ) -> List[Dict[str, Any]]:
+        serialized_results = []
+        for next_result in recorded_results:
+            serialized_result = dataclasses.asdict(next_result)
+            serialized_result["kind"] = (
+                "pragma" if isinstance(next_result, PragmaFailureRecord) else "failure"
+            )
+            serialized_results.append(serialized_result)
+        return serialized_results
+
+    @staticmethod
+    def __deserialize_results(
+        serialized_results: List[Dict[str, Any]],
+    ) -> RecordedResults:
+        recorded_results: RecordedResults = []
+        for next_result in serialized_results:
+            result_kind = next_result.pop("kind")
+            if result_kind == "pragma":
+                recorded_results.append(PragmaFailureRecord(**next_result))
+            elif result_kind == "failure":
+                recorded_results.append(PluginScanFailure(**next_result))
+            else:
+                raise ValueError(f"Unknown cache entry kind '{result_kind}'.")
+        return recorded_results
@@ -0,0 +1,119 @@
+"""
+Module to provide for a thin client that forwards a command to a server.
+
+This module only uses the standard library, so that forwarding a command does
+not pay the cost of loading the parser and the rule plugins.
+"""
+
+import json
+import os
+import socket
+import sys
+from typing import List, NoReturn, Optional, Tuple
+
+
+class ServerClient:
+    """
+    Class to provide for a thin client that forwards a command to a server.
+    """
+
+    server_socket_argument = "--server-socket"
+    __standard_in_subcommands = ["scan-stdin", "fix-stdin"]
+    __read_block_size = 65536
+    __response_timeout_in_seconds = 600.0
+
+    @staticmethod
+    def receive_all(connection: socket.socket) -> bytes:
+        """
+        Receive everything that is sent over the connection until it is closed.
+        """
+        received_blocks = []
+        while next_block := connection.recv(ServerClient.__read_block_size):
+            received_blocks.append(next_block)
+        return b"".join(received_blocks)
+
+    @staticmethod
+    def verify_platform_support() -> None:
+        """
+        Verify that the platform supports Unix domain sockets.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix domain sockets are not supported on this platform.")
+
+    @staticmethod
+    def forward_request(
+        socket_path: str, arguments: List[str], standard_input: Optional[str]
+    ) -> Tuple[str, str, int]:
+        """
+        Forward the arguments to the server, returning the standard output, the
+        standard error, and the return code that the server produced.
+        """
+        ServerClient.verify_platform_support()
+        request = {
+            "arguments": arguments,
+            "directory": os.getcwd(),
+            "input": standard_input,
+        }
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+            # A server that stopped responding must not leave the client waiting
+            # forever.  The timeout applies to each operation on the socket.
+            client_socket.settimeout(ServerClient.__response_timeout_in_seconds)
+            client_socket.connect(socket_path)
+            client_socket.sendall(json.dumps(request).encode("utf-8"))
+            client_socket.shutdown(socket.SHUT_WR)
+            response = json.loads(
+                ServerClient.receive_all(client_socket).decode("utf-8")
+            )
+        return response["output"], response["error"], response["return_code"]
+
+    @staticmethod
+    def find_server_socket(arguments: List[str]) -> Optional[str]:
+        """
+        Look for the server socket argument without parsing the other arguments.
+        """
+        prefix = ServerClient.server_socket_argument + "="
+        for argument_index, next_argument in enumerate(arguments):
+            if next_argument.startswith(prefix):
+                return next_argument[len(prefix) :]
+            if (
+                next_argument == ServerClient.server_socket_argument
+                and argument_index + 1 < len(arguments)
+            ):
+                return arguments[argument_index + 1]
+        return None
+
+    @staticmethod
+    def forward_and_exit(
+        socket_path: str, arguments: List[str], uses_standard_in: bool
+    ) -> NoReturn:
+        """
+        Forward the arguments to the server, reproducing its output and return code.
+        """
+        standard_input = sys.stdin.read() if uses_standard_in else None
+        try:
+            output, error, return_code = ServerClient.forward_request(
+                socket_path, arguments, standard_input
+            )
+        except (OSError, ValueError) as this_exception:
+            print(
+                f"\n\nUnable to forward request to server at '{socket_path}': {this_exception}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        sys.stdout.write(output)
+        sys.stderr.write(error)
+        sys.exit(return_code)
+
+    @staticmethod
+    def forward_if_requested(arguments: List[str]) -> None:
+        """
+        If the server socket argument is present, forward the arguments to the
+        server and exit.  Otherwise, return so that the command runs locally.
+        """
+        if (socket_path := ServerClient.find_server_socket(arguments)) is None:
+            return
+        uses_standard_in = not sys.stdin.isatty() and any(
+            next_subcommand in arguments
+            for next_subcommand in ServerClient.__standard_in_subcommands
+        )
+        ServerClient.forward_and_exit(socket_path, arguments, uses_standard_in)
@@ -0,0 +1,172 @@
+"""
+Module to provide for a resident server that keeps the parser and the rule
+plugins initialized between requests.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import stat
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from pymarkdown.general.parser_logger import ParserLogger
+from pymarkdown.server_client import ServerClient
+
+POGGER = ParserLogger(logging.getLogger(__name__))
+
+
+class ServerHelper:
+    """
+    Class to provide for a resident server that answers requests over a Unix
+    domain socket.
+
+    Each request is the list of command line arguments, the working directory of
+    the client, and the standard input of the client if it is needed.  Each
+    response is the standard output, the standard error, and the return code
+    that the request produced.  Requests are handled one at a time.
+    """
+
+    __server_subcommand = "server"
+
+    def __init__(
+        self,
+        socket_path: str,
+        handle_request: Callable[[List[str]], None],
+    ) -> None:
+        """
+        Initialize a new instance of the ServerHelper class.
+        """
+        self.__socket_path = socket_path
+        self.__handle_request = handle_request
+
+    @staticmethod
+    def argparse_subparser_name() -> str:
+        """
+        Get the name of the subparser for the server.
+        """
+        return ServerHelper.__server_subcommand
+
+    @staticmethod
+    def add_argparse_subparser(subparsers: argparse._SubParsersAction) -> None:  # type: ignore
+        """
+        Add the subparser for the server.
+        """
+        new_sub_parser = subparsers.add_parser(
+            ServerHelper.__server_subcommand,
+            help="keep the parser and plugins loaded, answering requests from clients",
+        )
+        new_sub_parser.add_argument(
+            "--socket",
+            dest="server_socket_path",
+            action="store",
+            required=True,
+            help="path of the Unix domain socket to listen on",
+        )
+
+    @staticmethod
+    def add_command_line_arguments(parser: argparse.ArgumentParser) -> None:
+        """
+        Function to add any command line arguments for the client.
+        """
+        parser.add_argument(
+            ServerClient.server_socket_argument,
+            dest="server_socket",
+            action="store",
+            default=None,
+            help="forward the command to the server listening on this socket",
+        )
+
+    def serve(self) -> None:
+        """
+        Answer requests until the server is interrupted or terminated.
+        """
+        ServerClient.verify_platform_support()
+        if os.path.exists(self.__socket_path) and stat.S_ISSOCK(
+            os.stat(self.__socket_path).st_mode
+        ):
+            POGGER.info("Removing stale socket '$'.", self.__socket_path)
+            os.remove(self.__socket_path)
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, ServerHelper.__handle_terminate_signal)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server_socket:
+            server_socket.bind(self.__socket_path)
+            os.chmod(self.__socket_path, stat.S_IRUSR | stat.S_IWUSR)
+            server_socket.listen()
+            POGGER.info("Server listening on '$'.", self.__socket_path)
+            try:
+                while True:
+                    connection, _ = server_socket.accept()
+                    with connection:
+                        self.__answer_request(connection)
+            except KeyboardInterrupt:
+                POGGER.info("Server stopping.")
+            finally:
+                if os.path.exists(self.__socket_path):
+                    os.remove(self.__socket_path)
+
+    @staticmethod
+    def __handle_terminate_signal(signal_number: int, stack_frame: Any) -> None:
+        _ = (signal_number, stack_frame)
+        raise KeyboardInterrupt()
+
+    # pylint: disable=broad-exception-caught
+    def __answer_request(self, connection: socket.socket) -> None:
+        try:
+            request = json.loads(ServerClient.receive_all(connection).decode("utf-8"))
+            response = self.__process_request(
+                request["arguments"], request["directory"], request["input"]
+            )
+        except Exception as this_exception:
+            POGGER.info("Server request was not understood: $", this_exception)
+            response = {
+                "output": "",
+                "error": f"Server request was not understood: {this_exception}\n",
+                "return_code": 1,
+            }
+        try:
+            connection.sendall(json.dumps(response).encode("utf-8"))
+        except OSError as this_exception:
+            POGGER.info("Server response was not sent: $", this_exception)
+
+    # pylint: enable=broad-exception-caught
+
+    def __process_request(
+        self, arguments: List[str], directory: str, standard_input: Optional[str]
+    ) -> Dict[str, Any]:
+        POGGER.info("Server request in '$': $", directory, arguments)
+        captured_output = io.StringIO()
+        captured_error = io.StringIO()
+        return_code = 0
+        saved_directory = os.getcwd()
+        saved_input = sys.stdin
+        try:
+            os.chdir(directory)
+            sys.stdin = io.StringIO(standard_input or "")
+            with contextlib.redirect_stdout(
+                captured_output
+            ), contextlib.redirect_stderr(captured_error):
+                try:
+                    self.__handle_request(arguments)
+                except SystemExit as this_exception:
+                    return_code = (
+                        this_exception.code
+                        if isinstance(this_exception.code, int)
+                        else 1
+                    )
+        finally:
+            sys.stdin = saved_input
+            os.chdir(saved_directory)
+        return {
+            "output": captured_output.getvalue(),
+            "error": captured_error.getvalue(),
+            "return_code": return_code,
+        }
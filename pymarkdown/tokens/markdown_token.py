@@ -794,7 +794,7 @@ class EndMarkdownToken(MarkdownToken):
 
         MarkdownToken.__init__(
             self,
-            f"{MarkdownToken._end_token_prefix}{type_name}",
+            EndMarkdownToken.calculate_token_name(type_name),
             MarkdownTokenClass.INLINE_BLOCK,
             "",
             line_number=line_number,
@@ -804,6 +804,13 @@ class EndMarkdownToken(MarkdownToken):
 
     # pylint: enable=too-many-arguments
 
+    @staticmethod
+    def calculate_token_name(type_name: str) -> str:
+        """
+        Calculate the name of the end token for the specified type of element.
+        """
+        return f"{MarkdownToken._end_token_prefix}{type_name}"
+
     @property
     def type_name(self) -> str:
         """
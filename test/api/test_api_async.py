@@ -0,0 +1,288 @@
+"""
+Module for using PyMarkdown's api from asyncio.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from test.utils import assert_that_exception_is_raised
+from typing import Any, List, Tuple
+from unittest import mock
+
+import pytest
+
+from pymarkdown.api import (
+    PyMarkdownApi,
+    PyMarkdownApiArgumentException,
+    PyMarkdownApiNoFilesFoundException,
+    PyMarkdownFixStringResult,
+    PyMarkdownScanPathResult,
+)
+from pymarkdown.async_api import AsyncPyMarkdownApi
+from pymarkdown.plugin_manager.plugin_manager import PluginManager
+
+
+def test_api_async_scan_and_fix_string() -> None:
+    """
+    Test to make sure that strings can be scanned and fixed from within an event loop.
+    """
+
+    # Arrange
+    async def scan_and_fix(
+        async_api: AsyncPyMarkdownApi,
+    ) -> Tuple[PyMarkdownScanPathResult, PyMarkdownFixStringResult]:
+        return await asyncio.gather(
+            async_api.scan_string("#  Heading\n"),
+            async_api.fix_string("#  Heading\n"),
+        )
+
+    # Act
+    with AsyncPyMarkdownApi() as async_api:
+        scan_result, fix_result = asyncio.run(scan_and_fix(async_api))
+
+    # Assert
+    assert scan_result == PyMarkdownApi().scan_string("#  Heading\n")
+    assert fix_result == PyMarkdownFixStringResult(True, "# Heading\n")
+
+
+def test_api_async_scan_path_with_configured_api() -> None:
+    """
+    Test to make sure that the modifiers of the supplied api are honored, and that
+    errors are raised from the awaited call.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md022")
+
+    with AsyncPyMarkdownApi(
+        PyMarkdownApi().disable_rule_by_identifier("md022")
+    ) as async_api:
+        # Act
+        scan_result = asyncio.run(async_api.scan_path(source_path))
+
+        # Assert
+        assert all(
+            next_failure.rule_id != "MD022"
+            for next_failure in scan_result.scan_failures
+        )
+        with pytest.raises(PyMarkdownApiNoFilesFoundException):
+            asyncio.run(async_api.scan_path("does-not-exist"))
+
+
+@pytest.mark.timeout(60)
+def test_api_async_iterate_scan_path() -> None:
+    """
+    Test to make sure that the results for each file are yielded in order, and
+    match the results of scanning the whole path at once.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md022")
+    expected_result = PyMarkdownApi().scan_path(source_path)
+    expected_files = PyMarkdownApi().list_path(source_path).matching_files
+
+    async def collect_results(
+        async_api: AsyncPyMarkdownApi,
+    ) -> List[Tuple[str, PyMarkdownScanPathResult]]:
+        return [
+            next_pair async for next_pair in async_api.iterate_scan_path(source_path)
+        ]
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        scan_results = asyncio.run(
+            collect_results(AsyncPyMarkdownApi(executor=executor, max_pending_calls=3))
+        )
+
+    # Assert
+    assert [next_file for next_file, _ in scan_results] == expected_files
+    assert [
+        next_failure
+        for _, next_result in scan_results
+        for next_failure in next_result.scan_failures
+    ] == expected_result.scan_failures
+
+
+@pytest.mark.timeout(60)
+def test_api_async_iterate_scan_path_initializes_once() -> None:
+    """
+    Test to make sure that iterating over the results for each file does not
+    initialize the plugins again for each file.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md022")
+    original_initialize = PluginManager.initialize
+
+    async def collect_results(
+        async_api: AsyncPyMarkdownApi,
+    ) -> List[Tuple[str, PyMarkdownScanPathResult]]:
+        return [
+            next_pair async for next_pair in async_api.iterate_scan_path(source_path)
+        ]
+
+    # Act
+    with mock.patch.object(
+        PluginManager, "initialize", autospec=True, side_effect=original_initialize
+    ) as mock_initialize:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            scan_results = asyncio.run(
+                collect_results(AsyncPyMarkdownApi(executor=executor))
+            )
+
+    # Assert
+    # Once to list the files, and once for the session used to scan them.
+    assert len(scan_results) > 1
+    assert mock_initialize.call_count == 2
+
+
+def test_api_async_iterate_scan_path_with_alternate_extensions() -> None:
+    """
+    Test to make sure that files that are only eligible because of the alternate
+    extensions are scanned, and not just listed.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "only-text")
+
+    async def collect_results(
+        async_api: AsyncPyMarkdownApi,
+    ) -> List[Tuple[str, PyMarkdownScanPathResult]]:
+        return [
+            next_pair
+            async for next_pair in async_api.iterate_scan_path(
+                source_path, alternate_extensions=".txt"
+            )
+        ]
+
+    # Act
+    scan_results = asyncio.run(collect_results(AsyncPyMarkdownApi()))
+
+    # Assert
+    assert [next_file for next_file, _ in scan_results] == [
+        os.path.abspath(os.path.join(source_path, "simple_text_file.txt"))
+    ]
+    assert not scan_results[0][1].scan_failures
+
+
+def test_api_async_with_process_pool() -> None:
+    """
+    Test to make sure that a process pool can be used as the executor.
+    """
+
+    # Arrange
+    async def scan_strings(async_api: AsyncPyMarkdownApi) -> List[Any]:
+        return await asyncio.gather(
+            async_api.scan_string("#  Heading\n"), async_api.scan_string("# Heading\n")
+        )
+
+    # Act
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        scan_results = asyncio.run(scan_strings(AsyncPyMarkdownApi(executor=executor)))
+
+    # Assert
+    assert len(scan_results[0].scan_failures) == 1
+    assert not scan_results[1].scan_failures
+
+
+@pytest.mark.timeout(60)
+def test_api_async_default_executor_is_owned_process_pool() -> None:
+    """
+    Test to make sure that, unless an executor is supplied, a single pool of
+    worker processes is created when first needed and shut down when the
+    instance is closed.
+    """
+
+    # Arrange
+    created_pools: List[ProcessPoolExecutor] = []
+
+    def create_pool() -> ProcessPoolExecutor:
+        created_pools.append(ProcessPoolExecutor(max_workers=1))
+        return created_pools[-1]
+
+    async def scan_twice(async_api: AsyncPyMarkdownApi) -> List[bool]:
+        return [
+            bool((await async_api.scan_string(next_string)).scan_failures)
+            for next_string in ["#  Heading\n", "# Heading\n"]
+        ]
+
+    # Act
+    with mock.patch("pymarkdown.async_api.ProcessPoolExecutor", create_pool):
+        with AsyncPyMarkdownApi() as async_api:
+            assert not created_pools
+            scan_results = asyncio.run(scan_twice(async_api))
+
+    # Assert
+    assert scan_results == [True, False]
+    assert len(created_pools) == 1
+    with pytest.raises(RuntimeError):
+        created_pools[0].submit(print)
+
+
+@pytest.mark.timeout(60)
+def test_api_async_timeout_and_cancellation() -> None:
+    """
+    Test to make sure that a call that takes too long times out, and that
+    abandoning the iteration cancels any scans that have not started.
+    """
+
+    # Arrange
+    release_scan = threading.Event()
+    scan_finished = threading.Event()
+    original_scan_path = PyMarkdownApi.scan_path
+    scanned_files: List[str] = []
+
+    def slow_scan_path(self: PyMarkdownApi, path_to_scan: str, **kwargs: Any) -> Any:
+        scanned_files.append(path_to_scan)
+        release_scan.wait(10)
+        try:
+            return original_scan_path(self, path_to_scan, **kwargs)
+        finally:
+            scan_finished.set()
+
+    async def time_out_then_abandon(async_api: AsyncPyMarkdownApi) -> None:
+        with pytest.raises(asyncio.TimeoutError):
+            await async_api.scan_path("README.md", timeout=0.1)
+        release_scan.set()
+        await asyncio.to_thread(scan_finished.wait, 10)
+        release_scan.clear()
+
+        scan_iterator = async_api.iterate_scan_path(
+            os.path.join("test", "resources", "rules", "md022"), timeout=0.1
+        )
+        with pytest.raises(asyncio.TimeoutError):
+            await anext(scan_iterator)
+        await scan_iterator.aclose()
+        release_scan.set()
+
+    # Act
+    with mock.patch.object(PyMarkdownApi, "scan_path", slow_scan_path):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            start_time = time.monotonic()
+            asyncio.run(
+                time_out_then_abandon(
+                    AsyncPyMarkdownApi(executor=executor, max_pending_calls=2)
+                )
+            )
+            elapsed_time = time.monotonic() - start_time
+
+    # Assert
+    assert elapsed_time < 5
+    assert scanned_files[0] == "README.md"
+    assert len(scanned_files) == 2
+
+
+def test_api_async_bad_max_pending_calls() -> None:
+    """
+    Test to make sure that a bad number of pending calls is reported as an error.
+    """
+
+    # Arrange / Act / Assert
+    assert_that_exception_is_raised(
+        PyMarkdownApiArgumentException,
+        "Parameter named 'max_pending_calls' must be a positive integer.",
+        AsyncPyMarkdownApi,
+        max_pending_calls=0,
+    )
@@ -47,11 +47,16 @@ def test_api_exceptions_example_bad(caplog: pytest.LogCaptureFixture) -> None:
         print(f"API Exception: {this_exception}", file=sys.stderr)
         did_complete = False
 
-    assert (
-        caplog.text
-        == """WARNING  pymarkdown.main:main.py:348 Provided path 'some-manner-of-path' does not exist.
-"""
-    )
+    assert [
+        (log_record.name, log_record.levelname, log_record.getMessage())
+        for log_record in caplog.records
+    ] == [
+        (
+            "pymarkdown.main",
+            "WARNING",
+            "Provided path 'some-manner-of-path' does not exist.",
+        )
+    ]
     assert not did_complete
 
 
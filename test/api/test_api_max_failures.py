@@ -0,0 +1,71 @@
+"""
+Module for directly using PyMarkdown's api to stop scanning once enough failures
+are found.
+"""
+
+import os
+from test.utils import assert_that_exception_is_raised
+
+from pymarkdown.api import PyMarkdownApi, PyMarkdownApiArgumentException
+
+
+def test_api_max_failures_scan_path() -> None:
+    """
+    Test to make sure that only the first failures, in the order that they are
+    normally reported, are returned.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md022")
+    all_failures = PyMarkdownApi().scan_path(source_path).scan_failures
+
+    # Act
+    first_result = PyMarkdownApi().fail_fast().scan_path(source_path)
+    limited_result = PyMarkdownApi().max_failures(3).scan_path(source_path)
+
+    # Assert
+    assert len(all_failures) > 3
+    assert first_result.scan_failures == all_failures[:1]
+    assert len(limited_result.scan_failures) == 3
+    assert limited_result.scan_failures[0] == all_failures[0]
+
+
+def test_api_max_failures_scan_strings() -> None:
+    """
+    Test to make sure that no more documents are scanned once the failure budget
+    is used up, including when the documents are scanned in batches.
+    """
+
+    # Arrange
+    documents_to_scan = [
+        ("first", "# Heading\n"),
+        ("second", "#  Heading\n"),
+        ("third", "#  Heading\n"),
+        ("fourth", "#  Heading\n"),
+    ]
+
+    for api_instance in (PyMarkdownApi(), PyMarkdownApi().jobs(2)):
+        # Act
+        scan_results = list(
+            api_instance.max_failures(2).scan_strings(documents_to_scan)
+        )
+
+        # Assert
+        assert [
+            (next_result.document_id, len(next_result.scan_failures))
+            for next_result in scan_results
+        ] == [("first", 0), ("second", 1), ("third", 1)]
+
+
+def test_api_max_failures_bad_value() -> None:
+    """
+    Test to make sure that the maximum number of failures must be a positive integer.
+    """
+
+    # Arrange / Act / Assert
+    assert_that_exception_is_raised(
+        PyMarkdownApiArgumentException,
+        "Parameter named 'failure_count' must be a positive integer.",
+        PyMarkdownApi().max_failures,
+        0,
+    )
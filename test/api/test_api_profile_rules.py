@@ -0,0 +1,53 @@
+"""
+Module for directly using PyMarkdown's api to profile the time spent in each
+rule plugin.
+"""
+
+from pymarkdown.api import PyMarkdownApi
+
+
+def test_api_profile_rules_scan_string() -> None:
+    """
+    Test to make sure that the time spent in each rule plugin is only returned
+    if requested.
+    """
+
+    # Arrange
+    string_to_scan = "#  Heading\n"
+
+    # Act
+    normal_result = PyMarkdownApi().scan_string(string_to_scan)
+    profiled_result = PyMarkdownApi().profile_rules().scan_string(string_to_scan)
+
+    # Assert
+    assert not normal_result.rule_profiles
+    assert profiled_result.scan_failures == normal_result.scan_failures
+    assert ("md019", "next_token", 3) in [
+        (
+            next_profile.plugin_id,
+            next_profile.callback_name,
+            next_profile.call_count,
+        )
+        for next_profile in profiled_result.rule_profiles
+    ]
+
+
+def test_api_profile_rules_session() -> None:
+    """
+    Test to make sure that each scan within a session only returns the time
+    spent scanning for that scan.
+    """
+
+    # Arrange
+    with PyMarkdownApi().profile_rules().session() as scan_session:
+        # Act
+        first_result = scan_session.scan_string("# Heading\n")
+        second_result = scan_session.scan_string("# Heading\n")
+
+    # Assert
+    for scan_result in (first_result, second_result):
+        assert {
+            next_profile.call_count
+            for next_profile in scan_result.rule_profiles
+            if next_profile.callback_name == "completed_file"
+        } == {1}
@@ -267,6 +267,111 @@ def test_api_scan_recursive_for_directory() -> None:
     assert_if_lists_different(scan_failures, expected_failure_paths)
 
 
+@pytest.mark.timeout(120)
+def test_api_scan_recursive_for_directory_with_jobs() -> None:
+    """
+    Test to make sure that scanning a directory with multiple jobs gives the
+    same results, in the same order, as scanning with a single job.
+    """
+
+    # Arrange
+    base_path = os.path.join("docs")
+    serial_result = (
+        PyMarkdownApi()
+        .set_integer_property("plugins.md013.line_length", 100)
+        .scan_path(base_path, recurse_if_directory=True)
+    )
+
+    # Act
+    scan_result = (
+        PyMarkdownApi()
+        .set_integer_property("plugins.md013.line_length", 100)
+        .jobs(2)
+        .scan_path(base_path, recurse_if_directory=True)
+    )
+
+    # Assert
+    assert scan_result
+    assert len(scan_result.scan_failures) == 142
+    assert scan_result.scan_failures == serial_result.scan_failures
+    assert scan_result.pragma_errors == serial_result.pragma_errors
+
+
+def test_api_scan_bad_jobs() -> None:
+    """
+    Test to make sure that a job count that is not positive is reported as an error.
+    """
+
+    # Arrange
+    expected_output = "Parameter named 'job_count' must be a positive integer."
+
+    # Act & Assert
+    caught_exception = assert_that_exception_is_raised(
+        PyMarkdownApiArgumentException,
+        expected_output,
+        PyMarkdownApi().jobs,
+        0,
+    )
+
+    # Assert
+    assert (
+        cast(PyMarkdownApiArgumentException, caught_exception).argument_name
+        == "job_count"
+    )
+
+
+def test_api_scan_with_cache_directory(tmpdir: py._path.local.LocalPath) -> None:
+    """
+    Test to make sure that scanning with a cache directory gives the same results
+    when the results are cached and when they are replayed from the cache.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md022")
+    cache_directory = str(tmpdir)
+    first_result = (
+        PyMarkdownApi()
+        .cache_directory(cache_directory)
+        .scan_path(source_path, recurse_if_directory=True)
+    )
+
+    # Act
+    scan_result = (
+        PyMarkdownApi()
+        .cache_directory(cache_directory)
+        .scan_path(source_path, recurse_if_directory=True)
+    )
+
+    # Assert
+    assert scan_result.scan_failures
+    assert scan_result.scan_failures == first_result.scan_failures
+    assert scan_result.pragma_errors == first_result.pragma_errors
+    assert os.listdir(cache_directory)
+
+
+def test_api_scan_bad_cache_directory() -> None:
+    """
+    Test to make sure that an empty cache directory is reported as an error.
+    """
+
+    # Arrange
+    expected_output = "Parameter named 'cache_directory_path' cannot be empty."
+
+    # Act & Assert
+    caught_exception = assert_that_exception_is_raised(
+        PyMarkdownApiArgumentException,
+        expected_output,
+        PyMarkdownApi().cache_directory,
+        "",
+    )
+
+    # Assert
+    assert (
+        cast(PyMarkdownApiArgumentException, caught_exception).argument_name
+        == "cache_directory_path"
+    )
+
+
 def test_api_scan_with_multiple_scan_issues() -> None:
     """
     Test to make sure that we can handle multiple scan issues within
@@ -0,0 +1,212 @@
+"""
+Module for directly using PyMarkdown's api to scan batches of strings.
+"""
+
+from test.utils import assert_that_exception_is_raised
+from typing import Any, Generator, List, Tuple
+from unittest import mock
+
+import pytest
+
+from pymarkdown.api import (
+    PyMarkdownApi,
+    PyMarkdownApiArgumentException,
+    PyMarkdownPragmaError,
+    PyMarkdownScanStringsResult,
+)
+from pymarkdown.parallel_scan_helper import ParallelScanHelper
+from pymarkdown.plugin_manager.plugin_manager import PluginManager
+
+__SOURCE_DOCUMENTS = [
+    ("first", "#  Heading\n"),
+    ("second", "# Heading\n"),
+    ("third", "# Heading\n<!-- pyml bad -->\n#  Other Heading\n"),
+]
+
+
+def __summarize(
+    scan_results: List[PyMarkdownScanStringsResult],
+) -> List[Tuple[str, List[Tuple[str, int, str]], List[PyMarkdownPragmaError]]]:
+    return [
+        (
+            next_result.document_id,
+            [
+                (next_failure.scan_file, next_failure.line_number, next_failure.rule_id)
+                for next_failure in next_result.scan_failures
+            ],
+            next_result.pragma_errors,
+        )
+        for next_result in scan_results
+    ]
+
+
+__EXPECTED_SUMMARY = [
+    ("first", [("first", 1, "MD019")], []),
+    ("second", [], []),
+    (
+        "third",
+        [
+            ("third", 1, "MD022"),
+            ("third", 3, "MD019"),
+            ("third", 3, "MD022"),
+            ("third", 3, "MD025"),
+        ],
+        [
+            PyMarkdownPragmaError(
+                "third", 2, "Inline configuration command 'bad' not understood."
+            )
+        ],
+    ),
+]
+
+
+def test_api_scan_strings_yields_each_document() -> None:
+    """
+    Test to make sure that each document is reported on separately, in order,
+    and without writing any of the documents to disk.
+    """
+
+    # Arrange
+    original_initialize = PluginManager.initialize
+
+    # Act
+    with mock.patch(
+        "tempfile.NamedTemporaryFile",
+        side_effect=AssertionError("Documents should not be written to disk."),
+    ), mock.patch.object(
+        PluginManager, "initialize", autospec=True, side_effect=original_initialize
+    ) as mock_initialize:
+        scan_results = list(PyMarkdownApi().scan_strings(__SOURCE_DOCUMENTS))
+
+    # Assert
+    assert __summarize(scan_results) == __EXPECTED_SUMMARY
+    assert mock_initialize.call_count == 1
+    assert not any(next_result.critical_errors for next_result in scan_results)
+
+
+def test_api_scan_strings_streams_results() -> None:
+    """
+    Test to make sure that the results for a document are yielded before the
+    next document is requested.
+    """
+
+    # Arrange
+    requested_documents: List[str] = []
+
+    def generate_documents() -> Generator[Tuple[str, str], None, None]:
+        for document_id, document_text in __SOURCE_DOCUMENTS:
+            requested_documents.append(document_id)
+            yield document_id, document_text
+
+    # Act
+    scan_results = PyMarkdownApi().scan_strings(generate_documents())
+    first_result = next(scan_results)
+
+    # Assert
+    assert first_result.document_id == "first"
+    assert requested_documents == ["first"]
+    assert [next_result.document_id for next_result in scan_results] == [
+        "second",
+        "third",
+    ]
+
+
+def test_api_scan_strings_with_jobs() -> None:
+    """
+    Test to make sure that scanning the documents with worker processes produces
+    the same results as scanning them within this process.
+    """
+
+    # Arrange / Act
+    scan_results = list(PyMarkdownApi().jobs(2).scan_strings(__SOURCE_DOCUMENTS))
+
+    # Assert
+    assert __summarize(scan_results) == __EXPECTED_SUMMARY
+
+
+@pytest.mark.timeout(60)
+def test_api_scan_strings_with_jobs_reuses_worker_processes() -> None:
+    """
+    Test to make sure that when the documents are scanned in more than one batch,
+    every batch is handed to the same pool of worker processes.
+    """
+
+    # Arrange
+    original_create_executor = ParallelScanHelper.create_executor
+
+    # Act
+    with mock.patch.object(
+        PyMarkdownApi, "_PyMarkdownApi__documents_per_job_in_batch", 1
+    ), mock.patch.object(
+        ParallelScanHelper,
+        "create_executor",
+        side_effect=original_create_executor,
+    ) as mock_create_executor:
+        scan_results = list(PyMarkdownApi().jobs(2).scan_strings(__SOURCE_DOCUMENTS))
+
+    # Assert
+    assert __summarize(scan_results) == __EXPECTED_SUMMARY
+    assert mock_create_executor.call_count == 1
+
+
+def test_api_scan_strings_within_session() -> None:
+    """
+    Test to make sure that scanning strings within a session reuses the plugins
+    initialized by that session.
+    """
+
+    # Arrange
+    original_initialize = PluginManager.initialize
+
+    # Act
+    with mock.patch.object(
+        PluginManager, "initialize", autospec=True, side_effect=original_initialize
+    ) as mock_initialize:
+        with PyMarkdownApi().session() as scan_session:
+            first_result = scan_session.scan_string("#  Heading\n")
+            scan_results = list(scan_session.scan_strings(__SOURCE_DOCUMENTS))
+
+    # Assert
+    assert len(first_result.scan_failures) == 1
+    assert __summarize(scan_results) == __EXPECTED_SUMMARY
+    assert mock_initialize.call_count == 1
+
+
+def test_api_scan_strings_bad_documents() -> None:
+    """
+    Test to make sure that badly formed documents and duplicate identifiers are
+    reported as errors.
+    """
+
+    # Arrange
+    bad_arguments: List[Tuple[Any, str, str]] = [
+        (
+            ["not a pair"],
+            "documents_to_scan",
+            "Parameter named 'documents_to_scan' must only contain pairs of strings.",
+        ),
+        (
+            [("", "# Heading\n")],
+            "document_id",
+            "Parameter named 'document_id' cannot be empty.",
+        ),
+        (
+            [("same", "# Heading\n"), ("same", "# Heading\n")],
+            "document_id",
+            "Document identifier 'same' was used more than once.",
+        ),
+    ]
+
+    for documents_to_scan, argument_name, expected_output in bad_arguments:
+        # Act
+        caught_exception = assert_that_exception_is_raised(
+            PyMarkdownApiArgumentException,
+            expected_output,
+            lambda documents=documents_to_scan: list(
+                PyMarkdownApi().scan_strings(documents)
+            ),
+        )
+
+        # Assert
+        assert isinstance(caught_exception, PyMarkdownApiArgumentException)
+        assert caught_exception.argument_name == argument_name
@@ -0,0 +1,265 @@
+"""
+Module for directly using PyMarkdown's api through a session.
+"""
+
+import os
+from test.utils import assert_that_exception_is_raised, create_temporary_markdown_file
+from unittest import mock
+
+import pytest
+
+from pymarkdown.api import (
+    PyMarkdownApi,
+    PyMarkdownApiException,
+    PyMarkdownApiNoFilesFoundException,
+    PyMarkdownFixStringResult,
+    PyMarkdownScanFailure,
+)
+from pymarkdown.application_configuration_helper import ApplicationConfigurationHelper
+from pymarkdown.file_scan_helper import FileScanHelper
+from pymarkdown.main import PyMarkdownLint
+from pymarkdown.plugin_manager.plugin_manager import PluginManager
+
+
+def test_api_session_scan_string_initializes_once() -> None:
+    """
+    Test to make sure that a session only initializes the plugins once, and that
+    the results of each scan only contain the failures for that scan.
+    """
+
+    # Arrange
+    original_initialize = PluginManager.initialize
+
+    # Act
+    with mock.patch.object(
+        PluginManager, "initialize", autospec=True, side_effect=original_initialize
+    ) as mock_initialize:
+        with PyMarkdownApi().session() as scan_session:
+            first_result = scan_session.scan_string("#  Heading\n")
+            second_result = scan_session.scan_string("# Heading\n")
+            third_result = scan_session.scan_string("#  Heading\n")
+
+    # Assert
+    assert mock_initialize.call_count == 1
+    expected_failure = PyMarkdownScanFailure(
+        scan_file="in-memory",
+        line_number=1,
+        column_number=1,
+        rule_id="MD019",
+        rule_name="no-multiple-space-atx",
+        rule_description="Multiple spaces are present after hash character on Atx Heading.",
+        extra_error_information="",
+    )
+    assert first_result.scan_failures == [expected_failure]
+    assert not second_result.scan_failures
+    assert third_result.scan_failures == [expected_failure]
+    assert not first_result.pragma_errors and not third_result.pragma_errors
+
+
+def test_api_session_scan_string_configures_once() -> None:
+    """
+    Test to make sure that a session only parses the arguments and loads the
+    configuration once for the same options, and does so again when they change.
+    """
+
+    # Arrange
+    api_instance = PyMarkdownApi()
+    original_apply = ApplicationConfigurationHelper.apply_configuration_layers
+
+    # Act
+    with mock.patch.object(
+        ApplicationConfigurationHelper,
+        "apply_configuration_layers",
+        side_effect=original_apply,
+    ) as mock_apply:
+        with api_instance.session() as scan_session:
+            first_result = scan_session.scan_string("#  Heading\n")
+            second_result = scan_session.scan_string("#  Heading\n")
+            configured_count = mock_apply.call_count
+            api_instance.disable_rule_by_identifier("md019")
+            third_result = scan_session.scan_string("#  Heading\n")
+
+    # Assert
+    assert configured_count == 1
+    assert mock_apply.call_count == 2
+    assert len(first_result.scan_failures) == 1
+    assert second_result == first_result
+    assert not third_result.scan_failures
+
+
+def test_api_session_matches_api_without_session() -> None:
+    """
+    Test to make sure that scanning a path and fixing a string within a session
+    produce the same results as doing so without a session.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md022")
+    string_to_fix = "#  Heading\n\nSome text\n"
+
+    expected_scan_result = PyMarkdownApi().scan_path(source_path)
+    expected_fix_result = PyMarkdownApi().fix_string(string_to_fix)
+
+    # Act
+    with PyMarkdownApi().session() as scan_session:
+        scan_result = scan_session.scan_path(source_path)
+        fix_result = scan_session.fix_string(string_to_fix)
+        second_scan_result = scan_session.scan_path(source_path)
+
+    # Assert
+    assert expected_scan_result.scan_failures
+    assert scan_result == expected_scan_result
+    assert second_scan_result == expected_scan_result
+    assert fix_result == expected_fix_result
+    assert fix_result == PyMarkdownFixStringResult(True, "# Heading\n\nSome text\n")
+
+
+def test_api_session_scans_without_running_main() -> None:
+    """
+    Test to make sure that calls within a session use the scanner initialized
+    for the session directly, instead of running the application for each call,
+    and that only one file scanner is created for them.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md022")
+    original_file_scan_helper_init = FileScanHelper.__init__
+
+    # Act
+    with mock.patch.object(
+        PyMarkdownLint,
+        "main",
+        side_effect=AssertionError("Application should not have been run."),
+    ), mock.patch.object(
+        FileScanHelper,
+        "__init__",
+        autospec=True,
+        side_effect=original_file_scan_helper_init,
+    ) as mock_file_scan_helper_init:
+        with PyMarkdownApi().session() as scan_session:
+            scan_result = scan_session.scan_path(source_path)
+            string_result = scan_session.scan_string("#  Heading\n")
+            strings_results = list(
+                scan_session.scan_strings([("first", "#  Heading\n")])
+            )
+            fix_result = scan_session.fix_string("#  Heading\n")
+
+    # Assert
+    assert mock_file_scan_helper_init.call_count == 1
+    assert scan_result.scan_failures
+    assert len(string_result.scan_failures) == 1
+    assert len(strings_results[0].scan_failures) == 1
+    assert fix_result == PyMarkdownFixStringResult(True, "# Heading\n")
+
+
+def test_api_session_reports_errors_as_exceptions() -> None:
+    """
+    Test to make sure that errors within a session are raised as the same
+    exceptions, with the same messages, as they are without a session, and that
+    the session can still be used afterwards.
+    """
+
+    # Arrange
+    api_instance = PyMarkdownApi()
+    bad_plugin_path = os.path.join("test", "resources", "plugins", "does-not-exist")
+    with pytest.raises(PyMarkdownApiException) as expected_exception:
+        PyMarkdownApi().add_plugin_path(bad_plugin_path).scan_string("# Heading\n")
+    expected_message = expected_exception.value.reason
+
+    # Act
+    with api_instance.session() as scan_session:
+        assert_that_exception_is_raised(
+            PyMarkdownApiNoFilesFoundException,
+            "No matching files found.",
+            scan_session.scan_path,
+            "does-not-exist",
+        )
+        result_after_error = scan_session.scan_string("#  Heading\n")
+        api_instance.add_plugin_path(bad_plugin_path)
+        assert_that_exception_is_raised(
+            PyMarkdownApiException,
+            expected_message,
+            scan_session.scan_string,
+            "# Heading\n",
+        )
+
+    # Assert
+    assert len(result_after_error.scan_failures) == 1
+
+
+def test_api_session_honors_configuration_changes() -> None:
+    """
+    Test to make sure that changing the configuration during a session is honored.
+    """
+
+    # Arrange
+    api_instance = PyMarkdownApi()
+
+    # Act
+    with api_instance.session() as scan_session:
+        first_result = scan_session.scan_string("#  Heading\n")
+        api_instance.disable_rule_by_identifier("md019")
+        second_result = scan_session.scan_string("#  Heading\n")
+
+    # Assert
+    assert len(first_result.scan_failures) == 1
+    assert not second_result.scan_failures
+
+
+def test_api_session_fix_path() -> None:
+    """
+    Test to make sure that a session can fix files more than once.
+    """
+
+    # Arrange
+    with create_temporary_markdown_file(
+        "#  Heading\n"
+    ) as first_path, create_temporary_markdown_file("# Heading\n") as second_path:
+
+        # Act
+        with PyMarkdownApi().session() as scan_session:
+            first_result = scan_session.fix_path(first_path)
+            second_result = scan_session.fix_path(second_path)
+
+        # Assert
+        assert first_result.files_fixed == [first_path]
+        assert not second_result.files_fixed
+        with open(first_path, "rt", encoding="utf-8") as fixed_file:
+            assert fixed_file.read() == "# Heading\n"
+
+
+def test_api_session_already_active() -> None:
+    """
+    Test to make sure that only one session can be active for an instance at a time,
+    and that another session can be started once the first one is closed.
+    """
+
+    # Arrange
+    api_instance = PyMarkdownApi()
+    first_session = api_instance.session()
+
+    # Act & Assert
+    assert_that_exception_is_raised(
+        PyMarkdownApiException, "A session is already active.", api_instance.session
+    )
+    first_session.close()
+    with api_instance.session() as second_session:
+        assert not second_session.scan_string("# Heading\n").scan_failures
+
+
+def test_api_session_closed() -> None:
+    """
+    Test to make sure that a session cannot be used once it is closed.
+    """
+
+    # Arrange
+    with PyMarkdownApi().session() as scan_session:
+        pass
+
+    # Act & Assert
+    assert_that_exception_is_raised(
+        PyMarkdownApiException,
+        "The session has already been closed.",
+        scan_session.scan_string,
+        "# Heading\n",
+    )
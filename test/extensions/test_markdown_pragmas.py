@@ -9,6 +9,8 @@ from typing import Tuple
 
 import pytest
 
+from pymarkdown.plugin_manager.suppression_range_index import SuppressionRangeIndex
+
 
 def __generate_source_path(source_file_name: str) -> Tuple[str, str]:
     source_path = os.path.join("test", "resources", "pragmas", source_file_name)
@@ -1105,3 +1107,63 @@ def test_pragmas_multiple_enable_with_no_rules(
 
     # Assert
     execute_results.assert_results(expected_results=expected_results)
+
+
+@pytest.mark.gfm
+def test_pragmas_overlapping_disable_ranges(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test the case where a 'disable-num-lines' pragma starts within a 'disable' and
+    'enable' pair for the same rule, and continues past the 'enable'.
+    """
+
+    # Arrange
+    source_path, abs_source_path = __generate_source_path(
+        "atx_heading_with_multiple_spaces_overlapping_disable_ranges.md",
+    )
+    supplied_arguments = [
+        "scan",
+        source_path,
+    ]
+
+    expected_results = ExpectedResults(
+        return_code=1,
+        expected_output=f"""{abs_source_path}:8:1: MD013: Line length [Expected: 80, Actual: 85] (line-length)
+{abs_source_path}:10:1: MD013: Line length [Expected: 80, Actual: 85] (line-length)""",
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_suppression_range_index_merges_ranges() -> None:
+    """
+    Test to make sure that overlapping and adjacent ranges for a rule are merged,
+    and that the ranges for one rule do not suppress another rule.
+    """
+
+    # Arrange
+    suppression_range_index = SuppressionRangeIndex()
+
+    # Act
+    suppression_range_index.build(
+        [(4, 7, {"md013", "md019"}), (20, 21, {"md013"})],
+        [(1, 5, "md013"), (8, 9, "md013"), (30, 9999, "md019")],
+    )
+
+    # Assert
+    assert [
+        line_number
+        for line_number in range(1, 32)
+        if suppression_range_index.is_line_suppressed("md013", line_number)
+    ] == [1, 2, 3, 4, 5, 6, 7, 8, 9, 20, 21]
+    assert [
+        line_number
+        for line_number in range(1, 32)
+        if suppression_range_index.is_line_suppressed("md019", line_number)
+    ] == [4, 5, 6, 7, 30, 31]
+    assert not suppression_range_index.is_line_suppressed("md001", 5)
@@ -209,6 +209,48 @@ def test_pragmas_issue_1479_xx3(scanner_default: MarkdownScanner) -> None:
     execute_results.assert_results(expected_results=expected_results)
 
 
+@pytest.mark.gfm
+def test_pragmas_issue_1479_xx4(scanner_default: MarkdownScanner) -> None:
+    """
+    Test the case where a single document has multiple rules that trigger on
+    different kinds of elements, some with a single blank line between the pragma
+    and the element, and one without any pragma.  This makes sure that each of the
+    rule failures in the document are checked against the same table of which
+    tokens are prefaced by a blank line.
+    """
+
+    # Arrange
+    source_markdown = """<!-- pyml disable-next-line no-space-in-links -->
+
+this is not [ a proper ](https://www.example.com) link
+
+this is not [ a proper ](https://www.example.com) link either
+
+* first
+<!-- pyml disable-next-line ul-style -->
+
++ second
+"""
+    with create_temporary_markdown_file(
+        supplied_configuration=source_markdown
+    ) as markdown_file_path:
+        supplied_arguments = [
+            "scan",
+            markdown_file_path,
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output=f"""{markdown_file_path}:5:13: MD039: Spaces inside link text (no-space-in-links)""",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
 @pytest.mark.gfm
 def test_pragmas_issue_1479_Md026_no_pragma_then_atx(
     scanner_default: MarkdownScanner,
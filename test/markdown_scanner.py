@@ -33,6 +33,12 @@ class AlternateMainPresentation(MainPresentation):
         """
         print("[pso[" + output_string + "]]", file=sys.stdout)
 
+    def print_system_output_text(self, output_text: str) -> None:
+        """
+        Root function to output text to standard out exactly as it is supplied.
+        """
+        sys.stdout.write("[pst[" + output_text + "]]")
+
     def print_system_error(self, error_string: str) -> None:
         """
         Root function to output to standard error.
@@ -0,0 +1,25 @@
+"""
+Module to implement a sample plugin that has a bad token kinds field from get_details.
+"""
+
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV4
+from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+
+
+class BadTokenKindsIsInt(RulePlugin):
+    """
+    Class to implement a sample plugin that has a bad token kinds field from get_details.
+    """
+
+    def get_details(self):
+        """
+        Get the details for the plugin.
+        """
+        return PluginDetailsV4(
+            plugin_name="bad-token-kinds-is-int",
+            plugin_id="MDE008",
+            plugin_enabled_by_default=True,
+            plugin_description="Plugin that has a bad token kinds detail.",
+            plugin_version="0.0.0",
+            plugin_token_kinds=123,
+        )
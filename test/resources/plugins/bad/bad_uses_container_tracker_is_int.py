@@ -0,0 +1,25 @@
+"""
+Module to implement a sample plugin that has a bad container tracker field from get_details.
+"""
+
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV4
+from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+
+
+class BadUsesContainerTrackerIsInt(RulePlugin):
+    """
+    Class to implement a sample plugin that has a bad container tracker field from get_details.
+    """
+
+    def get_details(self):
+        """
+        Get the details for the plugin.
+        """
+        return PluginDetailsV4(
+            plugin_name="bad-uses-container-tracker-is-int",
+            plugin_id="MDE009",
+            plugin_enabled_by_default=True,
+            plugin_description="Plugin that has a bad container tracker detail.",
+            plugin_version="0.0.0",
+            plugin_uses_container_tracker=123,
+        )
@@ -0,0 +1,25 @@
+"""
+Module to implement a sample plugin that has a bad inline tokens field from get_details.
+"""
+
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV3
+from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+
+
+class BadUsesInlineTokensIsInt(RulePlugin):
+    """
+    Class to implement a sample plugin that has a bad inline tokens field from get_details.
+    """
+
+    def get_details(self):
+        """
+        Get the details for the plugin.
+        """
+        return PluginDetailsV3(
+            plugin_name="bad-uses-inline-tokens-is-int",
+            plugin_id="MDE006",
+            plugin_enabled_by_default=True,
+            plugin_description="Plugin that has a bad inline tokens detail.",
+            plugin_version="0.0.0",
+            plugin_uses_inline_tokens=123,
+        )
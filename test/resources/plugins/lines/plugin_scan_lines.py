@@ -0,0 +1,47 @@
+"""
+Module to implement a sample plugin that reports the facts about the lines
+that it is sent all at once.
+"""
+
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV4
+from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+
+
+class PluginScanLines(RulePlugin):
+    """
+    Class to implement a sample plugin that reports the facts about the lines
+    that it is sent all at once.
+    """
+
+    def get_details(self):
+        """
+        Get the details for the plugin.
+        """
+        return PluginDetailsV4(
+            plugin_name="debug-scan-lines",
+            plugin_id="MD993",
+            plugin_enabled_by_default=True,
+            plugin_description="Debug plugin",
+            plugin_version="0.0.0",
+        )
+
+    def next_line(self, context, line):
+        """
+        Event that a new line is being processed.
+        """
+        _ = context
+        print(f"{self.get_details().plugin_id}>>next_line:{line}")
+
+    def scan_lines(self, context, lines):
+        """
+        Event that all the lines of a file are being scanned at once.
+        """
+        _ = context
+        for next_line_facts in lines:
+            print(
+                f"{self.get_details().plugin_id}>>scan_lines:"
+                + f"{next_line_facts.line_number}:{next_line_facts.line_length}:"
+                + f"{next_line_facts.trailing_whitespace_length}:"
+                + f"{next_line_facts.first_tab_index}:{next_line_facts.is_last_line}:"
+                + f"{next_line_facts.is_prefaced_by_blank_line}"
+            )
@@ -0,0 +1,46 @@
+"""
+Module to implement a sample plugin that reports the outline of the headings in
+each document.
+"""
+
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV4
+from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+
+
+class PluginHeadingOutline(RulePlugin):
+    """
+    Class to implement a sample plugin that reports the outline of the headings in
+    each document.
+    """
+
+    def get_details(self):
+        """
+        Get the details for the plugin.
+        """
+        return PluginDetailsV4(
+            plugin_name="debug-heading-outline",
+            plugin_id="MD994",
+            plugin_enabled_by_default=True,
+            plugin_description="Debug plugin",
+            plugin_version="0.0.0",
+        )
+
+    def scan_tokens(self, context, tokens):
+        """
+        Event that all the tokens of a file are being processed at once.
+        """
+        _ = tokens
+        heading_outline = context.heading_outline
+        for next_heading in heading_outline:
+            contained_names = ",".join(
+                next_token.token_name for next_token in next_heading.contained_tokens
+            )
+            print(
+                f"{self.get_details().plugin_id}>>{next_heading.heading_token.token_name}:"
+                + f"{next_heading.level}:{next_heading.heading_token.line_number}:"
+                + f"{contained_names}:{next_heading.end_token.token_name}"
+            )
+        print(
+            f"{self.get_details().plugin_id}>>shared:"
+            + f"{context.heading_outline is heading_outline}"
+        )
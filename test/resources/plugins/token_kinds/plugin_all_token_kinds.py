@@ -0,0 +1,33 @@
+"""
+Module to implement a sample plugin that reports each token that it is sent,
+without asking for any specific kinds of tokens.
+"""
+
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV4
+from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+
+
+class PluginAllTokenKinds(RulePlugin):
+    """
+    Class to implement a sample plugin that reports each token that it is sent,
+    without asking for any specific kinds of tokens.
+    """
+
+    def get_details(self):
+        """
+        Get the details for the plugin.
+        """
+        return PluginDetailsV4(
+            plugin_name="debug-all-token-kinds",
+            plugin_id="MD996",
+            plugin_enabled_by_default=True,
+            plugin_description="Debug plugin",
+            plugin_version="0.0.0",
+        )
+
+    def next_token(self, context, token):
+        """
+        Event that a new token is being processed.
+        """
+        _ = context
+        print(f"{self.get_details().plugin_id}>>next_token:{token.token_name}")
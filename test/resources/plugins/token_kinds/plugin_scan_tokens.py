@@ -0,0 +1,42 @@
+"""
+Module to implement a sample plugin that reports the tokens that it is sent
+all at once, only asking for the heading tokens.
+"""
+
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV4
+from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+
+
+class PluginScanTokens(RulePlugin):
+    """
+    Class to implement a sample plugin that reports the tokens that it is sent
+    all at once, only asking for the heading tokens.
+    """
+
+    def get_details(self):
+        """
+        Get the details for the plugin.
+        """
+        return PluginDetailsV4(
+            plugin_name="debug-scan-tokens",
+            plugin_id="MD995",
+            plugin_enabled_by_default=True,
+            plugin_description="Debug plugin",
+            plugin_version="0.0.0",
+            plugin_token_kinds="atx, setext",
+        )
+
+    def next_token(self, context, token):
+        """
+        Event that a new token is being processed.
+        """
+        _ = context
+        print(f"{self.get_details().plugin_id}>>next_token:{token.token_name}")
+
+    def scan_tokens(self, context, tokens):
+        """
+        Event that all the tokens of a file are being processed at once.
+        """
+        _ = context
+        token_names = ",".join(next_token.token_name for next_token in tokens)
+        print(f"{self.get_details().plugin_id}>>scan_tokens:{token_names}")
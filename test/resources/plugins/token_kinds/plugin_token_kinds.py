@@ -0,0 +1,34 @@
+"""
+Module to implement a sample plugin that reports each token that it is sent,
+only asking for the heading tokens.
+"""
+
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV4
+from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+
+
+class PluginTokenKinds(RulePlugin):
+    """
+    Class to implement a sample plugin that reports each token that it is sent,
+    only asking for the heading tokens.
+    """
+
+    def get_details(self):
+        """
+        Get the details for the plugin.
+        """
+        return PluginDetailsV4(
+            plugin_name="debug-token-kinds",
+            plugin_id="MD997",
+            plugin_enabled_by_default=True,
+            plugin_description="Debug plugin",
+            plugin_version="0.0.0",
+            plugin_token_kinds="atx, setext",
+        )
+
+    def next_token(self, context, token):
+        """
+        Event that a new token is being processed.
+        """
+        _ = context
+        print(f"{self.get_details().plugin_id}>>next_token:{token.token_name}")
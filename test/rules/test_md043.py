@@ -6,6 +6,7 @@ import os
 from test.markdown_scanner import MarkdownScanner
 from test.pytest_execute import ExpectedResults
 from test.rules.utils import execute_query_configuration_test, pluginQueryConfigTest
+from test.utils import create_temporary_markdown_file
 from typing import List, Tuple
 
 import pytest
@@ -1113,6 +1114,84 @@ def test_md043_bad_good_many_level_two_1_star_3_2_star_3(
     execute_results.assert_results(expected_results=expected_results)
 
 
+__many_repeated_headings = "\n".join(["# Heading A\n"] * 60 + ["# Heading B\n"])
+__many_wildcard_groups = ",*,".join(["# Heading A"] * 12)
+
+
+@pytest.mark.rules
+def test_md043_good_many_headings_many_wildcard_groups(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure this rule does not trigger with a document that
+    contains many headings and a pattern with many groups of wildcards that
+    can all be matched.
+    """
+
+    # Arrange
+    with create_temporary_markdown_file(
+        supplied_configuration=__many_repeated_headings
+    ) as markdown_file_path:
+        supplied_arguments = [
+            "--disable-rules",
+            "md024,md025",
+            "--set",
+            f"plugins.md043.headings=*,{__many_wildcard_groups},*,# Heading B,*",
+            "--strict-config",
+            "scan",
+            markdown_file_path,
+        ]
+
+        expected_results = ExpectedResults()
+
+        # Act
+        execute_results = scanner_default.invoke_main(
+            arguments=supplied_arguments, suppress_first_line_heading_rule=False
+        )
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+@pytest.mark.rules
+def test_md043_bad_many_headings_many_wildcard_groups(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure this rule does trigger with a document that
+    contains many headings and a pattern with many groups of wildcards where
+    the last group cannot be matched, without taking an exponential amount of
+    time to find that out.
+    """
+
+    # Arrange
+    with create_temporary_markdown_file(
+        supplied_configuration=__many_repeated_headings
+    ) as markdown_file_path:
+        supplied_arguments = [
+            "--disable-rules",
+            "md024,md025",
+            "--set",
+            f"plugins.md043.headings=*,{__many_wildcard_groups},*,# Heading C,*",
+            "--strict-config",
+            "scan",
+            markdown_file_path,
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output=f"""{markdown_file_path}:1:1: MD043: Required heading structure [Multiple wildcard matching failed.] (required-headings,required-headers)""",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(
+            arguments=supplied_arguments, suppress_first_line_heading_rule=False
+        )
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
 @pytest.mark.rules
 def test_md043_query_config() -> None:
     config_test = pluginQueryConfigTest(
@@ -138,6 +138,39 @@ error reporting works.
 appear on multiple lines so we can make sure that
 advancing the line and column for the ParaGraph
 error reporting works.
+""",
+    ),
+    pluginRuleTest(
+        "bad_paragraph_text_multiples_with_newline_before_first",
+        source_file_contents="""this is a sample where the
+paragraph is on one line and the paragraph
+is on the next line, with another paragraph.
+""",
+        set_args=["plugins.md044.names=ParaGraph"],
+        scan_expected_return_code=1,
+        scan_expected_output="""{temp_source_path}:2:1: MD044: Proper names should have the correct capitalization [Expected: ParaGraph; Actual: paragraph] (proper-names)
+{temp_source_path}:2:34: MD044: Proper names should have the correct capitalization [Expected: ParaGraph; Actual: paragraph] (proper-names)
+{temp_source_path}:3:35: MD044: Proper names should have the correct capitalization [Expected: ParaGraph; Actual: paragraph] (proper-names)
+""",
+        fix_expected_file_contents="""this is a sample where the
+ParaGraph is on one line and the ParaGraph
+is on the next line, with another ParaGraph.
+""",
+    ),
+    pluginRuleTest(
+        "bad_paragraph_text_multiple_names_with_common_prefix",
+        source_file_contents="""both py and pymarkdown are names
+that pymarkdown and py both use.
+""",
+        set_args=["plugins.md044.names=Py,PyMarkdown"],
+        scan_expected_return_code=1,
+        scan_expected_output="""{temp_source_path}:1:6: MD044: Proper names should have the correct capitalization [Expected: Py; Actual: py] (proper-names)
+{temp_source_path}:1:13: MD044: Proper names should have the correct capitalization [Expected: PyMarkdown; Actual: pymarkdown] (proper-names)
+{temp_source_path}:2:6: MD044: Proper names should have the correct capitalization [Expected: PyMarkdown; Actual: pymarkdown] (proper-names)
+{temp_source_path}:2:21: MD044: Proper names should have the correct capitalization [Expected: Py; Actual: py] (proper-names)
+""",
+        fix_expected_file_contents="""both Py and PyMarkdown are names
+that PyMarkdown and Py both use.
 """,
     ),
     pluginRuleTest(
@@ -3,6 +3,7 @@ Module to provide tests related to the plugin manager for the scanner.
 """
 
 import os
+import sys
 import tempfile
 from test.markdown_scanner import MarkdownScanner
 from test.pytest_execute import ExpectedResults
@@ -17,6 +18,9 @@ from test.utils import (
     write_temporary_configuration,
 )
 from typing import Tuple
+from unittest import mock
+
+import pytest
 
 # pylint: disable=too-many-lines
 
@@ -1058,6 +1062,294 @@ Plugin class 'BadBooleanDetailIsInt' returned an improperly typed value for fiel
     execute_results.assert_results(expected_results=expected_results)
 
 
+def test_markdown_with_dash_dash_add_plugin_with_bad_uses_inline_tokens_detail(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure we get an error logged if a plugin declares whether it uses
+    inline tokens with something other than a boolean.
+    """
+
+    # Arrange
+    source_path, _ = __generate_source_path("end_with_blank_line.md")
+    plugin_path = generate_path_to_bad_plugin("bad_uses_inline_tokens_is_int.py")
+    supplied_arguments = [
+        "--add-plugin",
+        plugin_path,
+        "scan",
+        source_path,
+    ]
+
+    expected_results = ExpectedResults(
+        return_code=1,
+        expected_error="""BadPluginError encountered while loading plugins:
+Plugin class 'BadUsesInlineTokensIsInt' returned an improperly typed value for field name 'plugin_uses_inline_tokens'.
+""",
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_dash_dash_add_plugin_with_bad_token_kinds_detail(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure we get an error logged if a plugin declares the kinds of
+    tokens that it wants with something other than a string.
+    """
+
+    # Arrange
+    source_path, _ = __generate_source_path("end_with_blank_line.md")
+    plugin_path = generate_path_to_bad_plugin("bad_token_kinds_is_int.py")
+    supplied_arguments = [
+        "--add-plugin",
+        plugin_path,
+        "scan",
+        source_path,
+    ]
+
+    expected_results = ExpectedResults(
+        return_code=1,
+        expected_error="""BadPluginError encountered while loading plugins:
+Plugin class 'BadTokenKindsIsInt' returned an improperly typed value for field name 'plugin_token_kinds'.
+""",
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_dash_dash_add_plugin_with_bad_uses_container_tracker_detail(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure we get an error logged if a plugin declares whether it uses
+    the shared container tracker with something other than a boolean.
+    """
+
+    # Arrange
+    source_path, _ = __generate_source_path("end_with_blank_line.md")
+    plugin_path = generate_path_to_bad_plugin("bad_uses_container_tracker_is_int.py")
+    supplied_arguments = [
+        "--add-plugin",
+        plugin_path,
+        "scan",
+        source_path,
+    ]
+
+    expected_results = ExpectedResults(
+        return_code=1,
+        expected_error="""BadPluginError encountered while loading plugins:
+Plugin class 'BadUsesContainerTrackerIsInt' returned an improperly typed value for field name 'plugin_uses_container_tracker'.
+""",
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_dash_dash_add_plugin_with_token_kinds(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a plugin that declares the kinds of tokens that it
+    wants is only sent those tokens and their end tokens, while a plugin that
+    declares nothing is still sent every token.
+    """
+
+    # Arrange
+    with create_temporary_markdown_file(
+        "# Heading\n\nSome *text*\n\nOther\n---\n"
+    ) as source_path:
+        supplied_arguments = [
+            "--add-plugin",
+            os.path.join(
+                "test", "resources", "plugins", "token_kinds", "plugin_token_kinds.py"
+            ),
+            "--add-plugin",
+            os.path.join(
+                "test",
+                "resources",
+                "plugins",
+                "token_kinds",
+                "plugin_all_token_kinds.py",
+            ),
+            "--set",
+            "plugins.selectively_enable_rules=$!True",
+            "--enable-rules",
+            "md996,md997",
+            "scan",
+            source_path,
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=0,
+            expected_output="""MD996>>next_token:atx
+MD997>>next_token:atx
+MD996>>next_token:text
+MD996>>next_token:end-atx
+MD997>>next_token:end-atx
+MD996>>next_token:BLANK
+MD996>>next_token:para
+MD996>>next_token:text
+MD996>>next_token:emphasis
+MD996>>next_token:text
+MD996>>next_token:end-emphasis
+MD996>>next_token:end-para
+MD996>>next_token:BLANK
+MD996>>next_token:setext
+MD997>>next_token:setext
+MD996>>next_token:text
+MD996>>next_token:end-setext
+MD997>>next_token:end-setext
+MD996>>next_token:BLANK
+MD996>>next_token:end-of-stream
+""",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_dash_dash_add_plugin_with_scan_tokens(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a plugin that processes all the tokens of a file at
+    once is sent them in a single call, after the tokens are sent to the other
+    plugins one at a time, and that its next_token function is not called.
+    """
+
+    # Arrange
+    with create_temporary_markdown_file("# Heading\n\nOther\n---\n") as source_path:
+        supplied_arguments = [
+            "--add-plugin",
+            os.path.join(
+                "test", "resources", "plugins", "token_kinds", "plugin_scan_tokens.py"
+            ),
+            "--add-plugin",
+            os.path.join(
+                "test", "resources", "plugins", "token_kinds", "plugin_token_kinds.py"
+            ),
+            "--set",
+            "plugins.selectively_enable_rules=$!True",
+            "--enable-rules",
+            "md995,md997",
+            "scan",
+            source_path,
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=0,
+            expected_output="""MD997>>next_token:atx
+MD997>>next_token:end-atx
+MD997>>next_token:setext
+MD997>>next_token:end-setext
+MD995>>scan_tokens:atx,end-atx,setext,end-setext
+""",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_dash_dash_add_plugin_with_heading_outline(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a plugin can look at the outline of the headings in a
+    document, including the tokens within each heading, and that the outline is
+    only built once for each document.
+    """
+
+    # Arrange
+    with create_temporary_markdown_file(
+        "# Heading *one*\n\nSome text.\n\nOther\n---\n"
+    ) as source_path:
+        supplied_arguments = [
+            "--add-plugin",
+            os.path.join(
+                "test", "resources", "plugins", "outline", "plugin_heading_outline.py"
+            ),
+            "--set",
+            "plugins.selectively_enable_rules=$!True",
+            "--enable-rules",
+            "md994",
+            "scan",
+            source_path,
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=0,
+            expected_output="""MD994>>atx:1:1:text,emphasis,text,end-emphasis:end-atx
+MD994>>setext:2:6:text:end-setext
+MD994>>shared:True
+""",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_dash_dash_add_plugin_with_scan_lines(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a plugin that scans all the lines of a file at once is
+    sent the facts about each line in a single call, and that its next_line
+    function is not called when scanning.
+    """
+
+    # Arrange
+    with create_temporary_markdown_file("# Heading  \n\na\tb\tc\n") as source_path:
+        supplied_arguments = [
+            "--add-plugin",
+            os.path.join(
+                "test", "resources", "plugins", "lines", "plugin_scan_lines.py"
+            ),
+            "--set",
+            "plugins.selectively_enable_rules=$!True",
+            "--enable-rules",
+            "md993",
+            "scan",
+            source_path,
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=0,
+            expected_output="""MD993>>scan_lines:1:11:2:-1:False:False
+MD993>>scan_lines:2:0:0:-1:False:False
+MD993>>scan_lines:3:5:0:1:False:True
+MD993>>scan_lines:4:0:0:-1:True:False
+""",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+
+
 def test_markdown_with_dash_dash_add_plugin_with_bad_integer_detail(
     scanner_default: MarkdownScanner,
 ) -> None:
@@ -1233,7 +1525,7 @@ def test_markdown_with_dash_dash_add_plugin_with_bad_interface_version(
     expected_results = ExpectedResults(
         return_code=1,
         expected_error="""BadPluginError encountered while loading plugins:
-Plugin 'bad_interface_version.py' with an interface version ('-1') that is not '1', '2', or '3'.
+Plugin 'bad_interface_version.py' with an interface version ('-1') that is not '1', '2', '3', or '4'.
 """,
     )
 
@@ -2272,17 +2564,16 @@ FixLineRecord(source='completed_file', line_number=4, plugin_id='md047')"""
         assert first_section[2] == initial_file_contents.replace("\n", "\\n")
         assert first_section[3] == "--"
 
-        last_section = std_out_split[-7:]
+        last_section = std_out_split[-6:]
         print(last_section)
         assert last_section[0] == ""
         assert last_section[1].startswith("--") and last_section[1].endswith("--")
         assert last_section[2] == expected_file_contents.replace("\n", "\\n")
         assert last_section[3] == "--"
-        assert last_section[4].startswith("Copy ")
-        assert last_section[5].startswith("Remove:")
-        assert last_section[6] == f"Fixed: {temp_source_path}"
+        assert last_section[4] == f"Write {temp_source_path}"
+        assert last_section[5] == f"Fixed: {temp_source_path}"
 
-        middle_section = std_out_split[4:-7]
+        middle_section = std_out_split[4:-6]
         print(middle_section)
         split_output = expected_output.splitlines()
         print(split_output)
@@ -2291,6 +2582,99 @@ FixLineRecord(source='completed_file', line_number=4, plugin_id='md047')"""
             assert middle_section[i] == split_output[i]
 
 
+def test_markdown_fixed_file_is_replaced_atomically(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a fixed file is written in a single step, keeping the
+    permissions of the original file and leaving no temporary files behind.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as temp_directory:
+        with create_temporary_markdown_file(
+            "#  Heading\n", directory=temp_directory
+        ) as temp_source_path:
+            os.chmod(temp_source_path, 0o640)
+            supplied_arguments = ["fix", temp_source_path]
+
+            expected_results = ExpectedResults(
+                return_code=3, expected_output=f"Fixed: {temp_source_path}"
+            )
+
+            # Act
+            execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+            # Assert
+            execute_results.assert_results(expected_results=expected_results)
+            assert_file_is_as_expected(temp_source_path, "# Heading\n")
+            assert os.stat(temp_source_path).st_mode & 0o777 == 0o640
+            assert os.listdir(temp_directory) == [os.path.basename(temp_source_path)]
+
+
+def test_markdown_fixed_file_is_untouched_if_write_fails(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that if the fixed file cannot replace the original file,
+    the original file is left as it was and the temporary file is removed.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as temp_directory:
+        with create_temporary_markdown_file(
+            "#  Heading\n", directory=temp_directory
+        ) as temp_source_path:
+            supplied_arguments = ["--stack-trace", "fix", temp_source_path]
+
+            # Act
+            with mock.patch("os.replace", side_effect=OSError("replace failed")):
+                execute_results = scanner_default.invoke_main(
+                    arguments=supplied_arguments
+                )
+
+            # Assert
+            assert execute_results.return_code == 1
+            assert_file_is_as_expected(temp_source_path, "#  Heading\n")
+            assert os.listdir(temp_directory) == [os.path.basename(temp_source_path)]
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Symbolic links require privileges."
+)
+def test_markdown_fixed_file_through_symbolic_link(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that fixing a symbolic link fixes the file that it points
+    to, and leaves the link in place.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as temp_directory:
+        real_directory = os.path.join(temp_directory, "real")
+        os.mkdir(real_directory)
+        real_path = os.path.join(real_directory, "a.md")
+        with open(real_path, "wt", encoding="utf-8") as real_file:
+            real_file.write("#  Heading\n")
+        link_path = os.path.join(temp_directory, "link.md")
+        os.symlink(real_path, link_path)
+        supplied_arguments = ["fix", link_path]
+
+        expected_results = ExpectedResults(
+            return_code=3, expected_output=f"Fixed: {link_path}"
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+        assert os.path.islink(link_path)
+        assert_file_is_as_expected(real_path, "# Heading\n")
+        assert sorted(os.listdir(real_directory)) == ["a.md"]
+
+
 def test_markdown_fixed_issue_token_with_debug_and_file_debug_on(
     scanner_default: MarkdownScanner,
 ) -> None:
@@ -2355,18 +2739,16 @@ We skipped out a 2nd level heading in this document
         assert first_section[2] == initial_file_contents.replace("\n", "\\n")
         assert first_section[3] == "--"
 
-        last_section = std_out_split[-8:]
+        last_section = std_out_split[-6:]
         print(last_section)
         assert last_section[0] == ""
         assert last_section[1].startswith("--") and last_section[1].endswith("--")
         assert last_section[2] == expected_file_contents.replace("\n", "\\n")
         assert last_section[3] == "--"
-        assert last_section[4].startswith("Copy ")
-        assert last_section[5].startswith("Remove:")
-        assert last_section[6].startswith("Remove:")
-        assert last_section[7] == f"Fixed: {temp_source_path}"
+        assert last_section[4] == f"Write {temp_source_path}"
+        assert last_section[5] == f"Fixed: {temp_source_path}"
 
-        # middle_section = std_out_split[4:-8]
+        # middle_section = std_out_split[4:-6]
         # print("-->")
         # print("\n".join(middle_section))
         # print("<--")
@@ -551,6 +551,21 @@ pml100Tests = [
 """,
         "stdin:2:9: PML100: Disallowed HTML [Tag Name: script] (disallowed-html)",
     ),
+    Pml100Test(
+        "Disallowed HTML Mid in Block after SetExts",
+        ["enabled=$!True"],
+        """> Heading
+> -------
+>
+> Other
+> =====
+>
+> <html>
+> <script>
+> </html>
+""",
+        "stdin:8:3: PML100: Disallowed HTML [Tag Name: script] (disallowed-html)",
+    ),
     # bq tab
     Pml100Test(
         "Raw HTML allowed", ["enabled=$!True"], "This is a <docum> example.", "", "", 0
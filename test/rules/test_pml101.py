@@ -399,6 +399,16 @@ scanTests = [
         scan_expected_return_code=1,
         scan_expected_output="{temp_source_path}:1:4: PML101: Anchored list indentation [Expected: 0, Actual=1] (list-anchored-indent)",
     ),
+    pluginRuleTest(
+        "good_simple_indent_default_bq_level_0_ul_after_setext",
+        enable_rules=__plugin_enable_this_rule,
+        disable_rules=__plugin_disable_this_rule,
+        source_file_contents="""> Heading
+> -------
+>
+> * this is level 1
+""",
+    ),
     pluginRuleTest(
         "good_simple_indent_default_bq_level_0_ol",
         enable_rules=__plugin_enable_this_rule,
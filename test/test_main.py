@@ -51,20 +51,27 @@ def test_markdown_with_no_parameters(scanner_default: MarkdownScanner) -> None:
                [--add-plugin ADD_PLUGIN] [--config CONFIGURATION_FILE]
                [--set SET_CONFIGURATION] [--strict-config] [--no-json5]
                [--stack-trace] [--continue-on-error]
+               [--max-failures MAX_FAILURES] [--fail-fast] [--jobs JOBS]
+               [--cache-dir CACHE_DIRECTORY] [--server-socket SERVER_SOCKET]
                [--log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}]
                [--log-file LOG_FILE]
                [--return-code-scheme {default,minimal,explicit}]
-               {extensions,fix,plugins,scan,scan-stdin,version} ...
+               {extensions,fix,fix-stdin,plugins,scan,scan-stdin,server,version}
+               ...
 
 Lint any found Markdown files.
 
 positional arguments:
-  {extensions,fix,plugins,scan,scan-stdin,version}
+  {extensions,fix,fix-stdin,plugins,scan,scan-stdin,server,version}
     extensions          extension commands
     fix                 fix the Markdown files in any specified paths
+    fix-stdin           fix the standard input as a Markdown file, writing the
+                        result to standard output
     plugins             plugin commands
     scan                scan the Markdown files in any specified paths
     scan-stdin          scan the standard input as a Markdown file
+    server              keep the parser and plugins loaded, answering requests
+                        from clients
     version             version of the application
 
 {ARGPARSE_X}
@@ -89,6 +96,18 @@ positional arguments:
                         debug purposes
   --continue-on-error   if a tokenization or plugin error occurs, allow
                         processing to continue
+  --max-failures MAX_FAILURES
+                        stop scanning once this many rule failures have been
+                        reported
+  --fail-fast           stop scanning once the first rule failure has been
+                        reported
+  --jobs JOBS           number of processes to use when scanning multiple
+                        files
+  --cache-dir CACHE_DIRECTORY
+                        directory used to cache the results of scanning files
+  --server-socket SERVER_SOCKET
+                        forward the command to the server listening on this
+                        socket
   --log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}
                         minimum level required to log messages
   --log-file LOG_FILE   destination file for log messages
@@ -126,20 +145,28 @@ def test_markdown_with_no_parameters_through_module(
                    [--add-plugin ADD_PLUGIN] [--config CONFIGURATION_FILE]
                    [--set SET_CONFIGURATION] [--strict-config] [--no-json5]
                    [--stack-trace] [--continue-on-error]
+                   [--max-failures MAX_FAILURES] [--fail-fast] [--jobs JOBS]
+                   [--cache-dir CACHE_DIRECTORY]
+                   [--server-socket SERVER_SOCKET]
                    [--log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}]
                    [--log-file LOG_FILE]
                    [--return-code-scheme {default,minimal,explicit}]
-                   {extensions,fix,plugins,scan,scan-stdin,version} ...
+                   {extensions,fix,fix-stdin,plugins,scan,scan-stdin,server,version}
+                   ...
 
 Lint any found Markdown files.
 
 positional arguments:
-  {extensions,fix,plugins,scan,scan-stdin,version}
+  {extensions,fix,fix-stdin,plugins,scan,scan-stdin,server,version}
     extensions          extension commands
     fix                 fix the Markdown files in any specified paths
+    fix-stdin           fix the standard input as a Markdown file, writing the
+                        result to standard output
     plugins             plugin commands
     scan                scan the Markdown files in any specified paths
     scan-stdin          scan the standard input as a Markdown file
+    server              keep the parser and plugins loaded, answering requests
+                        from clients
     version             version of the application
 
 {ARGPARSE_X}
@@ -164,6 +191,18 @@ positional arguments:
                         debug purposes
   --continue-on-error   if a tokenization or plugin error occurs, allow
                         processing to continue
+  --max-failures MAX_FAILURES
+                        stop scanning once this many rule failures have been
+                        reported
+  --fail-fast           stop scanning once the first rule failure has been
+                        reported
+  --jobs JOBS           number of processes to use when scanning multiple
+                        files
+  --cache-dir CACHE_DIRECTORY
+                        directory used to cache the results of scanning files
+  --server-socket SERVER_SOCKET
+                        forward the command to the server listening on this
+                        socket
   --log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}
                         minimum level required to log messages
   --log-file LOG_FILE   destination file for log messages
@@ -201,20 +240,27 @@ def test_markdown_with_no_parameters_through_main(
                [--add-plugin ADD_PLUGIN] [--config CONFIGURATION_FILE]
                [--set SET_CONFIGURATION] [--strict-config] [--no-json5]
                [--stack-trace] [--continue-on-error]
+               [--max-failures MAX_FAILURES] [--fail-fast] [--jobs JOBS]
+               [--cache-dir CACHE_DIRECTORY] [--server-socket SERVER_SOCKET]
                [--log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}]
                [--log-file LOG_FILE]
                [--return-code-scheme {default,minimal,explicit}]
-               {extensions,fix,plugins,scan,scan-stdin,version} ...
+               {extensions,fix,fix-stdin,plugins,scan,scan-stdin,server,version}
+               ...
 
 Lint any found Markdown files.
 
 positional arguments:
-  {extensions,fix,plugins,scan,scan-stdin,version}
+  {extensions,fix,fix-stdin,plugins,scan,scan-stdin,server,version}
     extensions          extension commands
     fix                 fix the Markdown files in any specified paths
+    fix-stdin           fix the standard input as a Markdown file, writing the
+                        result to standard output
     plugins             plugin commands
     scan                scan the Markdown files in any specified paths
     scan-stdin          scan the standard input as a Markdown file
+    server              keep the parser and plugins loaded, answering requests
+                        from clients
     version             version of the application
 
 {ARGPARSE_X}
@@ -239,6 +285,18 @@ positional arguments:
                         debug purposes
   --continue-on-error   if a tokenization or plugin error occurs, allow
                         processing to continue
+  --max-failures MAX_FAILURES
+                        stop scanning once this many rule failures have been
+                        reported
+  --fail-fast           stop scanning once the first rule failure has been
+                        reported
+  --jobs JOBS           number of processes to use when scanning multiple
+                        files
+  --cache-dir CACHE_DIRECTORY
+                        directory used to cache the results of scanning files
+  --server-socket SERVER_SOCKET
+                        forward the command to the server listening on this
+                        socket
   --log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}
                         minimum level required to log messages
   --log-file LOG_FILE   destination file for log messages
@@ -272,20 +330,27 @@ def test_markdown_with_dash_h(scanner_default: MarkdownScanner) -> None:
                [--add-plugin ADD_PLUGIN] [--config CONFIGURATION_FILE]
                [--set SET_CONFIGURATION] [--strict-config] [--no-json5]
                [--stack-trace] [--continue-on-error]
+               [--max-failures MAX_FAILURES] [--fail-fast] [--jobs JOBS]
+               [--cache-dir CACHE_DIRECTORY] [--server-socket SERVER_SOCKET]
                [--log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}]
                [--log-file LOG_FILE]
                [--return-code-scheme {default,minimal,explicit}]
-               {extensions,fix,plugins,scan,scan-stdin,version} ...
+               {extensions,fix,fix-stdin,plugins,scan,scan-stdin,server,version}
+               ...
 
 Lint any found Markdown files.
 
 positional arguments:
-  {extensions,fix,plugins,scan,scan-stdin,version}
+  {extensions,fix,fix-stdin,plugins,scan,scan-stdin,server,version}
     extensions          extension commands
     fix                 fix the Markdown files in any specified paths
+    fix-stdin           fix the standard input as a Markdown file, writing the
+                        result to standard output
     plugins             plugin commands
     scan                scan the Markdown files in any specified paths
     scan-stdin          scan the standard input as a Markdown file
+    server              keep the parser and plugins loaded, answering requests
+                        from clients
     version             version of the application
 
 {ARGPARSE_X}
@@ -310,6 +375,18 @@ positional arguments:
                         debug purposes
   --continue-on-error   if a tokenization or plugin error occurs, allow
                         processing to continue
+  --max-failures MAX_FAILURES
+                        stop scanning once this many rule failures have been
+                        reported
+  --fail-fast           stop scanning once the first rule failure has been
+                        reported
+  --jobs JOBS           number of processes to use when scanning multiple
+                        files
+  --cache-dir CACHE_DIRECTORY
+                        directory used to cache the results of scanning files
+  --server-socket SERVER_SOCKET
+                        forward the command to the server listening on this
+                        socket
   --log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}
                         minimum level required to log messages
   --log-file LOG_FILE   destination file for log messages
@@ -0,0 +1,287 @@
+"""
+Module to provide tests for caching the results of scanning files.
+"""
+
+import os
+import tempfile
+from test.markdown_scanner import MarkdownScanner
+from test.pytest_execute import ExpectedResults
+from test.utils import create_temporary_markdown_file
+from typing import Any, Optional
+from unittest import mock
+
+from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+from pymarkdown.parallel_scan_helper import RecordedResults
+from pymarkdown.plugin_manager.plugin_scan_failure import PluginScanFailure
+from pymarkdown.plugin_manager.pragma_failure_record import PragmaFailureRecord
+from pymarkdown.scan_result_cache import ScanResultCache
+
+
+def __count_cache_entries(cache_directory: str) -> int:
+    return len([i for i in os.listdir(cache_directory) if i.endswith(".json")])
+
+
+def test_markdown_with_cache_replays_results_without_tokenizing(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a second scan with the same cache directory reports
+    the same failures and pragma failures, without tokenizing the file again.
+    """
+
+    source_contents = """# Heading
+<!-- pyml disable-next-line no-trailing-spaces-->
+Some text\a\a\a
+<!-- pyml bad -->
+"""
+
+    with create_temporary_markdown_file(
+        source_contents.replace("\a", " ")
+    ) as source_path, tempfile.TemporaryDirectory() as cache_directory:
+        # Arrange
+        supplied_arguments = ["--cache-dir", cache_directory, "scan", source_path]
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output=f"""{source_path}:1:1: MD022: Headings should be surrounded by blank lines. [Expected: 1; Actual: 0; Below] (blanks-around-headings,blanks-around-headers)
+""",
+            expected_error=f"""{source_path}:4:1: INLINE: Inline configuration command 'bad' not understood.
+""",
+        )
+        first_results = scanner_default.invoke_main(arguments=supplied_arguments)
+        first_results.assert_results(expected_results=expected_results)
+        assert __count_cache_entries(cache_directory) == 1
+
+        # Act
+        with mock.patch.object(
+            TokenizedMarkdown,
+            "transform_from_provider",
+            side_effect=AssertionError("File should not have been tokenized."),
+        ):
+            execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_cache_and_changed_file(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that changing the contents of a file causes it to be
+    scanned again.
+    """
+
+    with create_temporary_markdown_file(
+        "# Heading\n"
+    ) as source_path, tempfile.TemporaryDirectory() as cache_directory:
+        # Arrange
+        supplied_arguments = ["--cache-dir", cache_directory, "scan", source_path]
+        first_results = scanner_default.invoke_main(arguments=supplied_arguments)
+        assert first_results.return_code == 0
+        with open(source_path, "wt", encoding="utf-8") as source_file:
+            source_file.write("#\tHeading\n")
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output=f"""{source_path}:1:1: MD019: Multiple spaces are present after hash character on Atx Heading. (no-multiple-space-atx)
+{source_path}:1:2: MD010: Hard tabs [Column: 2] (no-hard-tabs)
+""",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+        assert __count_cache_entries(cache_directory) == 2
+
+
+def test_markdown_with_cache_and_changed_configuration(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that changing the enabled rules causes the file to be
+    scanned again.
+    """
+
+    with create_temporary_markdown_file(
+        "#\tHeading\n"
+    ) as source_path, tempfile.TemporaryDirectory() as cache_directory:
+        # Arrange
+        first_results = scanner_default.invoke_main(
+            arguments=["--cache-dir", cache_directory, "scan", source_path]
+        )
+        assert first_results.return_code == 1
+        supplied_arguments = [
+            "--cache-dir",
+            cache_directory,
+            "--disable-rules",
+            "md010",
+            "scan",
+            source_path,
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output=f"""{source_path}:1:1: MD019: Multiple spaces are present after hash character on Atx Heading. (no-multiple-space-atx)
+""",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+        assert __count_cache_entries(cache_directory) == 2
+
+
+def test_markdown_with_cache_and_file_changed_while_scanning(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the scan, and the results saved to the cache, are
+    for the contents that were hashed, even if the file changes after it was
+    read.
+    """
+
+    with create_temporary_markdown_file(
+        "# Heading\n"
+    ) as source_path, tempfile.TemporaryDirectory() as cache_directory:
+        # Arrange
+        supplied_arguments = ["--cache-dir", cache_directory, "scan", source_path]
+        original_load_results = ScanResultCache.load_results
+
+        def change_file_then_load_results(
+            this_cache: ScanResultCache, *args: Any
+        ) -> Optional[RecordedResults]:
+            with open(source_path, "wt", encoding="utf-8") as source_file:
+                source_file.write("#  Heading\n")
+            return original_load_results(this_cache, *args)
+
+        # Act
+        with mock.patch.object(
+            ScanResultCache, "load_results", change_file_then_load_results
+        ):
+            execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+        with open(source_path, "wt", encoding="utf-8") as source_file:
+            source_file.write("# Heading\n")
+        with mock.patch.object(
+            TokenizedMarkdown,
+            "transform_from_provider",
+            side_effect=AssertionError("File should not have been tokenized."),
+        ):
+            replay_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=ExpectedResults())
+        replay_results.assert_results(expected_results=ExpectedResults())
+
+
+def test_markdown_with_cache_and_jobs(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the cache is used, and filled, when scanning with
+    multiple jobs.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md022")
+    serial_results = scanner_default.invoke_main(arguments=["scan", source_path])
+    expected_results = ExpectedResults(
+        return_code=serial_results.return_code,
+        expected_output=serial_results.std_out.getvalue(),
+        expected_error=serial_results.std_err.getvalue(),
+    )
+
+    with tempfile.TemporaryDirectory() as cache_directory:
+        supplied_arguments = [
+            "--cache-dir",
+            cache_directory,
+            "--jobs",
+            "2",
+            "scan",
+            source_path,
+        ]
+        first_results = scanner_default.invoke_main(arguments=supplied_arguments)
+        first_results.assert_results(expected_results=expected_results)
+        assert __count_cache_entries(cache_directory) == len(os.listdir(source_path))
+
+        # Act
+        with mock.patch.object(
+            TokenizedMarkdown,
+            "transform_from_provider",
+            side_effect=AssertionError("File should not have been tokenized."),
+        ):
+            execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+
+
+def test_scan_result_cache_round_trip_and_corrupt_entry() -> None:
+    """
+    Test to make sure that recorded results survive being cached, and that a
+    damaged entry is treated as if it was not present.
+    """
+
+    # Arrange
+    recorded_results = [
+        PragmaFailureRecord("file.md", 3, "Inline configuration command 'bad'."),
+        PluginScanFailure(
+            "file.md", 1, 2, "md010", "no-hard-tabs", "Hard tabs", " [Column: 2]", False
+        ),
+    ]
+    with tempfile.TemporaryDirectory() as cache_directory:
+        cache = ScanResultCache(cache_directory, "config")
+
+        # Act
+        cache.save_results("file.md", b"#\tHeading\n", {"md001"}, recorded_results)
+        loaded_results = cache.load_results("file.md", b"#\tHeading\n", {"md001"})
+        missing_results = cache.load_results("file.md", b"#\tHeading\n", None)
+
+        (entry_name,) = os.listdir(cache_directory)
+        with open(
+            os.path.join(cache_directory, entry_name), "wt", encoding="utf-8"
+        ) as entry_file:
+            entry_file.write("[{")
+        corrupt_results = cache.load_results("file.md", b"#\tHeading\n", {"md001"})
+
+        # Assert
+        assert loaded_results == recorded_results
+        assert missing_results is None
+        assert corrupt_results is None
+
+
+def test_scan_result_cache_evicts_least_recently_used() -> None:
+    """
+    Test to make sure that the cache removes the least recently used entries
+    once it grows past its size limit.
+    """
+
+    # Arrange
+    recorded_results = [
+        PragmaFailureRecord("file.md", 3, "Inline configuration command 'bad'.")
+    ]
+    with tempfile.TemporaryDirectory() as cache_directory:
+        cache = ScanResultCache(cache_directory, "config")
+        cache.save_results("file.md", b"first", None, recorded_results)
+        entry_size = os.path.getsize(
+            os.path.join(cache_directory, os.listdir(cache_directory)[0])
+        )
+        cache = ScanResultCache(cache_directory, "config", size_limit=entry_size * 2)
+        cache.save_results("file.md", b"second", None, recorded_results)
+        for entry_name in os.listdir(cache_directory):
+            entry_path = os.path.join(cache_directory, entry_name)
+            os.utime(entry_path, (1, 1))
+        assert cache.load_results("file.md", b"first", None) is not None
+
+        # Act
+        cache.save_results("file.md", b"third", None, recorded_results)
+
+        # Assert
+        assert __count_cache_entries(cache_directory) == 2
+        assert cache.load_results("file.md", b"first", None) is not None
+        assert cache.load_results("file.md", b"second", None) is None
+        assert cache.load_results("file.md", b"third", None) is not None
@@ -0,0 +1,246 @@
+"""
+Module to provide tests for scanning files using multiple processes.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from test.markdown_scanner import MarkdownScanner
+from test.pytest_execute import ExpectedResults
+from test.utils import create_temporary_markdown_file, generate_path_to_bad_plugin
+from typing import Any, List, Optional, Set, Tuple
+from unittest import mock
+
+from pymarkdown.parallel_scan_helper import (
+    FileToScan,
+    ParallelScanHelper,
+    ParallelScanPool,
+    RecordedResults,
+)
+
+
+def test_markdown_with_jobs_matches_serial_scan(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that scanning a directory with multiple jobs produces the
+    same output, in the same order, as scanning with a single job.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md022")
+    serial_arguments = ["scan", source_path]
+    serial_results = scanner_default.invoke_main(arguments=serial_arguments)
+
+    supplied_arguments = ["--jobs", "3", "scan", source_path]
+
+    expected_results = ExpectedResults(
+        return_code=serial_results.return_code,
+        expected_output=serial_results.std_out.getvalue(),
+        expected_error=serial_results.std_err.getvalue(),
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert serial_results.std_out.getvalue()
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_jobs_and_pragmas(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that pragmas, and errors within pragmas, are honored and
+    reported when scanning with multiple jobs.
+    """
+
+    contents_file_1 = """# Heading
+<!-- pyml disable-next-line no-trailing-spaces-->
+Some text\a\a\a
+<!-- pyml bad -->
+"""
+    contents_file_2 = """#\tBad Heading
+"""
+
+    with create_temporary_markdown_file(
+        contents_file_1.replace("\a", " "), file_name_prefix="tmp1"
+    ) as file_name_1:
+        with create_temporary_markdown_file(
+            contents_file_2, file_name_prefix="tmp2"
+        ) as file_name_2:
+            # Arrange
+            supplied_arguments = [
+                "--jobs",
+                "2",
+                "scan",
+                file_name_1,
+                file_name_2,
+            ]
+
+            expected_results = ExpectedResults(
+                return_code=1,
+                expected_output=f"""{file_name_1}:1:1: MD022: Headings should be surrounded by blank lines. [Expected: 1; Actual: 0; Below] (blanks-around-headings,blanks-around-headers)
+{file_name_2}:1:1: MD019: Multiple spaces are present after hash character on Atx Heading. (no-multiple-space-atx)
+{file_name_2}:1:2: MD010: Hard tabs [Column: 2] (no-hard-tabs)
+""",
+                expected_error=f"""{file_name_1}:4:1: INLINE: Inline configuration command 'bad' not understood.
+""",
+            )
+
+            # Act
+            execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+            # Assert
+            execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_jobs_and_plugin_exception_and_flag(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that an exception raised while scanning a file in a worker
+    process is reported in the same way as when scanning with a single job.
+    """
+
+    contents_file_1_and_3 = """#\tPerfectly healthy file
+This triggers several rules:
+1. Guess which ones
+1. Bla
+"""
+    contents_file_2 = """# File the causes exception
+
+throw_exception
+"""
+    plugin_path = generate_path_to_bad_plugin("bad_next_line_with_scan_trigger.py")
+
+    with create_temporary_markdown_file(
+        contents_file_1_and_3, file_name_prefix="tmp1"
+    ) as file_name_1:
+        with create_temporary_markdown_file(
+            contents_file_2, file_name_prefix="tmp2"
+        ) as file_name_2:
+            with create_temporary_markdown_file(
+                contents_file_1_and_3, file_name_prefix="tmp3"
+            ) as file_name_3:
+                # Arrange
+                supplied_arguments = [
+                    "--add-plugin",
+                    plugin_path,
+                    "--continue-on-error",
+                    "--jobs",
+                    "2",
+                    "scan",
+                    file_name_1,
+                    file_name_2,
+                    file_name_3,
+                ]
+
+                expected_results = ExpectedResults(
+                    return_code=1,
+                    expected_output=f"""{file_name_1}:1:1: MD019: Multiple spaces are present after hash character on Atx Heading. (no-multiple-space-atx)
+{file_name_1}:1:1: MD022: Headings should be surrounded by blank lines. [Expected: 1; Actual: 0; Below] (blanks-around-headings,blanks-around-headers)
+{file_name_1}:1:2: MD010: Hard tabs [Column: 2] (no-hard-tabs)
+{file_name_1}:3:1: MD032: Lists should be surrounded by blank lines (blanks-around-lists)
+{file_name_3}:1:1: MD019: Multiple spaces are present after hash character on Atx Heading. (no-multiple-space-atx)
+{file_name_3}:1:1: MD022: Headings should be surrounded by blank lines. [Expected: 1; Actual: 0; Below] (blanks-around-headings,blanks-around-headers)
+{file_name_3}:1:2: MD010: Hard tabs [Column: 2] (no-hard-tabs)
+{file_name_3}:3:1: MD032: Lists should be surrounded by blank lines (blanks-around-lists)
+""",
+                    expected_error=f"""{file_name_2}:0:0: (Line 3): Plugin id 'MDE008' had a critical failure during the 'next_line' action.
+""",
+                )
+
+                # Act
+                execute_results = scanner_default.invoke_main(
+                    arguments=supplied_arguments
+                )
+
+                # Assert
+                execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_jobs_not_positive(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the number of jobs must be a positive integer.
+    """
+
+    # Arrange
+    supplied_arguments = ["--jobs", "0", "scan", "README.md"]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 2
+    assert (
+        "main.py: error: argument --jobs: Value '0' is not a positive integer."
+        in execute_results.std_err.getvalue()
+    )
+
+
+def test_markdown_parallel_batch_size() -> None:
+    """
+    Test to make sure that files are batched to keep every worker busy, without
+    creating batches that are too large.
+    """
+
+    # Arrange / Act / Assert
+    assert ParallelScanHelper.calculate_batch_size(3, 4) == 1
+    assert ParallelScanHelper.calculate_batch_size(400, 4) == 25
+    assert ParallelScanHelper.calculate_batch_size(40000, 32) == 32
+
+
+def test_markdown_parallel_scan_files_limits_pending_batches() -> None:
+    """
+    Test to make sure that only a few batches per job are handed to the workers
+    at once, that another batch is handed out only when more results are
+    requested, and that no more batches are handed out once the caller stops.
+    """
+
+    # Arrange
+    files_to_scan: List[FileToScan] = [
+        (f"file-{file_index}.md", set(), "") for file_index in range(20)
+    ]
+    submitted_batches: List[List[FileToScan]] = []
+
+    def scan_batch(
+        batch: List[FileToScan], max_failures: Optional[int]
+    ) -> List[Tuple[str, Set[str], Optional[RecordedResults]]]:
+        _ = max_failures
+        return [(next_file, identifiers, []) for next_file, identifiers, _ in batch]
+
+    def scan_file_names(stop_after: Optional[int]) -> List[str]:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+
+            def record_and_submit(function: Any, *args: Any) -> Any:
+                submitted_batches.append(args[0])
+                return executor.submit(function, *args)
+
+            scan_pool = mock.Mock(spec=ParallelScanPool)
+            scan_pool.get_executor.return_value = mock.Mock(submit=record_and_submit)
+            scan_results = ParallelScanHelper.scan_files(
+                mock.Mock(), 2, files_to_scan, None, scan_pool
+            )
+            file_names = []
+            for next_file, _, _ in scan_results:
+                file_names.append(next_file)
+                if len(file_names) == stop_after:
+                    break
+            scan_results.close()
+            return file_names
+
+    # Act
+    with mock.patch.object(ParallelScanHelper, "scan_batch_in_worker", scan_batch):
+        first_file_names = scan_file_names(1)
+        first_submitted_count = len(submitted_batches)
+        submitted_batches.clear()
+        all_file_names = scan_file_names(None)
+
+    # Assert
+    assert first_file_names == ["file-0.md"]
+    assert first_submitted_count == 5
+    assert all_file_names == [next_file for next_file, _, _ in files_to_scan]
+    assert [len(next_batch) for next_batch in submitted_batches] == [2] * 10
@@ -126,10 +126,13 @@ def test_markdown_with_dash_dash_log_level_invalid(
                [--add-plugin ADD_PLUGIN] [--config CONFIGURATION_FILE]
                [--set SET_CONFIGURATION] [--strict-config] [--no-json5]
                [--stack-trace] [--continue-on-error]
+               [--max-failures MAX_FAILURES] [--fail-fast] [--jobs JOBS]
+               [--cache-dir CACHE_DIRECTORY] [--server-socket SERVER_SOCKET]
                [--log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}]
                [--log-file LOG_FILE]
                [--return-code-scheme {default,minimal,explicit}]
-               {extensions,fix,plugins,scan,scan-stdin,version} ...
+               {extensions,fix,fix-stdin,plugins,scan,scan-stdin,server,version}
+               ...
 main.py: error: argument --log-level: invalid validate_log_level_type value: 'invalid'
 """,
     )
@@ -0,0 +1,199 @@
+"""
+Module to provide tests for stopping a scan once enough failures are found.
+"""
+
+import os
+from test.markdown_scanner import MarkdownScanner
+from test.pytest_execute import ExpectedResults
+from test.utils import assert_file_is_as_expected, create_temporary_markdown_file
+from unittest import mock
+
+from pymarkdown.general.source_providers import FileSourceProvider
+
+
+def test_markdown_with_fail_fast_stops_scanning_files(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that once the first failure is reported, no more files
+    are scanned.
+    """
+
+    with create_temporary_markdown_file(
+        "# Heading\n", file_name_prefix="tmp1"
+    ) as file_name_1, create_temporary_markdown_file(
+        "#  Heading\n", file_name_prefix="tmp2"
+    ) as file_name_2, create_temporary_markdown_file(
+        "#  Heading\n", file_name_prefix="tmp3"
+    ) as file_name_3:
+        # Arrange
+        supplied_arguments = [
+            "--fail-fast",
+            "scan",
+            file_name_1,
+            file_name_2,
+            file_name_3,
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output=f"""{file_name_2}:1:1: MD019: Multiple spaces are present after hash character on Atx Heading. (no-multiple-space-atx)
+""",
+        )
+
+        # Act
+        with mock.patch(
+            "pymarkdown.file_scan_helper.FileSourceProvider",
+            side_effect=FileSourceProvider,
+        ) as mock_source_provider:
+            execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+        assert [
+            next_call.args[0] for next_call in mock_source_provider.call_args_list
+        ] == [file_name_1, file_name_2]
+
+
+def test_markdown_with_max_failures_across_files(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the failure budget is shared by all the files.
+    """
+
+    with create_temporary_markdown_file(
+        "#  Heading\n", file_name_prefix="tmp1"
+    ) as file_name_1, create_temporary_markdown_file(
+        "#  Heading\n", file_name_prefix="tmp2"
+    ) as file_name_2, create_temporary_markdown_file(
+        "#  Heading\n", file_name_prefix="tmp3"
+    ) as file_name_3:
+        # Arrange
+        supplied_arguments = [
+            "--max-failures",
+            "2",
+            "scan",
+            file_name_1,
+            file_name_2,
+            file_name_3,
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output=f"""{file_name_1}:1:1: MD019: Multiple spaces are present after hash character on Atx Heading. (no-multiple-space-atx)
+{file_name_2}:1:1: MD019: Multiple spaces are present after hash character on Atx Heading. (no-multiple-space-atx)
+""",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_fail_fast_and_suppressed_failures(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that failures suppressed by a pragma do not count towards
+    the failure budget.
+    """
+
+    source_contents = """<!-- pyml disable-next-line no-multiple-space-atx-->
+#  Heading
+
+Some text
+
+#  Other Heading
+"""
+    with create_temporary_markdown_file(source_contents) as source_path:
+        # Arrange
+        supplied_arguments = ["--fail-fast", "scan", source_path]
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output=f"""{source_path}:6:1: MD025: Multiple top-level headings in the same document (single-title,single-h1)
+""",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_max_failures_and_jobs_matches_serial_scan(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that scanning with multiple jobs stops at the same point,
+    and reports the same failures, as scanning with a single job.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md022")
+    serial_arguments = ["--max-failures", "5", "scan", source_path]
+    serial_results = scanner_default.invoke_main(arguments=serial_arguments)
+
+    supplied_arguments = ["--max-failures", "5", "--jobs", "3", "scan", source_path]
+
+    expected_results = ExpectedResults(
+        return_code=serial_results.return_code,
+        expected_output=serial_results.std_out.getvalue(),
+        expected_error=serial_results.std_err.getvalue(),
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert len(serial_results.std_out.getvalue().splitlines()) == 5
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_fail_fast_does_not_limit_fix(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the failure budget does not stop a fix from being
+    completely applied.
+    """
+
+    with create_temporary_markdown_file("#  Heading\nSome\ttext\n") as source_path:
+        # Arrange
+        supplied_arguments = ["--fail-fast", "fix", source_path]
+
+        expected_results = ExpectedResults(
+            return_code=3, expected_output=f"Fixed: {source_path}"
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+        assert_file_is_as_expected(source_path, "# Heading\nSome    text\n")
+
+
+def test_markdown_with_max_failures_not_positive(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the maximum number of failures must be a positive integer.
+    """
+
+    # Arrange
+    supplied_arguments = ["--max-failures", "0", "scan", "README.md"]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 2
+    assert (
+        "main.py: error: argument --max-failures: Value '0' is not a positive integer."
+        in execute_results.std_err.getvalue()
+    )
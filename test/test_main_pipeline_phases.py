@@ -0,0 +1,145 @@
+"""
+Module to provide tests for skipping the phases of a scan that no enabled rule needs.
+"""
+
+from test.markdown_scanner import MarkdownScanner
+from test.pytest_execute import ExpectedResults
+from test.utils import create_temporary_markdown_file
+from typing import List, Tuple
+from unittest import mock
+
+from pymarkdown.inline.inline_processor import InlineProcessor
+from pymarkdown.plugin_manager.plugin_manager import PluginManager
+
+__SOURCE_CONTENTS = """# Heading
+
+### Sub *heading*
+
+Some text that is *emphasized*, with a long line that goes past the limit of eighty characters.
+"""
+
+
+def __scan_with_rules(
+    scanner_default: MarkdownScanner, enabled_rules: str, source_path: str
+) -> Tuple[str, int, int]:
+    with mock.patch.object(
+        InlineProcessor, "parse_inline", side_effect=InlineProcessor.parse_inline
+    ) as mock_parse_inline, mock.patch.object(
+        PluginManager, "next_line", autospec=True, side_effect=PluginManager.next_line
+    ) as mock_next_line:
+        supplied_arguments: List[str] = [
+            "--set",
+            "plugins.selectively_enable_rules=$!True",
+            "--enable-rules",
+            enabled_rules,
+            "scan",
+            source_path,
+        ]
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+    return (
+        execute_results.std_out.getvalue(),
+        mock_parse_inline.call_count,
+        mock_next_line.call_count,
+    )
+
+
+def test_markdown_with_only_block_token_rules(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that if the enabled rules only look at block tokens, the
+    inline pass and the line pass are both skipped.
+    """
+
+    with create_temporary_markdown_file(__SOURCE_CONTENTS) as source_path:
+        # Act
+        std_out, parse_inline_count, next_line_count = __scan_with_rules(
+            scanner_default, "md001", source_path
+        )
+
+        # Assert
+        assert (
+            std_out
+            == f"{source_path}:3:1: MD001: Heading levels should only increment by one level at a time. [Expected: h2; Actual: h3] (heading-increment,header-increment)\n"
+        )
+        assert parse_inline_count == 0
+        assert next_line_count == 0
+
+
+def test_markdown_with_only_block_token_and_line_rules(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that if the enabled rules only look at block tokens and
+    lines, the inline pass is skipped and the line pass is not.
+    """
+
+    with create_temporary_markdown_file(__SOURCE_CONTENTS) as source_path:
+        # Act
+        std_out, parse_inline_count, next_line_count = __scan_with_rules(
+            scanner_default, "md013", source_path
+        )
+
+        # Assert
+        assert (
+            std_out
+            == f"{source_path}:5:1: MD013: Line length [Expected: 80, Actual: 95] (line-length)\n"
+        )
+        assert parse_inline_count == 0
+        assert next_line_count == 6
+
+
+def test_markdown_with_inline_token_rule(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that if any enabled rule looks at inline tokens, the inline
+    pass is not skipped.
+    """
+
+    with create_temporary_markdown_file(__SOURCE_CONTENTS) as source_path:
+        # Act
+        std_out, parse_inline_count, next_line_count = __scan_with_rules(
+            scanner_default, "md001,md036", source_path
+        )
+
+        # Assert
+        assert (
+            std_out
+            == f"{source_path}:3:1: MD001: Heading levels should only increment by one level at a time. [Expected: h2; Actual: h3] (heading-increment,header-increment)\n"
+        )
+        assert parse_inline_count == 1
+        assert next_line_count == 0
+
+
+def test_markdown_with_completed_file_rule_and_no_line_rules(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a rule that is informed when the file is completed is
+    still informed, even when the line pass is skipped.
+    """
+
+    with create_temporary_markdown_file("# Heading\n\nSome text\n") as source_path:
+        # Arrange
+        supplied_arguments = [
+            "--set",
+            "plugins.selectively_enable_rules=$!True",
+            "--enable-rules",
+            "md043",
+            "--set",
+            "plugins.md043.headings=## Other",
+            "scan",
+            source_path,
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output=f"{source_path}:1:1: MD043: Required heading structure [Bad heading level: Expected: 2, Actual: 1] (required-headings,required-headers)\n",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
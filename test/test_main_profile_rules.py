@@ -0,0 +1,183 @@
+"""
+Module to provide tests for profiling the time spent in each rule plugin.
+"""
+
+import json
+from test.markdown_scanner import MarkdownScanner
+from test.utils import create_temporary_markdown_file
+from unittest import mock
+
+from pymarkdown.parallel_scan_helper import ParallelScanHelper
+from pymarkdown.plugin_manager.rule_profiler import RuleProfiler
+
+
+def test_markdown_with_profile_rules_table(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that profiling the rules reports the failures as normal,
+    followed by a table of the time spent in each rule plugin.
+    """
+
+    with create_temporary_markdown_file("#  Heading\n") as file_name:
+        # Arrange
+        supplied_arguments = ["--x-profile-rules", "scan", file_name]
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        assert execute_results.return_code == 1
+        assert not execute_results.std_err.getvalue()
+        output_lines = execute_results.std_out.getvalue().split("\n")
+        assert output_lines[0] == (
+            f"{file_name}:1:1: MD019: Multiple spaces are present after hash "
+            + "character on Atx Heading. (no-multiple-space-atx)"
+        )
+        assert output_lines[2].split() == [
+            "ID",
+            "CALLBACK",
+            "CALLS",
+            "TOTAL",
+            "MS",
+            "SLOWEST",
+            "FILE",
+            "FILE",
+            "MS",
+        ]
+        md019_rows = [
+            next_line.split()
+            for next_line in output_lines
+            if "md019" in next_line and "next_token" in next_line
+        ]
+        assert len(md019_rows) == 1
+        assert md019_rows[0][:3] == ["md019", "next_token", "3"]
+        assert md019_rows[0][4] == file_name
+
+
+def test_markdown_with_profile_rules_json(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that profiling the rules as JSON reports each callback of
+    each rule plugin, along with the file that took the longest.
+    """
+
+    with create_temporary_markdown_file(
+        "# Heading\n", file_name_prefix="tmp1"
+    ) as file_name_1, create_temporary_markdown_file(
+        "# Heading\n" + "\nSome text.\n" * 20, file_name_prefix="tmp2"
+    ) as file_name_2:
+        # Arrange
+        supplied_arguments = [
+            "--x-profile-rules-json",
+            "-d",
+            "md024",
+            "scan",
+            file_name_1,
+            file_name_2,
+        ]
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        assert execute_results.return_code == 0
+        assert not execute_results.std_err.getvalue()
+        rule_profiles = json.loads(execute_results.std_out.getvalue())
+        profiles_by_callback = {
+            (next_profile["plugin_id"], next_profile["callback_name"]): next_profile
+            for next_profile in rule_profiles
+        }
+        assert ("md024", "next_token") not in profiles_by_callback
+        assert profiles_by_callback[("md001", "next_token")]["call_count"] == 4
+        assert ("md009", "next_line") not in profiles_by_callback
+        assert profiles_by_callback[("md009", "scan_lines")]["call_count"] == 2
+        assert profiles_by_callback[("md047", "completed_file")]["call_count"] == 2
+        assert [
+            next_profile["total_nanoseconds"] for next_profile in rule_profiles
+        ] == sorted(
+            (next_profile["total_nanoseconds"] for next_profile in rule_profiles),
+            reverse=True,
+        )
+        for next_profile in rule_profiles:
+            assert next_profile["slowest_file"] in (file_name_1, file_name_2)
+            assert (
+                0
+                < next_profile["slowest_file_nanoseconds"]
+                <= next_profile["total_nanoseconds"]
+            )
+
+
+def test_markdown_with_profile_rules_and_jobs(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that profiling the rules scans within the current process,
+    even if multiple jobs are requested, as only that process is profiled.
+    """
+
+    with create_temporary_markdown_file(
+        "# Heading\n", file_name_prefix="tmp1"
+    ) as file_name_1, create_temporary_markdown_file(
+        "# Heading\n", file_name_prefix="tmp2"
+    ) as file_name_2:
+        # Arrange
+        supplied_arguments = [
+            "--x-profile-rules-json",
+            "--jobs",
+            "2",
+            "scan",
+            file_name_1,
+            file_name_2,
+        ]
+
+        # Act
+        with mock.patch.object(
+            ParallelScanHelper, "scan_files", side_effect=AssertionError
+        ):
+            execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        assert execute_results.return_code == 0
+        rule_profiles = json.loads(execute_results.std_out.getvalue())
+        assert {
+            next_profile["call_count"]
+            for next_profile in rule_profiles
+            if next_profile["callback_name"] == "completed_file"
+        } == {2}
+
+
+def test_rule_profiler_keeps_slowest_file() -> None:
+    """
+    Test to make sure that the slowest file is the one with the most time spent
+    in a callback, adding up every call for that file, and that collecting the
+    profiles starts over.
+    """
+
+    # Arrange
+    rule_profiler = RuleProfiler()
+    rule_profiler.start_file("first.md")
+    rule_profiler.record_call("md001", "next_token", 30)
+    rule_profiler.start_file("second.md")
+    rule_profiler.record_call("md001", "next_token", 20)
+    rule_profiler.record_call("md001", "next_token", 20)
+    rule_profiler.record_call("md009", "next_line", 5)
+    rule_profiler.start_file("third.md")
+    rule_profiler.record_call("md001", "next_token", 10)
+
+    # Act
+    rule_profiles = rule_profiler.collect_profiles()
+
+    # Assert
+    assert [
+        (
+            next_profile.plugin_id,
+            next_profile.call_count,
+            next_profile.total_nanoseconds,
+            next_profile.slowest_file,
+            next_profile.slowest_file_nanoseconds,
+        )
+        for next_profile in rule_profiles
+    ] == [("md001", 4, 80, "second.md", 40), ("md009", 1, 5, "second.md", 5)]
+    assert not rule_profiler.collect_profiles()
@@ -0,0 +1,306 @@
+"""
+Module to provide tests for the resident server and its thin client.
+"""
+
+import os
+import shutil
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from test.markdown_scanner import MarkdownScanner
+from test.pytest_execute import ExpectedResults
+from test.utils import create_temporary_markdown_file
+from typing import Generator
+from unittest import mock
+
+import pytest
+
+from pymarkdown.server_client import ServerClient
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported."
+)
+
+
+@contextmanager
+def run_server(*global_arguments: str) -> Generator[str, None, None]:
+    """
+    Start a server in another process, yielding the path of its socket.
+    """
+    socket_directory = tempfile.mkdtemp()
+    socket_path = os.path.join(socket_directory, "pymarkdown.sock")
+    server_process = subprocess.Popen(  # pylint: disable=consider-using-with
+        [
+            sys.executable,
+            "-m",
+            "pymarkdown",
+            *global_arguments,
+            "server",
+            "--socket",
+            socket_path,
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        start_time = time.monotonic()
+        while not os.path.exists(socket_path):
+            assert server_process.poll() is None, "Server stopped unexpectedly."
+            assert time.monotonic() - start_time < 60, "Server did not start."
+            time.sleep(0.05)
+        yield socket_path
+    finally:
+        server_process.terminate()
+        server_process.wait(timeout=60)
+        shutil.rmtree(socket_directory, ignore_errors=True)
+
+
+@pytest.mark.timeout(180)
+def test_markdown_server_matches_local_scan(
+    scanner_default: MarkdownScanner, scanner_main: MarkdownScanner
+) -> None:
+    """
+    Test to make sure that forwarding a scan to the server produces the same
+    output and return code as scanning locally, and that the server can answer
+    more than one request.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md022")
+    local_results = scanner_default.invoke_main(arguments=["scan", source_path])
+    expected_results = ExpectedResults(
+        return_code=local_results.return_code,
+        expected_output=local_results.std_out.getvalue(),
+        expected_error=local_results.std_err.getvalue(),
+    )
+
+    with run_server() as socket_path:
+        supplied_arguments = ["--server-socket", socket_path, "scan", source_path]
+
+        # Act
+        first_results = scanner_main.invoke_main(arguments=supplied_arguments)
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert local_results.std_out.getvalue()
+    first_results.assert_results(expected_results=expected_results)
+    execute_results.assert_results(expected_results=expected_results)
+
+
+@pytest.mark.timeout(180)
+def test_markdown_server_scan_stdin_and_pragma_failure(
+    scanner_main: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that standard input is forwarded to the server, and that
+    pragma failures are reported through standard error.
+    """
+
+    # Arrange
+    with run_server() as socket_path:
+        supplied_arguments = ["--server-socket", socket_path, "scan-stdin"]
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output="""stdin:1:1: MD019: Multiple spaces are present after hash character on Atx Heading. (no-multiple-space-atx)
+""",
+            expected_error="""stdin:2:1: INLINE: Inline configuration command 'bad' not understood.
+""",
+        )
+
+        # Act
+        execute_results = scanner_main.invoke_main(
+            arguments=supplied_arguments,
+            standard_input_to_use="#  Heading\n<!-- pyml bad -->\n",
+        )
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+@pytest.mark.timeout(180)
+def test_markdown_server_fix_stdin(
+    scanner_main: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that standard input is forwarded to the server when fixing
+    it, and that the fixed document is returned through standard output.
+    """
+
+    # Arrange
+    with run_server() as socket_path:
+        supplied_arguments = ["--server-socket", socket_path, "fix-stdin"]
+
+        expected_results = ExpectedResults(
+            return_code=3,
+            expected_output="""# Heading
+
+Some text
+""",
+        )
+
+        # Act
+        execute_results = scanner_main.invoke_main(
+            arguments=supplied_arguments,
+            standard_input_to_use="#  Heading\n\nSome text\n",
+        )
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+@pytest.mark.timeout(180)
+def test_markdown_server_fix_and_changed_configuration(
+    scanner_main: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the server can fix files, and that a request with a
+    different configuration than the server was started with is honored.
+    """
+
+    # Arrange
+    with run_server() as socket_path, create_temporary_markdown_file(
+        "#  Heading\n\nSome\ttext\n"
+    ) as source_path:
+        supplied_arguments = [
+            "--server-socket",
+            socket_path,
+            "--disable-rules",
+            "md010",
+            "fix",
+            source_path,
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=3, expected_output=f"Fixed: {source_path}\n"
+        )
+
+        # Act
+        execute_results = scanner_main.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+        with open(source_path, "rt", encoding="utf-8") as source_file:
+            assert source_file.read() == "# Heading\n\nSome\ttext\n"
+
+
+@pytest.mark.timeout(180)
+def test_markdown_server_request_cannot_start_server(
+    scanner_main: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a request to a server cannot start another server.
+    """
+
+    # Arrange
+    with run_server() as socket_path:
+        supplied_arguments = [
+            "--server-socket",
+            socket_path,
+            "server",
+            "--socket",
+            socket_path + ".other",
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_error="""
+
+A server cannot be started by a request to another server.
+""",
+        )
+
+        # Act
+        execute_results = scanner_main.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+@pytest.mark.timeout(180)
+def test_markdown_server_socket_is_only_accessible_to_owner(
+    scanner_main: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the socket the server listens on can only be read
+    and written by the user that started the server.
+    """
+
+    # Arrange
+    with run_server() as socket_path:
+        supplied_arguments = ["--server-socket", socket_path, "scan", "README.md"]
+
+        # Act
+        execute_results = scanner_main.invoke_main(arguments=supplied_arguments)
+        socket_mode = stat.S_IMODE(os.stat(socket_path).st_mode)
+
+    # Assert
+    assert execute_results.return_code == 0
+    assert socket_mode == stat.S_IRUSR | stat.S_IWUSR
+
+
+def test_markdown_server_not_running(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that forwarding to a server that is not running reports
+    an error.
+    """
+
+    # Arrange
+    socket_path = os.path.join(tempfile.gettempdir(), "does-not-exist.sock")
+    supplied_arguments = ["--server-socket", socket_path, "scan", "README.md"]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 1
+    assert not execute_results.std_out.getvalue()
+    assert execute_results.std_err.getvalue().startswith(
+        f"\n\nUnable to forward request to server at '{socket_path}': "
+    )
+
+
+def test_markdown_server_find_server_socket() -> None:
+    """
+    Test to make sure that the thin client finds the server socket without
+    parsing the rest of the arguments.
+    """
+
+    # Arrange / Act / Assert
+    assert ServerClient.find_server_socket(["scan", "file.md"]) is None
+    assert ServerClient.find_server_socket(["--server-socket", "a.sock", "scan"]) == (
+        "a.sock"
+    )
+    assert ServerClient.find_server_socket(["--server-socket=b.sock", "scan"]) == (
+        "b.sock"
+    )
+    assert ServerClient.find_server_socket(["scan", "--server-socket"]) is None
+
+
+def test_markdown_server_does_not_respond() -> None:
+    """
+    Test to make sure that the thin client stops waiting for a server that
+    accepts the request but never responds to it.
+    """
+
+    # Arrange
+    socket_directory = tempfile.mkdtemp()
+    socket_path = os.path.join(socket_directory, "pymarkdown.sock")
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server_socket:
+            server_socket.bind(socket_path)
+            server_socket.listen(1)
+
+            # Act / Assert
+            with mock.patch.object(
+                ServerClient, "_ServerClient__response_timeout_in_seconds", 0.1
+            ), pytest.raises(socket.timeout):
+                ServerClient.forward_request(socket_path, ["scan", "README.md"], None)
+    finally:
+        shutil.rmtree(socket_directory, ignore_errors=True)
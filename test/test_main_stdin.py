@@ -5,6 +5,7 @@ Module to provide tests related to parsing from stdin.
 import os
 from test.markdown_scanner import MarkdownScanner
 from test.pytest_execute import ExpectedResults
+from unittest import mock
 
 
 def test_markdown_with_scan_stdin_without_triggers(
@@ -85,7 +86,7 @@ def test_markdown_with_scan_stdin_with_triggers_and_disabled_rules(
     execute_results.assert_results(expected_results=expected_results)
 
 
-def test_markdown_with_scan_stdin_with_bad_write(
+def test_markdown_with_scan_stdin_with_bad_read(
     scanner_default: MarkdownScanner,
 ) -> None:
     """
@@ -102,7 +103,163 @@ def test_markdown_with_scan_stdin_with_bad_write(
     expected_results = ExpectedResults(
         return_code=1,
         expected_error="""OSError encountered while scanning 'stdin':
-Temporary file to capture stdin was not written (made up).""",
+Standard input was not read (made up).""",
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(
+        arguments=supplied_arguments, standard_input_to_use=supplied_standard_input
+    )
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_scan_stdin_without_temporary_file(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that standard input is scanned without writing it to disk.
+    """
+
+    # Arrange
+    supplied_arguments = [
+        "scan-stdin",
+    ]
+
+    supplied_standard_input = "# test"
+    expected_results = ExpectedResults(
+        return_code=1,
+        expected_output="""stdin:1:1: MD022: Headings should be surrounded by blank lines. [Expected: 1; Actual: 0; Below] (blanks-around-headings,blanks-around-headers)
+stdin:1:6: MD047: Each file should end with a single newline character. (single-trailing-newline)""",
+    )
+
+    # Act
+    with mock.patch(
+        "tempfile.NamedTemporaryFile",
+        side_effect=AssertionError("Standard input should not be written to disk."),
+    ):
+        execute_results = scanner_default.invoke_main(
+            arguments=supplied_arguments, standard_input_to_use=supplied_standard_input
+        )
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_fix_stdin_with_fixes(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the fixed document is written to standard output.
+    """
+
+    # Arrange
+    supplied_arguments = [
+        "fix-stdin",
+    ]
+
+    supplied_standard_input = "#  test\n\nSome\ttext"
+    expected_results = ExpectedResults(
+        return_code=3,
+        expected_output="""# test
+
+Some    text
+""",
+    )
+
+    # Act
+    with mock.patch(
+        "tempfile.NamedTemporaryFile",
+        side_effect=AssertionError("Standard input should not be written to disk."),
+    ), mock.patch(
+        "tempfile.mkstemp",
+        side_effect=AssertionError("Standard input should not be written to disk."),
+    ):
+        execute_results = scanner_default.invoke_main(
+            arguments=supplied_arguments, standard_input_to_use=supplied_standard_input
+        )
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_fix_stdin_without_fixes(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a document without anything to fix is written to
+    standard output unchanged.
+    """
+
+    # Arrange
+    supplied_arguments = [
+        "fix-stdin",
+    ]
+
+    supplied_standard_input = "# test\n\nSome text\n"
+    expected_results = ExpectedResults(
+        expected_output="""# test
+
+Some text
+""",
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(
+        arguments=supplied_arguments, standard_input_to_use=supplied_standard_input
+    )
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_fix_stdin_with_alternate_presentation() -> None:
+    """
+    Test to make sure that the fixed document is written through the presentation
+    object, so that an alternate presentation can capture it.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner(use_main=False, use_alternate_presentation=True)
+    supplied_arguments = [
+        "fix-stdin",
+    ]
+
+    supplied_standard_input = "#  test\n"
+    expected_results = ExpectedResults(
+        return_code=3,
+        expected_output="""[pst[# test
+]]""",
+    )
+
+    # Act
+    execute_results = scanner.invoke_main(
+        arguments=supplied_arguments, standard_input_to_use=supplied_standard_input
+    )
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_fix_stdin_with_bad_read(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a failure to read standard input is reported.
+    """
+
+    # Arrange
+    supplied_arguments = [
+        "-x-stdin",
+        "fix-stdin",
+    ]
+
+    supplied_standard_input = f"#  test{os.linesep}"
+    expected_results = ExpectedResults(
+        return_code=1,
+        expected_error="""OSError encountered while scanning 'stdin':
+Standard input was not read (made up).""",
     )
 
     # Act
@@ -31,7 +31,7 @@ def test_plugin_scan_context_register_token_fix_no_map() -> None:
         "scan_file",
         [],
         fix_mode=True,
-        file_output=None,
+        line_sink=None,
         fix_token_map=None,
         replace_tokens_list=None,
     )
@@ -56,7 +56,7 @@ def test_plugin_scan_context_register_token_first_one() -> None:
         "scan_file",
         [],
         fix_mode=True,
-        file_output=None,
+        line_sink=None,
         fix_token_map=token_map,
         replace_tokens_list=None,
     )
@@ -87,7 +87,7 @@ def test_plugin_scan_context_register_token_second_one() -> None:
         "scan_file",
         [],
         fix_mode=True,
-        file_output=None,
+        line_sink=None,
         fix_token_map=token_map,
         replace_tokens_list=None,
     )